@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Compare FkPackage and PackageRecord in filter, sort and delta loops.
+
+Usage: python benchmarks/package_records.py [releases count]
+"""
+
+import datetime
+import sys
+import timeit
+from collections.abc import Callable, Sequence
+
+from deltaver._internal.days_delta import DaysDelta
+from deltaver._internal.filtered_package_list import FilteredPackageList
+from deltaver._internal.fk_package import FkPackage
+from deltaver._internal.fk_version_list import FkVersionList
+from deltaver._internal.package import Package
+from deltaver._internal.package_record import PackageRecord
+from deltaver._internal.sorted_package_list import SortedPackageList
+
+
+def releases(count: int) -> list[tuple[str, datetime.date]]:
+    """Synthetic releases in reversed order."""
+    start = datetime.date(2010, 1, 1)
+    return [
+        ('{0}.{1}.{2}'.format(idx // 400, idx // 20 % 20, idx % 20), start + datetime.timedelta(days=idx))
+        for idx in reversed(range(count))
+    ]
+
+
+def scan(packages: Sequence[Package], pinned: str) -> int:
+    """Filter, sort and delta of pinned version."""
+    return DaysDelta(
+        pinned,
+        SortedPackageList(FilteredPackageList(FkVersionList(packages))),
+        datetime.date(2030, 1, 1),
+    ).days()
+
+
+def measure(name: str, package: Callable[[str, datetime.date], Package], count: int) -> None:
+    """Print time of scan."""
+    data = releases(count)
+    packages = [package(version, release_date) for version, release_date in data]
+    pinned = data[len(data) // 2][0]
+    seconds = min(timeit.repeat(lambda: scan(packages, pinned), number=10, repeat=5)) / 10
+    sys.stdout.write('{0:<14} {1:>8} releases: {2:.4f}s per scan\n'.format(name, count, seconds))
+
+
+def main() -> None:
+    """Entrypoint."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    measure('FkPackage', lambda version, release_date: FkPackage('pkg', version, release_date), count)
+    measure('PackageRecord', lambda version, release_date: PackageRecord.ctor('pkg', version, release_date), count)
+
+
+if __name__ == '__main__':
+    main()
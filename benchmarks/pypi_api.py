@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Compare PyPI JSON API and simple repository API backends.
+
+Usage: python benchmarks/pypi_api.py [package ...]
+"""
+
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+import httpx
+
+from deltaver._internal.pooled_client import PooledClient
+from deltaver._internal.pypi_package_list import PypiPackageList
+from deltaver._internal.pypi_simple_package_list import PypiSimplePackageList
+from deltaver._internal.version_list import VersionList
+
+DEFAULT_PACKAGES = ('boto3', 'botocore', 'django', 'numpy', 'httpx', 'smmap')
+
+
+def measure(name: str, backend: Callable[[str, httpx.Client], VersionList], packages: list[str]) -> None:
+    """Print bytes transferred and latency of backend."""
+    downloaded = []
+
+    def count_bytes(response: httpx.Response) -> None:
+        response.read()
+        downloaded.append(response.num_bytes_downloaded)
+
+    latencies = []
+    with PooledClient(30).client() as client:
+        client.event_hooks['response'] = [count_bytes]
+        for package in packages:
+            start = time.perf_counter()
+            backend(package, client).as_list()
+            latencies.append(time.perf_counter() - start)
+    sys.stdout.write('{0:<8} bytes: {1:>12,}  latency median: {2:.3f}s  total: {3:.3f}s\n'.format(
+        name,
+        sum(downloaded),
+        statistics.median(latencies),
+        sum(latencies),
+    ))
+
+
+def main() -> None:
+    """Entrypoint."""
+    packages = sys.argv[1:] or list(DEFAULT_PACKAGES)
+    measure('json', PypiPackageList, packages)
+    measure(
+        'simple',
+        lambda package, client: PypiSimplePackageList(package, client, 'https://pypi.org/simple'),
+        packages,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Compare PEP 440 and semver comparison keys on sort of large version sets.
+
+Usage: python benchmarks/version_keys.py [versions count]
+"""
+
+import random
+import sys
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from packaging import version as packaging_version
+
+from deltaver._internal.parsed_version import _interned
+from deltaver._internal.version_key import VersionKey, _semver
+
+
+def versions(count: int) -> list[str]:
+    """Synthetic semver versions with pre-releases in random order."""
+    generated = []
+    for idx in range(count):
+        release = '{0}.{1}.{2}'.format(idx // 400, idx // 20 % 20, idx % 20)
+        generated.append(release if idx % 4 else '{0}-rc.{1}'.format(release, idx % 7))
+    return random.Random(count).sample(generated, count)
+
+
+def measure(name: str, key: Callable[[str], Any], clear: Callable[[], None], count: int) -> None:
+    """Print time of cold sort."""
+    data = versions(count)
+
+    def run() -> None:
+        clear()
+        sorted(data, key=key)
+
+    seconds = min(timeit.repeat(run, number=1, repeat=5))
+    sys.stdout.write('{0:<14} {1:>8} versions: {2:.4f}s per sort\n'.format(name, count, seconds))
+
+
+def main() -> None:
+    """Entrypoint."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    measure('PEP 440', packaging_version.parse, lambda: None, count)
+    measure('ParsedVersion', _interned, _interned.cache_clear, count)
+    measure('VersionKey', lambda version: VersionKey('npm', version).key(), _semver.cache_clear, count)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,3 +2,16 @@
 # SPDX-License-Identifier: MIT
 
 """Deltaver."""
+
+import logging
+
+from deltaver._internal.config import ScanOptions
+from deltaver._internal.deadline import Deadline
+from deltaver._internal.formats import Formats
+from deltaver._internal.scan_context import ScanContext
+from deltaver._internal.scan_result import ScanResult
+from deltaver.api import ascan, scan
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+__all__ = ['Deadline', 'Formats', 'ScanContext', 'ScanOptions', 'ScanResult', 'ascan', 'scan']
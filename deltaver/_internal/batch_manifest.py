@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Manifest of batch scan."""
+
+import json
+from pathlib import Path
+from typing import final
+
+import attrs
+
+from deltaver._internal.formats import Formats
+
+
+@final
+@attrs.define(frozen=True)
+class BatchManifest:
+    """Manifest of batch scan.
+
+    JSON lines `{"repo": ..., "lockfile": ..., "format": ...}`,
+    lockfile path relative to repository, format "pip-freeze" by default.
+    Blank lines skipped.
+    """
+
+    _manifest_content: str
+
+    def entries(self) -> list[tuple[str, Path, Formats]]:
+        """Entries (repo, lockfile path, format)."""
+        entries = []
+        for line in self._manifest_content.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            file_format = Formats(entry.get('format', Formats.pip_freeze.value))
+            repo = entry['repo']
+            entries.append((repo, Path(repo) / entry['lockfile'], file_format))
+        return entries
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Results of batch scan in JSON lines file."""
+
+import json
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
+from typing import TextIO, final
+
+import attrs
+
+from deltaver._internal.failed_lockfiles import FailedLockfiles
+from deltaver._internal.formats import Formats
+from deltaver._internal.scan_report import ScanReport
+from deltaver._internal.stale_releases import StaleReleases
+
+_Rows = list[tuple[str, str, int]]
+_Lockfiles = AsyncIterator[tuple[Path, _Rows]]
+_Package = dict[str, str | int | None]
+
+
+@final
+@attrs.define(frozen=True)
+class BatchResults:
+    """Results of batch scan in JSON lines file.
+
+    Line written and flushed as soon as lockfile scanned,
+    so results of interrupted batch are not lost.
+    Failed lockfile written with error instead of packages.
+    """
+
+    _output: TextIO
+    _entries: Sequence[tuple[str, Path, Formats]]
+    _stale: StaleReleases
+    _failed: FailedLockfiles = attrs.field(factory=FailedLockfiles.ctor)
+
+    async def written(self, lockfiles: _Lockfiles) -> int:  # noqa: WPS210
+        """Write results of lockfiles, count of written lines."""
+        entries = {path: (repo, file_format) for repo, path, file_format in self._entries}
+        written = 0
+        async for path, rows in lockfiles:
+            repo, file_format = entries[path]
+            self._output.write('{0}\n'.format(json.dumps({
+                'repo': repo,
+                'lockfile': str(path),
+                'format': file_format.value,
+                **self._scanned(path, rows),
+            })))
+            self._output.flush()
+            written += 1
+        return written
+
+    def _scanned(self, path: Path, rows: _Rows) -> dict[str, object]:
+        error = self._failed.error(path)
+        if error is not None:
+            return {'error': error}
+        report = ScanReport.ctor(rows, self._stale)
+        return {
+            'packages': [self._package(*row) for row in rows],
+            'max_delta': report.maximum(),
+            'average_delta': report.average(),
+        }
+
+    def _package(self, name: str, version: str, delta: int) -> _Package:
+        fetched = self._stale.fetched(name)
+        return {
+            'name': name,
+            'version': version,
+            'delta': delta,
+            'stale': None if fetched is None else fetched.isoformat(),
+        }
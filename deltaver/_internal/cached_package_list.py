@@ -10,28 +10,30 @@ import attrs
 from typing_extensions import override
 
 from deltaver._internal.package import Package
+from deltaver._internal.version_index import VersionIndex
 from deltaver._internal.version_list import VersionList
+from deltaver._internal.versions_memo import VersionsMemo
 
 
 @final
-@attrs.define
-# Class for caching
-class CachedPackageList(VersionList):  # noqa: PEO200
-    """Cached packages list."""
+@attrs.define(frozen=True)
+class CachedPackageList(VersionList):
+    """Cached packages list.
 
-    _origin: VersionList
-    _cache_value: Sequence[Package]
-    _cached: bool
+    Version list loaded once per package for all concurrent lookups
+    and memoized with index of its versions.
+    """
 
-    @classmethod
-    def ctor(cls, origin: VersionList) -> VersionList:
-        """Ctor."""
-        return cls(origin, [], cached=False)
+    _origin: VersionList
+    _memo: VersionsMemo
+    _ecosystem: str
+    _registry: str
+    _name: str
 
     @override
     def as_list(self) -> Sequence[Package]:
         """List representation."""
-        if self._cached:
-            return self._cache_value
-        self._cache_value = self._origin.as_list()
-        return self._cache_value
+        return self._memo.loaded(self._ecosystem, self._registry, self._name, self._indexed)
+
+    def _indexed(self) -> Sequence[Package]:
+        return VersionIndex.of(self._origin.as_list())
@@ -4,56 +4,93 @@
 """Cached sorted versions."""
 
 import datetime
-import json
-from collections.abc import Sequence
-from pathlib import Path
+from collections.abc import Iterable, Sequence
+from operator import itemgetter
 from typing import final
 
 import attrs
+import httpx
 from typing_extensions import override
 
-from deltaver._internal.fk_package import FkPackage
+from deltaver._internal.conditional_transport import cache_validators
+from deltaver._internal.exceptions import CircuitOpenError, NotModifiedError
 from deltaver._internal.package import Package
+from deltaver._internal.package_record import PackageRecord
+from deltaver._internal.sqlite_cache import SqliteCache
+from deltaver._internal.stable_key import StableKey
+from deltaver._internal.stale_releases import StaleReleases
 from deltaver._internal.version_list import VersionList
 
 
 @final
 @attrs.define(frozen=True)
 class CachedSortedVersions(VersionList):
-    """Cached sorted versions."""
+    """Cached sorted versions.
+
+    Releases of origin filtered from pre-releases, sorted by version
+    and serialized for cache in one pass.
+    Expired entry revalidated with validators of previous registry response.
+    When registry unavailable expired entry used whatever its age,
+    package marked as stale. With revalidate flag not expired entry
+    revalidated too.
+    """
 
     _origin: VersionList
+    _cache: SqliteCache
+    _ecosystem: str
+    _registry: str
     _package_name: str
+    _stale: StaleReleases = attrs.field(factory=StaleReleases.ctor)
+    _revalidate: bool = attrs.field(default=False, kw_only=True)
 
     @override
-    # TODO: fix
-    def as_list(self) -> Sequence[Package]:  # noqa: WPS210
+    def as_list(self) -> Sequence[Package]:  # noqa: WPS210, WPS231
         """Sorted versions list."""
-        cache_dir = Path('.deltaver_cache')
-        (cache_dir / self._package_name).mkdir(exist_ok=True, parents=True)
-        if cache_dir.exists():
-            for cache_file in cache_dir.glob('**/*.json'):
-                expected_filename = '{0}.json'.format(
-                    datetime.datetime.now(tz=datetime.timezone.utc).strftime('%Y-%m-%d'),
-                )
-                if cache_file.name != expected_filename:
-                    cache_file.unlink()
-        cache_path = cache_dir / self._package_name / '{0}.json'.format(
-            datetime.datetime.now(tz=datetime.timezone.utc).date(),
-        )
-        if cache_path.exists():
-            res = []
-            for package_info in json.loads(cache_path.read_text()):
-                version_num = next(iter(package_info.keys()))
-                release_date = datetime.datetime.strptime(
-                    next(iter(package_info.values())),
-                    '%Y-%m-%dT%H:%M:%S',
-                ).astimezone(datetime.timezone.utc).date()
-                res.append(FkPackage(self._package_name, version_num, release_date))
-            return res
-        origin_val = self._origin.as_list()
-        cache_path.write_text(json.dumps([
-            {str(package.version()): package.release_date().strftime('%Y-%m-%dT%H:%M:%S')}
-            for package in origin_val
-        ]))
-        return origin_val
+        cached = None
+        if not self._revalidate:
+            cached = self._cache.releases(self._ecosystem, self._registry, self._package_name)
+        if cached is not None:
+            return self._packages(cached)
+        stale = self._cache.stale(self._ecosystem, self._registry, self._package_name)
+        validators = stale[1] if stale else {}
+        token = cache_validators.set(validators)
+        try:
+            packages, releases = self._sorted(self._origin.as_list())
+        except NotModifiedError:
+            if stale is None:
+                raise
+            self._cache.refresh(self._ecosystem, self._registry, self._package_name)
+            return self._packages(stale[0])
+        except (httpx.HTTPError, CircuitOpenError):
+            if stale is None:
+                raise
+            return self._stale_packages(stale[0])
+        finally:
+            cache_validators.reset(token)
+        self._cache.save(self._ecosystem, self._registry, self._package_name, releases, validators)
+        return packages
+
+    def _sorted(  # noqa: WPS210, WPS234
+        self,
+        origin: Iterable[Package],
+    ) -> tuple[list[Package], list[tuple[str, datetime.date]]]:
+        packages = []
+        releases = []
+        keyed = ((package.key(), package) for package in origin)
+        for key, package in sorted(keyed, key=itemgetter(0)):
+            if StableKey(key).stable():
+                packages.append(package)
+                releases.append((package.number(), package.release_date()))
+        return packages, releases
+
+    def _stale_packages(self, releases: list[tuple[str, datetime.date]]) -> Sequence[Package]:
+        fetched = self._cache.fetched(self._ecosystem, self._registry, self._package_name)
+        if fetched is not None:
+            self._stale.add(self._package_name, fetched)
+        return self._packages(releases)
+
+    def _packages(self, releases: list[tuple[str, datetime.date]]) -> Sequence[Package]:
+        return [
+            PackageRecord.ctor(self._package_name, version, release_date, self._ecosystem)
+            for version, release_date in releases
+        ]
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Versions list with cached successor of pinned version."""
+
+import datetime
+from collections.abc import Sequence
+from contextlib import suppress
+from itertools import pairwise
+from typing import final
+
+import attrs
+from typing_extensions import override
+
+from deltaver._internal.exceptions import InvalidVersionError
+from deltaver._internal.package import Package
+from deltaver._internal.package_record import PackageRecord
+from deltaver._internal.sqlite_cache import SqliteCache
+from deltaver._internal.version_key import VersionKey
+from deltaver._internal.version_list import VersionList
+
+
+@final
+@attrs.define(frozen=True)
+class CachedSuccessorList(VersionList):
+    """Versions list with cached successor of pinned version.
+
+    Release date of already released successor never changes,
+    so registry requested only for packages pinned at latest version.
+    Release date of pinned package unknown in cached list.
+    """
+
+    _origin: VersionList
+    _cache: SqliteCache
+    _ecosystem: str
+    _registry: str
+    _package_name: str
+    _version: str
+
+    @override
+    def as_list(self) -> Sequence[Package]:
+        """Sorted versions list."""
+        successor = self._cache.successor(self._ecosystem, self._registry, self._package_name, self._version)
+        if successor is not None:
+            return [
+                PackageRecord.ctor(self._package_name, self._version, datetime.date.min, self._ecosystem),
+                PackageRecord.ctor(self._package_name, successor[0], successor[1], self._ecosystem),
+            ]
+        packages = self._origin.as_list()
+        with suppress(InvalidVersionError):
+            target_key = VersionKey(self._ecosystem, self._version).key()
+            for package, next_package in pairwise(packages):
+                if package.key() == target_key:
+                    self._cache.save_successor(
+                        self._ecosystem,
+                        self._registry,
+                        self._package_name,
+                        self._version,
+                        (next_package.number(), next_package.release_date()),
+                    )
+                    break
+        return packages
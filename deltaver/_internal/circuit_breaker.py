@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Circuit breaker per registry host."""
+
+import threading
+import time
+from collections import Counter
+from typing import final
+
+import attrs
+
+from deltaver._internal.exceptions import CircuitOpenError
+
+
+@final
+@attrs.define(frozen=True)
+class CircuitBreaker:
+    """Circuit breaker per registry host.
+
+    After `threshold` consecutive failures host is open for `cooldown` seconds,
+    requests to it fail fast. Then one failure opens host again,
+    one success closes it.
+    """
+
+    _failures: Counter[str]
+    _opened_until: dict[str, float]
+    _lock: threading.Lock
+    _threshold: int
+    _cooldown: float
+
+    @classmethod
+    def ctor(cls, threshold: int = 5, cooldown: float = 30) -> 'CircuitBreaker':
+        """Ctor."""
+        return cls(Counter(), {}, threading.Lock(), threshold, cooldown)
+
+    def check(self, host: str) -> None:
+        """Raise `CircuitOpenError` for open host."""
+        with self._lock:
+            opened_until = self._opened_until.get(host, 0)
+        if time.monotonic() < opened_until:
+            raise CircuitOpenError(host)
+
+    def opened(self, host: str) -> bool:
+        """Host failed threshold times in row."""
+        with self._lock:
+            return host in self._opened_until
+
+    def succeeded(self, host: str) -> None:
+        """Close host."""
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_until.pop(host, None)
+
+    def failed(self, host: str) -> None:
+        """Count failure of host, open it on threshold."""
+        with self._lock:
+            self._failures[host] += 1
+            if self._failures[host] >= self._threshold:
+                self._opened_until[host] = time.monotonic() + self._cooldown
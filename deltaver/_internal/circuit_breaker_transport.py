@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Transport with circuit breaker per registry host."""
+
+from typing import final
+
+import attrs
+import httpx
+from typing_extensions import override
+
+from deltaver._internal.circuit_breaker import CircuitBreaker
+
+
+@final
+@attrs.define(frozen=True)
+class CircuitBreakerTransport(httpx.BaseTransport):
+    """Transport with circuit breaker per registry host.
+
+    Transport errors and server errors counted as failures of host.
+    """
+
+    _origin: httpx.BaseTransport
+    _breaker: CircuitBreaker
+
+    @override
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send request."""
+        host = request.url.host
+        self._breaker.check(host)
+        try:
+            response = self._origin.handle_request(request)
+        except httpx.TransportError:
+            self._breaker.failed(host)
+            raise
+        if response.status_code >= httpx.codes.INTERNAL_SERVER_ERROR:
+            self._breaker.failed(host)
+        else:
+            self._breaker.succeeded(host)
+        return response
+
+    @override
+    def close(self) -> None:
+        """Close transport."""
+        self._origin.close()
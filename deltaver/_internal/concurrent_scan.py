@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Concurrent scan of dependencies."""
+
+import asyncio
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import final
+
+import attrs
+import httpx
+
+from deltaver._internal.deadline import Deadline
+from deltaver._internal.delta import Delta
+from deltaver._internal.exceptions import CircuitOpenError
+from deltaver._internal.host_limits import HostLimits
+
+
+@final
+@attrs.define(frozen=True)
+class ConcurrentScan:
+    """Concurrent scan of dependencies.
+
+    Every dependency runs the whole synchronous version list chain
+    in a worker thread, the number of simultaneous lookups
+    is bounded by registry host limit. Lookups started in order of dependencies.
+    With fail on max threshold scan stops on first delta reached it
+    and cancels deadline, so waiting and queued lookups cancelled,
+    requests in flight aborted and scans sharing deadline stopped.
+    Dependencies not resolved before deadline, because of open circuit
+    of registry host or failed registry request without cached releases
+    reported with delta -1.
+    """
+
+    _dependencies: Sequence[tuple[str, str]]
+    _delta: Callable[[str, str], Delta]
+    _host: str
+    _limits: HostLimits
+    _fail_on_max: int = -1
+    _deadline: Deadline = attrs.field(factory=Deadline.ctor)
+
+    async def stream(self) -> AsyncIterator[tuple[str, str, int]]:  # noqa: WPS210, WPS231
+        """Rows (name, version, delta) in order of completion."""
+        if not self._dependencies:
+            return
+        limit = self._limits.limit(self._host)
+        semaphore = asyncio.Semaphore(limit)
+        executor = ThreadPoolExecutor(max_workers=limit, thread_name_prefix='deltaver')
+        tasks = [
+            asyncio.ensure_future(self._row(semaphore, executor, name, version))
+            for name, version in self._dependencies
+        ]
+        unresolved = Counter(self._dependencies)
+        try:  # noqa: WPS501
+            for next_done in asyncio.as_completed(tasks, timeout=self._deadline.remaining()):
+                row = await next_done  # noqa: WPS476
+                if self._deadline.cancelled():
+                    return
+                unresolved[row[0], row[1]] -= 1
+                breached = self._breached(row[2])
+                yield row
+                if breached:
+                    return
+        except asyncio.TimeoutError:
+            for name, version in unresolved.elements():
+                yield name, version, -1
+        finally:
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stopped(self) -> bool:
+        """Scan stopped by fail fast of scan sharing deadline."""
+        return self._deadline.cancelled()
+
+    async def rows(self) -> list[tuple[str, str, int]]:
+        """Rows (name, version, delta) in order of completion."""
+        return [row async for row in self.stream()]
+
+    def _breached(self, delta: int) -> bool:
+        if -1 < self._fail_on_max <= delta:
+            self._deadline.cancel()
+            return True
+        return False
+
+    async def _row(
+        self,
+        semaphore: asyncio.Semaphore,
+        executor: ThreadPoolExecutor,
+        name: str,
+        version: str,
+    ) -> tuple[str, str, int]:
+        async with semaphore:
+            try:
+                delta = await asyncio.get_running_loop().run_in_executor(
+                    executor,
+                    self._delta(name, version).days,
+                )
+            except (CircuitOpenError, httpx.HTTPError):
+                delta = -1
+            except Exception:
+                if not self._deadline.expired():
+                    raise
+                delta = -1
+        return name, version, delta
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Transport with conditional requests."""
+
+from contextvars import ContextVar
+from typing import final
+
+import attrs
+import httpx
+from typing_extensions import override
+
+from deltaver._internal.exceptions import NotModifiedError
+
+cache_validators: ContextVar[dict[str, str]] = ContextVar('cache_validators')
+
+_VALIDATOR_HEADERS = ('etag', 'last-modified', 'x-pypi-last-serial')
+
+
+@final
+@attrs.define(frozen=True)
+class ConditionalTransport(httpx.BaseTransport):
+    """Transport with conditional requests.
+
+    Validators of cached document are taken from `cache_validators`
+    context variable and replaced with validators of response.
+    Not modified document raises `NotModifiedError`.
+    """
+
+    _origin: httpx.BaseTransport
+
+    @override
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send request."""
+        validators = cache_validators.get(None)
+        if validators is None:
+            return self._origin.handle_request(request)
+        etag = validators.get('etag')
+        if etag:
+            request.headers['If-None-Match'] = etag
+        last_modified = validators.get('last-modified')
+        if last_modified:
+            request.headers['If-Modified-Since'] = last_modified
+        response = self._origin.handle_request(request)
+        if self._not_modified(response, validators):
+            response.close()
+            raise NotModifiedError
+        validators.clear()
+        validators.update({
+            header: response.headers[header]
+            for header in _VALIDATOR_HEADERS
+            if header in response.headers
+        })
+        return response
+
+    @override
+    def close(self) -> None:
+        """Close transport."""
+        self._origin.close()
+
+    def _not_modified(self, response: httpx.Response, validators: dict[str, str]) -> bool:
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return True
+        serial = response.headers.get('x-pypi-last-serial')
+        return response.is_success and serial is not None and serial == validators.get('x-pypi-last-serial')
@@ -20,6 +20,9 @@ class CliInputConfig(TypedDict):
     excluded: list[str]
     fail_on_avg: int | None
     fail_on_max: int | None
+    fail_fast: bool
+    lagging_first: bool
+    deadline: float | None
 
 
 @final
@@ -31,6 +34,30 @@ class PyprojectConfig(TypedDict):
     excluded: list[str]
     fail_on_avg: int | None
     fail_on_max: int | None
+    concurrency: dict[str, int]
+    timeout: float | None
+    golang_resolution: str | None
+    cache_ttl: int | None
+    pypi_api: str | None
+    index_url: str | None
+    fail_fast: bool | None
+    lagging_first: bool | None
+    deadline: float | None
+
+
+@final
+class ScanOptions(TypedDict, total=False):
+    """Options of dependencies scan."""
+
+    concurrency: dict[str, int]
+    golang_resolution: str
+    cache_ttl: int
+    pypi_api: str
+    index_url: str
+    fail_on_max: int
+    fail_fast: bool
+    lagging_first: bool
+    revalidate: bool
 
 
 @final
@@ -42,3 +69,12 @@ class Config(TypedDict):
     excluded: list[str]
     fail_on_avg: int
     fail_on_max: int
+    concurrency: dict[str, int]
+    timeout: float
+    golang_resolution: str
+    cache_ttl: int
+    pypi_api: str
+    index_url: str
+    fail_fast: bool
+    lagging_first: bool
+    deadline: float
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Package with already fetched release date."""
+
+import datetime
+from typing import Any, final
+
+import attrs
+from packaging.version import Version
+from typing_extensions import override
+
+from deltaver._internal.package import Package
+
+
+@final
+@attrs.define(frozen=True)
+class DatedPackage(Package):
+    """Package with already fetched release date."""
+
+    _origin: Package
+    _release_date: datetime.date
+
+    @classmethod
+    def ctor(cls, origin: Package) -> 'DatedPackage':
+        """Ctor."""
+        return cls(origin, origin.release_date())
+
+    @override
+    def version(self) -> Version:
+        """Version."""
+        return self._origin.version()
+
+    @override
+    def key(self) -> tuple[Any, ...]:
+        """Comparison key of version by ecosystem rules."""
+        return self._origin.key()
+
+    @override
+    def number(self) -> str:
+        """Version as published by registry."""
+        return self._origin.number()
+
+    @override
+    def name(self) -> str:
+        """Name."""
+        return self._origin.name()
+
+    @override
+    def release_date(self) -> datetime.date:
+        """Release date."""
+        return self._release_date
@@ -4,15 +4,16 @@
 """Days delta."""
 
 import datetime
+import logging
 from typing import final
 
 import attrs
-from rich import print as rich_print
 from typing_extensions import override
 
 from deltaver._internal.delta import Delta
 from deltaver._internal.exceptions import InvalidVersionError
-from deltaver._internal.parsed_version import ParsedVersion
+from deltaver._internal.version_index import VersionIndex
+from deltaver._internal.version_key import VersionKey
 from deltaver._internal.version_list import VersionList
 
 
@@ -24,23 +25,17 @@ class DaysDelta(Delta):
     _version: str
     _packages: VersionList
     _today: datetime.date
+    _ecosystem: str = 'pypi'
 
     @override
     def days(self) -> int:
         """Days of delta."""
-        flag = False
-        next_version_release_date = datetime.date.min
         try:
-            target_version = ParsedVersion(self._version).parse()
+            target_key = VersionKey(self._ecosystem, self._version).key()
         except InvalidVersionError:
-            rich_print(f'[yellow]Version {self._version} can not been parsed')
+            logging.getLogger(__name__).warning('Version %s can not been parsed', self._version)
             return 0
-        for package in self._packages.as_list():
-            if flag:
-                next_version_release_date = package.release_date()
-                break
-            if package.version() == target_version:
-                flag = True
-        else:
+        successor = VersionIndex.of(self._packages.as_list()).successor(target_key)
+        if successor is None:
             return 0
-        return (self._today - next_version_release_date).days
+        return (self._today - successor.release_date()).days
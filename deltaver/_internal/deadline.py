@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Time budget of scan."""
+
+import math
+import threading
+import time
+from typing import final
+
+import attrs
+
+
+@final
+@attrs.define(frozen=True)
+class Deadline:
+    """Time budget of scan.
+
+    Moment of expiration measured by monotonic clock.
+    Cancelled budget exhausted at once for all threads sharing it.
+    """
+
+    _expires_at: float
+    _cancelled: threading.Event
+
+    @classmethod
+    def ctor(cls, seconds: float | None = None) -> 'Deadline':
+        """Ctor, without seconds budget is unbounded."""
+        if seconds is None:
+            return cls(math.inf, threading.Event())
+        return cls(time.monotonic() + seconds, threading.Event())
+
+    def remaining(self) -> float | None:
+        """Seconds left, None for unbounded budget."""
+        if self._cancelled.is_set():
+            return 0
+        if math.isinf(self._expires_at):
+            return None
+        return max(self._expires_at - time.monotonic(), 0)
+
+    def cancel(self) -> None:
+        """Exhaust budget, requests and lookups in flight stop."""
+        self._cancelled.set()
+
+    def cancelled(self) -> bool:
+        """Budget exhausted by cancel."""
+        return self._cancelled.is_set()
+
+    def expired(self) -> bool:
+        """Budget exhausted."""
+        return self.remaining() == 0
@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Response body read until deadline."""
+
+from collections.abc import Iterator
+from typing import final
+
+import attrs
+import httpx
+from typing_extensions import override
+
+from deltaver._internal.deadline import Deadline
+from deltaver._internal.exceptions import DeadlineExceededError
+
+
+@final
+@attrs.define(frozen=True)
+class DeadlineStream(httpx.SyncByteStream):
+    """Response body read until deadline.
+
+    Download of large registry document aborted between chunks
+    when budget of scan exhausted or cancelled.
+    """
+
+    _origin: httpx.SyncByteStream
+    _deadline: Deadline
+    _url: str
+
+    @override
+    def __iter__(self) -> Iterator[bytes]:
+        """Chunks of body."""
+        for chunk in self._origin:
+            if self._deadline.expired():
+                raise DeadlineExceededError(self._url)
+            yield chunk
+
+    @override
+    def close(self) -> None:
+        """Close body."""
+        self._origin.close()
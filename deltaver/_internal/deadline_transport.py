@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Transport with timeouts bounded by deadline."""
+
+from typing import final
+
+import attrs
+import httpx
+from typing_extensions import override
+
+from deltaver._internal.deadline import Deadline
+from deltaver._internal.deadline_stream import DeadlineStream
+from deltaver._internal.exceptions import DeadlineExceededError
+
+
+@final
+@attrs.define(frozen=True)
+class DeadlineTransport(httpx.BaseTransport):
+    """Transport with timeouts bounded by deadline.
+
+    Every timeout of request shrinks to remaining budget of scan,
+    requests after deadline raise `DeadlineExceededError` without sending
+    and reading of response body stops at deadline.
+    """
+
+    _origin: httpx.BaseTransport
+    _deadline: Deadline
+
+    @override
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send request."""
+        remaining = self._deadline.remaining()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceededError(str(request.url))
+        if remaining is not None:
+            request.extensions['timeout'] = {
+                phase: remaining if timeout is None else min(timeout, remaining)
+                for phase, timeout in request.extensions.get('timeout', {}).items()
+            }
+        response = self._origin.handle_request(request)
+        if isinstance(response.stream, httpx.SyncByteStream):
+            response.stream = DeadlineStream(response.stream, self._deadline, str(request.url))
+        return response
+
+    @override
+    def close(self) -> None:
+        """Close transport."""
+        self._origin.close()
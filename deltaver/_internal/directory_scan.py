@@ -0,0 +1,197 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Scan of many lockfiles in one fetch pass."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+from typing import final
+
+import attrs
+import httpx
+
+from deltaver._internal.concurrent_scan import ConcurrentScan
+from deltaver._internal.config import ScanOptions
+from deltaver._internal.delta import Delta
+from deltaver._internal.failed_lockfiles import FailedLockfiles
+from deltaver._internal.failsafe_delta import FailsafeDelta
+from deltaver._internal.formats import Formats
+from deltaver._internal.host_limits import HostLimits
+from deltaver._internal.lagging_first_reqs import LaggingFirstReqs
+from deltaver._internal.merged_scans import MergedScans
+from deltaver._internal.normalized_name import NormalizedName
+from deltaver._internal.pending_lockfiles import PendingLockfiles
+from deltaver._internal.registry_deltas import RegistryDeltas
+from deltaver._internal.safe_lockfile_reqs import SafeLockfileReqs
+from deltaver._internal.scan_context import ScanContext
+from deltaver._internal.sqlite_cache import SqliteCache
+
+_Key = tuple[str, str, str]
+_Rows = list[tuple[str, str, int]]
+_Reqs = list[tuple[str, str]]
+_Parsed = tuple[Path, RegistryDeltas, _Reqs]
+
+
+@final
+@attrs.define(frozen=True)
+class DirectoryScan:  # noqa: WPS214
+    """Scan of many lockfiles in one fetch pass.
+
+    Lockfiles parsed in chunks by worker processes, since parsing
+    holds the GIL. Lookups of same package version deduplicated
+    across files by normalized name
+    and registries of all ecosystems scanned concurrently.
+    Lockfile completed as soon as all its dependencies resolved.
+    Rows of every file ordered by delta like in scan of one file.
+    Lockfile failed to read or parse marked in failed lockfiles
+    and completed without rows, failed lookup reported as delta -1.
+    With lagging first option lookups of all lockfiles ordered
+    by delta of previous run and deltas of run saved to cache.
+    """
+
+    _lockfiles: Sequence[tuple[Path, Formats]]
+    _excluded: list[str]
+    _options: ScanOptions
+    _client: httpx.Client
+    _context: ScanContext = attrs.field(factory=ScanContext)
+    _failed: FailedLockfiles = attrs.field(factory=FailedLockfiles.ctor)
+    _parse_pool: Callable[[], Executor] = ProcessPoolExecutor
+
+    def files(self) -> list[tuple[Path, _Rows]]:
+        """Rows (name, version, delta) of every lockfile in order of lockfiles."""
+        position = {lockfile[0]: idx for idx, lockfile in enumerate(self._lockfiles)}
+        return sorted(
+            asyncio.run(self._collected()),
+            key=lambda lockfile: position[lockfile[0]],
+        )
+
+    async def stream(self) -> AsyncIterator[tuple[Path, _Rows]]:  # noqa: WPS210
+        """Rows (name, version, delta) of lockfiles in order of completion."""
+        with ExitStack() as stack:
+            cache = self._context.cache(stack, self._options)
+            parsed = self._parsed(cache)
+            pending = PendingLockfiles.ctor([
+                {self._key(deltas.ecosystem(), *req) for req in reqs}
+                for _, deltas, reqs in parsed
+            ])
+            days: dict[_Key, int] = {}
+            for idx in pending.empty():
+                yield self._rows(parsed[idx], days)
+            registries, scans = self._scans(parsed, cache)
+            async for scan_idx, (name, version, delta) in MergedScans(scans).stream():
+                key = self._key(registries[scan_idx].ecosystem(), name, version)
+                days[key] = delta
+                for completed in pending.resolved(key):
+                    yield self._rows(parsed[completed], days)
+            for idx in pending.rest():
+                yield self._rows(parsed[idx], days)
+            self._save_lags(cache, registries, days)
+
+    async def rows(self) -> AsyncIterator[tuple[str, str, int]]:  # noqa: WPS210
+        """Distinct rows (name, version, delta) of all lockfiles in order of completion."""
+        with ExitStack() as stack:
+            cache = self._context.cache(stack, self._options)
+            registries, scans = self._scans(self._parsed(cache), cache)
+            days: dict[_Key, int] = {}
+            lagging_first = self._options.get('lagging_first', False)
+            async for scan_idx, (name, version, delta) in MergedScans(scans).stream():
+                if lagging_first:
+                    key = self._key(registries[scan_idx].ecosystem(), name, version)
+                    days[key] = delta
+                yield name, version, delta
+            self._save_lags(cache, registries, days)
+
+    async def _collected(self) -> list[tuple[Path, _Rows]]:
+        return [lockfile async for lockfile in self.stream()]
+
+    def _parsed(self, cache: SqliteCache) -> list[_Parsed]:  # noqa: WPS210
+        registries = [
+            RegistryDeltas.ctor(
+                Formats.pip_freeze if file_format == Formats.default else file_format,
+                self._client,
+                cache,
+                self._options,
+                self._context,
+            )
+            for _, file_format in self._lockfiles
+        ]
+        parsers = [
+            SafeLockfileReqs(path, file_format, self._excluded, deltas.ecosystem())
+            for (path, file_format), deltas in zip(self._lockfiles, registries, strict=True)
+        ]
+        with self._parse_pool() as executor:
+            parsed = list(executor.map(SafeLockfileReqs.parsed, parsers, chunksize=16))  # noqa: WPS432
+        paths = [path for path, _ in self._lockfiles]
+        for lockfile_path, (_, error) in zip(paths, parsed, strict=True):
+            if error is not None:
+                self._failed.add(lockfile_path, error)
+        reqs = [lockfile_reqs for lockfile_reqs, _ in parsed]
+        return list(zip(paths, registries, reqs, strict=True))
+
+    def _scans(  # noqa: WPS210
+        self,
+        parsed: list[_Parsed],
+        cache: SqliteCache,
+    ) -> tuple[list[RegistryDeltas], list[ConcurrentScan]]:
+        registries = {deltas.ecosystem(): deltas for _, deltas, _ in reversed(parsed)}
+        lookups: dict[_Key, tuple[str, str]] = {}
+        for _, deltas, reqs in parsed:
+            for dependency in reqs:
+                lookups.setdefault(self._key(deltas.ecosystem(), *dependency), dependency)
+        fail_on_max = -1
+        if self._options.get('fail_fast', False):
+            fail_on_max = self._options.get('fail_on_max', -1)
+        scans = [
+            ConcurrentScan(
+                self._scheduled(
+                    [lookup for key, lookup in lookups.items() if key[0] == ecosystem],
+                    registry,
+                    cache,
+                ),
+                partial(self._delta, registry),
+                registry.host(),
+                HostLimits.ctor(self._options.get('concurrency')),
+                fail_on_max,
+                self._context.deadline(),
+            )
+            for ecosystem, registry in registries.items()
+        ]
+        return list(registries.values()), scans
+
+    def _scheduled(self, lookups: _Reqs, registry: RegistryDeltas, cache: SqliteCache) -> _Reqs:
+        if not self._options.get('lagging_first', False):
+            return lookups
+        return LaggingFirstReqs(
+            lookups,
+            cache.lags(registry.ecosystem(), registry.registry()),
+            registry.ecosystem(),
+        ).reqs()
+
+    def _save_lags(self, cache: SqliteCache, registries: list[RegistryDeltas], days: dict[_Key, int]) -> None:
+        if not self._options.get('lagging_first', False):
+            return
+        for registry in registries:
+            lags: dict[str, int] = {}
+            for (ecosystem, name, _), delta in days.items():
+                if ecosystem == registry.ecosystem():
+                    lags[name] = max(lags.get(name, 0), delta)
+            cache.save_lags(registry.ecosystem(), registry.registry(), lags)
+
+    def _rows(self, lockfile: _Parsed, days: dict[_Key, int]) -> tuple[Path, _Rows]:  # noqa: WPS210
+        path, deltas, reqs = lockfile
+        rows = []
+        for name, version in reqs:
+            delta = days.get(self._key(deltas.ecosystem(), name, version))
+            if delta is not None:
+                rows.append((name, version, delta))
+        return path, sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def _delta(self, registry: RegistryDeltas, name: str, version: str) -> Delta:
+        return FailsafeDelta(registry.delta(name, version), name, version)
+
+    def _key(self, ecosystem: str, name: str, version: str) -> _Key:
+        return ecosystem, str(NormalizedName(ecosystem, name)), version
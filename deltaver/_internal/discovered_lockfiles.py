@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Lockfiles of directory tree."""
+
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import final
+
+import attrs
+
+from deltaver._internal.formats import Formats
+
+_SKIPPED_DIRS = frozenset((
+    '.git',
+    '.hg',
+    '.tox',
+    '.venv',
+    'venv',
+    '.deltaver_cache',
+    '__pycache__',
+    'node_modules',
+    'vendor',
+    'deps',
+    '_build',
+))
+
+
+@final
+@attrs.define(frozen=True)
+class DiscoveredLockfiles:
+    """Lockfiles of directory tree.
+
+    Format detected by file name. Installed dependencies, build
+    and VCS directories not walked.
+    """
+
+    _root: Path
+
+    def files(self) -> list[tuple[Path, Formats]]:
+        """Lockfiles with formats in path order."""
+        return self._walked(self._root)
+
+    def _walked(self, directory: Path) -> list[tuple[Path, Formats]]:
+        lockfiles = []
+        for path in sorted(directory.iterdir()):
+            if path.is_dir() and not path.is_symlink() and path.name not in _SKIPPED_DIRS:
+                lockfiles.extend(self._walked(path))
+                continue
+            file_format = self._format(path.name)
+            if file_format is not None and path.is_file():
+                lockfiles.append((path, file_format))
+        return lockfiles
+
+    def _format(self, filename: str) -> Formats | None:
+        if fnmatch(filename, 'requirements*.txt'):
+            return Formats.pip_freeze
+        return {
+            'poetry.lock': Formats.poetry_lock,
+            'package-lock.json': Formats.npm_lock,
+            'go.sum': Formats.golang,
+            'mix.lock': Formats.mix_lock,
+        }.get(filename)
@@ -29,3 +29,18 @@ class InvalidVersionError(Exception):
 @final
 class ThresholdReachedError(Exception):
     """Threshold Reached Error."""
+
+
+@final
+class NotModifiedError(Exception):
+    """Registry document not modified since cached."""
+
+
+@final
+class DeadlineExceededError(Exception):
+    """Time budget of scan exhausted."""
+
+
+@final
+class CircuitOpenError(Exception):
+    """Registry host failed repeatedly, requests to it are not sent."""
@@ -8,23 +8,31 @@ from typing import final
 import attrs
 from typing_extensions import override
 
+from deltaver._internal.normalized_name import NormalizedName
 from deltaver._internal.parsed_reqs import ParsedReqs
 
 
 @final
 @attrs.define(frozen=True)
 class ExcludedReqs(ParsedReqs):
-    """Filter decorator for requirements."""
+    """Filter decorator for requirements.
+
+    Names compared case-insensitive after normalization by ecosystem rules.
+    """
 
     _origin: ParsedReqs
     _excluded_reqs: list[str]
+    _ecosystem: str = 'pypi'
 
     @override
     def reqs(self) -> list[tuple[str, str]]:
         """Filtered requirements."""
-        excluded_packages_set = {package.lower() for package in self._excluded_reqs}
+        excluded_packages_set = {self._normalized(package) for package in self._excluded_reqs}
         return [
             package
             for package in self._origin.reqs()
-            if package[0].lower() not in excluded_packages_set
+            if self._normalized(package[0]) not in excluded_packages_set
         ]
+
+    def _normalized(self, name: str) -> str:
+        return str(NormalizedName(self._ecosystem, name.lower()))
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Lockfiles not scanned because of error."""
+
+import threading
+from pathlib import Path
+from typing import final
+
+import attrs
+
+
+@final
+@attrs.define(frozen=True)
+class FailedLockfiles:
+    """Lockfiles not scanned because of error.
+
+    Lockfile was missing or can not be parsed,
+    other lockfiles of scan not affected.
+    """
+
+    _errors: dict[Path, str]
+    _lock: threading.Lock
+
+    @classmethod
+    def ctor(cls) -> 'FailedLockfiles':
+        """Ctor."""
+        return cls({}, threading.Lock())
+
+    def add(self, path: Path, error: str) -> None:
+        """Mark lockfile failed with error."""
+        with self._lock:
+            self._errors[path] = error
+
+    def error(self, path: Path) -> str | None:
+        """Error of lockfile, None for scanned lockfile."""
+        with self._lock:
+            return self._errors.get(path)
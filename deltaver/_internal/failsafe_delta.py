@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Delta unresolved instead of failed."""
+
+import logging
+from typing import final
+
+import attrs
+from typing_extensions import override
+
+from deltaver._internal.delta import Delta
+
+
+@final
+@attrs.define(frozen=True)
+class FailsafeDelta(Delta):
+    """Delta unresolved instead of failed.
+
+    Error of one lookup logged and reported as delta -1,
+    so other lookups of scan not lost.
+    """
+
+    _origin: Delta
+    _name: str
+    _version: str
+
+    @override
+    def days(self) -> int:
+        """Days of delta, -1 on error."""
+        try:
+            return self._origin.days()
+        except Exception:
+            logging.getLogger(__name__).warning(
+                'Lookup of %s %s failed',
+                self._name,
+                self._version,
+                exc_info=True,
+            )
+            return -1
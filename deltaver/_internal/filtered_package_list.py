@@ -3,7 +3,6 @@
 
 """Filtered packages list."""
 
-import string
 from collections.abc import Sequence
 from typing import final
 
@@ -11,6 +10,7 @@ import attrs
 from typing_extensions import override
 
 from deltaver._internal.package import Package
+from deltaver._internal.stable_key import StableKey
 from deltaver._internal.version_list import VersionList
 
 
@@ -24,9 +24,8 @@ class FilteredPackageList(VersionList):
     @override
     def as_list(self) -> Sequence[Package]:
         """List representation."""
-        packages = []
-        for package in self._origin.as_list():
-            if set(string.ascii_letters).intersection(str(package.version())):
-                continue
-            packages.append(package)
-        return packages
+        return [
+            package
+            for package in self._origin.as_list()
+            if StableKey(package.key()).stable()
+        ]
@@ -4,7 +4,7 @@
 """Fake package."""
 
 import datetime
-from typing import final
+from typing import Any, final
 
 import attrs
 from packaging.version import Version
@@ -12,6 +12,7 @@ from typing_extensions import override
 
 from deltaver._internal.package import Package
 from deltaver._internal.parsed_version import ParsedVersion
+from deltaver._internal.version_key import VersionKey
 
 
 @final
@@ -22,12 +23,23 @@ class FkPackage(Package):
     _name: str
     _version: str
     _release_date: datetime.date
+    _ecosystem: str = 'pypi'
 
     @override
     def version(self) -> Version:
         """Version."""
         return ParsedVersion(self._version).parse()
 
+    @override
+    def key(self) -> tuple[Any, ...]:
+        """Comparison key of version by ecosystem rules."""
+        return VersionKey(self._ecosystem, self._version).key()
+
+    @override
+    def number(self) -> str:
+        """Version as published by registry."""
+        return self._version
+
     @override
     def name(self) -> str:
         """Name."""
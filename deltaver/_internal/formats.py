@@ -16,3 +16,14 @@ class Formats(Enum):
     mix_lock = 'mix-lock'
 
     default = 'default'
+
+    def ecosystem(self) -> str:
+        """Registry ecosystem of format."""
+        return {
+            Formats.npm_lock: 'npm',
+            Formats.pip_freeze: 'pypi',
+            Formats.poetry_lock: 'pypi',
+            Formats.golang: 'golang',
+            Formats.mix_lock: 'hex',
+            Formats.default: 'pypi',
+        }[self]
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Golang package."""
+
+import datetime
+from typing import Any, final
+
+import attrs
+import httpx
+from packaging.version import Version
+from typing_extensions import override
+
+from deltaver._internal.exceptions import VersionNotFoundError
+from deltaver._internal.golang_pseudo_version import GolangPseudoVersion
+from deltaver._internal.normalized_name import NormalizedName
+from deltaver._internal.package import Package
+from deltaver._internal.parsed_version import ParsedVersion
+from deltaver._internal.version_key import VersionKey
+
+
+@final
+@attrs.define(frozen=True)
+class GolangPackage(Package):
+    """Golang package with release date from module proxy."""
+
+    _name: str
+    _version: str
+    _client: httpx.Client
+
+    @override
+    def version(self) -> Version:
+        """Version."""
+        return ParsedVersion(self._version).parse()
+
+    @override
+    def key(self) -> tuple[Any, ...]:
+        """Comparison key of version by ecosystem rules."""
+        return VersionKey('golang', self._version).key()
+
+    @override
+    def number(self) -> str:
+        """Version as published by registry."""
+        return self._version
+
+    @override
+    def name(self) -> str:
+        """Name."""
+        return self._name
+
+    @override
+    def release_date(self) -> datetime.date:
+        """Release date."""
+        if GolangPseudoVersion(self._version).valid():
+            return GolangPseudoVersion(self._version).release_date()
+        response = self._client.get(
+            'https://proxy.golang.org/{0}/@v/{1}.info'.format(NormalizedName('golang', self._name), self._version),
+        )
+        if response.status_code == httpx.codes.NOT_FOUND:
+            # Request to get the list of versions for the module:
+            # https://proxy.golang.org/github.com/russross/blackfriday/v2/@v/list
+            # Response:
+            # v2.0.0
+            # v2.1.0-pre.1
+            # v2.1.0
+            # v2.0.1
+            #
+            # However, attempting to request information for a specific version, such as:
+            # https://proxy.golang.org/github.com/russross/blackfriday/v2/@v/v2.0.0.info
+            # will result in a 404 error (page not found).
+            raise VersionNotFoundError(self._version)
+        response.raise_for_status()
+        return (
+            datetime.datetime
+            .strptime(
+                response.json()['Time'],
+                '%Y-%m-%dT%H:%M:%S%z',
+            )
+            .date()
+        )
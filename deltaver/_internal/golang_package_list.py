@@ -3,18 +3,21 @@
 
 """Golang package list."""
 
-import asyncio
-import datetime
+import threading
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import final
 
 import attrs
 import httpx
 from typing_extensions import override
 
-from deltaver._internal.fk_package import FkPackage
+from deltaver._internal.exceptions import VersionNotFoundError
+from deltaver._internal.golang_package import GolangPackage
+from deltaver._internal.normalized_name import NormalizedName
 from deltaver._internal.package import Package
-from deltaver._internal.parsed_version import ParsedVersion
+from deltaver._internal.package_record import PackageRecord
+from deltaver._internal.version_key import VersionKey
 from deltaver._internal.version_list import VersionList
 
 
@@ -24,77 +27,44 @@ class GolangPackageList(VersionList):
     """Golang package list."""
 
     _name: str
+    _client: httpx.Client
+    _fanout: threading.Semaphore
+
+    @classmethod
+    def ctor(cls, name: str, client: httpx.Client) -> VersionList:
+        """Ctor."""
+        return cls(name, client, threading.BoundedSemaphore(8))
 
     @override
     def as_list(self) -> Sequence[Package]:
-        """List representation."""
-        return asyncio.run(self._async_as_list())
-
-    async def _async_as_list(self) -> Sequence[Package]:  # noqa: WPS210
-        """Async list representation with parallel requests."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get('https://proxy.golang.org/{0}/@v/list'.format(self._name))
-            response.raise_for_status()
-            versions = [
-                ParsedVersion(ver)
-                for ver in response.text.splitlines()
-            ]
-            tasks = [
-                self._fetch_version_info(
-                    client,
-                    'https://proxy.golang.org/{0}/@v/{1}.info'.format(self._name, version.origin()),
-                    version,
-                )
-                for version in sorted(
-                    [ver for ver in versions if ver.valid()],
-                    key=lambda ver: ver.parse(),
-                )
+        """List representation with parallel requests."""
+        module = NormalizedName('golang', self._name)  # noqa: WPS226
+        response = self._client.get('https://proxy.golang.org/{0}/@v/list'.format(module))
+        response.raise_for_status()
+        versions = sorted(
+            [
+                line
+                for line in response.text.splitlines()
+                if VersionKey('golang', line).valid()
+            ],
+            key=lambda line: VersionKey('golang', line).key(),
+        )
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return [
+                pkg
+                for pkg in executor.map(self._fetch_version_info, versions)
+                if pkg is not None
             ]
-            packages = []
-            for pkg in await asyncio.gather(*tasks, return_exceptions=True):
-                if isinstance(pkg, BaseException):
-                    continue
-                if pkg is not None:
-                    packages.append(pkg)
-            return packages
 
-    async def _fetch_version_info(
-        self,
-        client: httpx.AsyncClient,
-        url: str,
-        version: ParsedVersion,
-    ) -> Package | None:
+    def _fetch_version_info(self, version: str) -> Package | None:
         """Fetch version info for a single version."""
-        try:
-            return await self._inner(client, url, version)
-        except httpx.HTTPError:
-            return None
-
-    async def _inner(self, client: httpx.AsyncClient, url: str, version: ParsedVersion) -> Package | None:
-        response = await client.get(url)
-        if response.status_code == httpx.codes.NOT_FOUND:
-            # Request to get the list of versions for the module:
-            # https://proxy.golang.org/github.com/russross/blackfriday/v2/@v/list
-            # Response:
-            # v2.0.0
-            # v2.1.0-pre.1
-            # v2.1.0
-            # v2.0.1
-            #
-            # However, attempting to request information for a specific version, such as:
-            # https://proxy.golang.org/github.com/russross/blackfriday/v2/@v/v2.0.0.info
-            # will result in a 404 error (page not found).
-            return None
-        response.raise_for_status()
-        return FkPackage(
-            self._name,
-            version.origin(),
-            (
-                datetime.datetime
-                .strptime(
-                    response.json()['Time'],
-                    '%Y-%m-%dT%H:%M:%S%z',
+        with self._fanout:
+            try:
+                return PackageRecord.ctor(
+                    self._name,
+                    version,
+                    GolangPackage(self._name, version, self._client).release_date(),
+                    'golang',
                 )
-                .date()
-            ),
-        )
+            except (VersionNotFoundError, httpx.HTTPError, KeyError, ValueError):  # noqa: WPS239
+                return None
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Golang pseudo-version."""
+
+import datetime
+import re
+from typing import final
+
+import attrs
+from packaging import version as packaging_version
+
+from deltaver._internal.exceptions import InvalidVersionError
+
+# https://go.dev/ref/mod#pseudo-versions
+# vX.0.0-yyyymmddhhmmss-abcdefabcdef
+# vX.Y.Z-pre.0.yyyymmddhhmmss-abcdefabcdef
+# vX.Y.(Z+1)-0.yyyymmddhhmmss-abcdefabcdef
+_PSEUDO_VERSION = re.compile(
+    r'^v(?P<base>\d+\.\d+\.\d+)-(?:(?P<pre>[^+]*)\.0\.|0\.)?(?P<time>\d{14})-[A-Za-z0-9]+(?:\+incompatible)?$',
+)
+
+
+@final
+@attrs.define(frozen=True)
+class GolangPseudoVersion:
+    """Golang pseudo-version.
+
+    Commit timestamp encoded into version string,
+    so release date available without module proxy request.
+    """
+
+    _version: str
+
+    def valid(self) -> bool:
+        """Version is pseudo-version."""
+        return _PSEUDO_VERSION.match(self._version) is not None
+
+    def release_date(self) -> datetime.date:
+        """Commit date."""
+        return (
+            datetime.datetime
+            .strptime(self._match().group('time'), '%Y%m%d%H%M%S')
+            .replace(tzinfo=datetime.timezone.utc)
+            .date()
+        )
+
+    def parse(self) -> packaging_version.Version:
+        """Parse version.
+
+        Pseudo-version sorted after its base version and before next tag,
+        it represented as development release.
+        """
+        match = self._match()
+        base = match.group('base')
+        if match.group('pre'):
+            base = '{0}-{1}.post0'.format(base, match.group('pre'))
+        try:
+            return packaging_version.parse('{0}.dev{1}'.format(base, match.group('time')))
+        except packaging_version.InvalidVersion as err:
+            raise InvalidVersionError(self._version) from err
+
+    def _match(self) -> re.Match[str]:
+        match = _PSEUDO_VERSION.match(self._version)
+        if match is None:
+            raise InvalidVersionError(self._version)
+        return match
@@ -11,7 +11,7 @@ from typing_extensions import override
 
 from deltaver._internal.exceptions import InvalidVersionError
 from deltaver._internal.parsed_reqs import ParsedReqs
-from deltaver._internal.parsed_version import ParsedVersion
+from deltaver._internal.version_key import VersionKey
 
 
 @final
@@ -31,7 +31,7 @@ class GolangReqs(ParsedReqs):
                 continue
             splitted_line = line.split(' ')
             try:
-                ParsedVersion(splitted_line[1]).parse()
+                VersionKey('golang', splitted_line[1]).key()
             except InvalidVersionError:
                 continue
             res.append((
@@ -47,7 +47,7 @@ class GolangReqs(ParsedReqs):
         groupped = groupby(
             sorted(
                 packages,
-                key=lambda pkg_info: (pkg_info[0], ParsedVersion(pkg_info[1]).parse()),
+                key=lambda pkg_info: (pkg_info[0], VersionKey('golang', pkg_info[1]).key()),  # noqa: WPS221
             ),
             key=lambda pkg_info: pkg_info[0],
         )
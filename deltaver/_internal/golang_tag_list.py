@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Golang module tags without release dates."""
+
+from collections.abc import Sequence
+from typing import final
+
+import attrs
+import httpx
+from typing_extensions import override
+
+from deltaver._internal.golang_package import GolangPackage
+from deltaver._internal.normalized_name import NormalizedName
+from deltaver._internal.package import Package
+from deltaver._internal.version_key import VersionKey
+from deltaver._internal.version_list import VersionList
+
+
+@final
+@attrs.define(frozen=True)
+class GolangTagList(VersionList):
+    """Golang module tags without release dates.
+
+    Only `@v/list` requested, release date of each package
+    fetched on demand.
+    """
+
+    _name: str
+    _client: httpx.Client
+
+    @override
+    def as_list(self) -> Sequence[Package]:
+        """List representation."""
+        response = self._client.get('https://proxy.golang.org/{0}/@v/list'.format(NormalizedName('golang', self._name)))
+        response.raise_for_status()
+        return [
+            GolangPackage(self._name, line, self._client)
+            for line in response.text.splitlines()
+            if VersionKey('golang', line).valid()
+        ]
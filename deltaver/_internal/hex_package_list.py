@@ -10,12 +10,12 @@ from typing import final
 
 import attrs
 import httpx
-from packaging.version import InvalidVersion
-from packaging.version import parse as version_parse
 from typing_extensions import override
 
-from deltaver._internal.fk_package import FkPackage
+from deltaver._internal.exceptions import InvalidVersionError
+from deltaver._internal.normalized_name import NormalizedName
 from deltaver._internal.package import Package
+from deltaver._internal.package_record import PackageRecord
 from deltaver._internal.version_list import VersionList
 
 
@@ -25,11 +25,12 @@ class HexPackageList(VersionList):
     """Hex package list."""
 
     _name: str
+    _client: httpx.Client
 
     @override
     def as_list(self) -> Sequence[Package]:
         """List representation."""
-        response = httpx.get('https://hex.pm/api/packages/{0}'.format(self._name))
+        response = self._client.get('https://hex.pm/api/packages/{0}'.format(NormalizedName('hex', self._name)))
         response.raise_for_status()
         releases = response.json().get('releases', [])
         packages = []
@@ -37,11 +38,11 @@ class HexPackageList(VersionList):
             version_num = release.get('version')
             if not version_num:
                 continue
-            with suppress(InvalidVersion):
-                version_parse(version_num)
-                packages.append(FkPackage(
+            with suppress(InvalidVersionError):
+                packages.append(PackageRecord.ctor(
                     self._name,
                     version_num,
                     datetime.datetime.strptime(release.get('inserted_at', ''), '%Y-%m-%dT%H:%M:%S.%f%z').date(),
+                    'hex',
                 ))
         return packages
@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Concurrency limits per registry host."""
+
+from typing import final
+
+import attrs
+
+
+@final
+@attrs.define(frozen=True)
+class HostLimits:
+    """Concurrency limits per registry host."""
+
+    _limits: dict[str, int]
+    _default: int
+
+    @classmethod
+    def ctor(cls, limits: dict[str, int] | None = None) -> 'HostLimits':
+        """Ctor."""
+        return cls(limits or {}, 8)
+
+    def limit(self, host: str) -> int:
+        """Max simultaneous requests to host."""
+        return max(self._limits.get(host, self._default), 1)
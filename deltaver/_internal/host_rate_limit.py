@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Adaptive request rate per registry host."""
+
+import json
+import math
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import final
+
+import attrs
+
+from deltaver._internal.token_bucket import TokenBucket
+
+if sys.platform != 'win32':
+    import fcntl
+
+
+@final
+@attrs.define(frozen=True)
+class HostRateLimit:
+    """Adaptive request rate per registry host.
+
+    Every host has token bucket with AIMD refill rate kept in process.
+    With state file buckets shared by all deltaver processes of runner:
+    they synced with locked file every sync interval and on throttling,
+    more recent bucket of host wins, host blocked while any process blocked it.
+    """
+
+    _path: Path | None
+    _states: dict[str, list[float]]
+    _lock: threading.Lock
+    _interval: float
+    _synced: list[float]
+
+    @classmethod
+    def ctor(cls, path: Path | None = None, interval: float = 1) -> 'HostRateLimit':
+        """Ctor, without path state kept in process."""
+        return cls(path, {}, threading.Lock(), interval, [-math.inf])
+
+    def wait(self, host: str) -> float:
+        """Take token of host, seconds to wait before next try if not available."""
+        return self._update(
+            host,
+            lambda bucket: bucket if bucket.delay() else bucket.taken(),
+        ).delay()
+
+    def succeeded(self, host: str) -> None:
+        """Increase rate of host."""
+        self._update(host, TokenBucket.increased)
+
+    def throttled(self, host: str, retry_after: float) -> None:
+        """Decrease rate of host and block it for retry after seconds."""
+        self._update(host, lambda bucket: bucket.decreased(retry_after), adjusted=True)
+
+    def _update(
+        self,
+        host: str,
+        change: Callable[[TokenBucket], TokenBucket],
+        *,
+        adjusted: bool = False,
+    ) -> TokenBucket:
+        now = time.time()
+        with self._lock:
+            if now - self._synced[0] >= self._interval:
+                self._sync(now)
+            bucket = TokenBucket.ctor(now)
+            state = self._states.get(host)
+            if state is not None:
+                bucket = TokenBucket.loaded(state).refilled(now)
+            self._states[host] = change(bucket).state()
+            if adjusted:
+                self._sync(now)
+        return bucket
+
+    def _sync(self, now: float) -> None:
+        self._synced[0] = now
+        if self._path is None:
+            return
+        self._path.parent.mkdir(exist_ok=True, parents=True)
+        with self._path.open('a+') as state_file:
+            if sys.platform != 'win32':
+                fcntl.flock(state_file, fcntl.LOCK_EX)
+            state_file.seek(0)
+            try:
+                shared = json.loads(state_file.read() or '{}')
+            except ValueError:
+                shared = {}
+            for host, state in shared.items():
+                self._merge(host, TokenBucket.loaded(state))
+            state_file.seek(0)
+            state_file.truncate()
+            state_file.write(json.dumps(self._states))
+
+    def _merge(self, host: str, shared: TokenBucket) -> None:
+        local = self._states.get(host)
+        if local is not None:
+            shared = shared.merged(TokenBucket.loaded(local))
+        self._states[host] = shared.state()
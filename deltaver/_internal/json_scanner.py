@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Incremental scanner of json document."""
+
+import codecs
+import json
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any, final
+
+import attrs
+
+_NOT_WHITESPACE = re.compile(r'[^ \t\n\r]')
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_PLAIN = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+_SCALAR = re.compile(r'[^,:\[\]{}\s]+')
+
+
+@final
+@attrs.define
+# Scanner position moves over document
+class JsonScanner:  # noqa: PEO200, WPS214
+    """Incremental scanner of json document.
+
+    Document read by chunks, skipped values are not decoded
+    and leave memory as soon as scanner passed them.
+    """
+
+    _chunks: Iterator[bytes]
+    _decoder: codecs.IncrementalDecoder
+    _buffer: str
+    _pos: int
+    _anchor: int | None
+
+    @classmethod
+    def ctor(cls, chunks: Iterable[bytes]) -> 'JsonScanner':
+        """Ctor."""
+        return cls(iter(chunks), codecs.getincrementaldecoder('utf-8')(), '', 0, None)
+
+    def member_names(self) -> Iterator[str]:
+        """Keys of object under scanner, value must be consumed before next key."""
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._string()
+            self._expect(':')
+            yield key
+            separator = self._peek()
+            self._pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                message = 'Expected "," or "}}" at {0}'.format(self._pos)
+                raise ValueError(message)
+
+    def decoded(self) -> Any:  # noqa: ANN401
+        """Decoded value under scanner."""
+        self._peek()
+        self._anchor = self._pos
+        self.skip()
+        decoded = json.loads(self._buffer[self._anchor:self._pos])
+        self._anchor = None
+        return decoded
+
+    def skip(self) -> None:
+        """Skip value under scanner."""
+        first_char = self._peek()
+        if first_char == '"':
+            self._skip_string()
+        elif first_char in {'{', '['}:
+            self._skip_container()
+        else:
+            self._skip_scalar()
+
+    def _skip_container(self) -> None:
+        depth = 0
+        while True:
+            char = self._next_bracket()
+            self._pos += 1
+            depth += 1 if char in {'{', '['} else -1
+            if depth == 0:
+                return
+
+    def _next_bracket(self) -> str:
+        while True:
+            self._pos = _PLAIN.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos == len(self._buffer):
+                self._fill_or_fail()
+                continue
+            char = self._buffer[self._pos]
+            if char != '"':
+                return char
+            # string cut by chunk border
+            self._skip_string()
+
+    def _skip_scalar(self) -> None:
+        while True:
+            match = _SCALAR.match(self._buffer, self._pos)
+            if match is None:
+                message = 'Unexpected token at {0}'.format(self._pos)
+                raise ValueError(message)
+            if match.end() < len(self._buffer) or not self._fill():
+                self._pos = match.end()
+                return
+
+    def _string(self) -> str:
+        if self._peek() != '"':
+            message = 'Expected string at {0}'.format(self._pos)
+            raise ValueError(message)
+        return self.decoded()
+
+    def _skip_string(self) -> None:
+        while True:
+            match = _STRING.match(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.end()
+                return
+            self._fill_or_fail()
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            message = 'Expected "{0}" at {1}'.format(char, self._pos)
+            raise ValueError(message)
+        self._pos += 1
+
+    def _peek(self) -> str:
+        while True:
+            match = _NOT_WHITESPACE.search(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return match.group()
+            self._pos = len(self._buffer)
+            if not self._fill():
+                return ''
+
+    def _fill_or_fail(self) -> None:
+        if not self._fill():
+            message = 'Unexpected end of document'
+            raise ValueError(message)
+
+    def _fill(self) -> bool:
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+        keep_from = self._pos if self._anchor is None else self._anchor
+        self._buffer = self._buffer[keep_from:] + self._decoder.decode(chunk)
+        self._pos -= keep_from
+        if self._anchor is not None:
+            self._anchor = 0
+        return True
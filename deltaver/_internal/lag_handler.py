@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""HTTP API of lag queries."""
+
+import json
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from typing import Any, final
+
+from typing_extensions import override
+
+from deltaver._internal.formats import Formats
+from deltaver._internal.lag_service import LagService
+
+_Body = dict[str, object]
+
+
+@final
+class LagHandler(BaseHTTPRequestHandler):
+    """HTTP API of lag queries.
+
+    `POST /scan` takes {"lockfile": ..., "format": ...} and returns
+    packages with sum, max and average delta.
+    `POST /batch` takes {"lockfiles": [...]} and returns {"results": [...]}
+    in order of lockfiles.
+    """
+
+    def __init__(self, *args: Any, service: LagService, **kwargs: Any) -> None:  # noqa: ANN401
+        """Ctor."""
+        self._service = service
+        super().__init__(*args, **kwargs)
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Answer lag query."""
+        try:
+            status, body = self._routed()
+        except (ValueError, KeyError, TypeError) as err:
+            status, body = HTTPStatus.BAD_REQUEST, {'error': 'Invalid query: {0}'.format(err)}
+        except Exception as err:  # noqa: BLE001
+            status, body = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': 'Deltaver fail with: "{0}"'.format(err)}
+        self._answer(status, body)
+
+    @override
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002, ANN401, WPS125
+        """Skip access log."""
+
+    def _routed(self) -> tuple[HTTPStatus, _Body]:  # noqa: WPS210
+        length = int(self.headers.get('Content-Length', 0))
+        query = json.loads(self.rfile.read(length))
+        if self.path == '/scan':
+            lockfile_content, file_format = self._lockfile(query)
+            return HTTPStatus.OK, self._service.scanned(lockfile_content, file_format)
+        if self.path == '/batch':
+            lockfiles = [self._lockfile(lockfile) for lockfile in query['lockfiles']]
+            return HTTPStatus.OK, {'results': self._service.scanned_many(lockfiles)}
+        return HTTPStatus.NOT_FOUND, {'error': 'Unknown path {0}'.format(self.path)}
+
+    def _lockfile(self, query: dict[str, str]) -> tuple[str, Formats]:
+        return query['lockfile'], Formats(query.get('format', Formats.default.value))
+
+    def _answer(self, status: HTTPStatus, body: _Body) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
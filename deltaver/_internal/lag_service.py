@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Lag queries served from warm in-process state."""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import final
+
+import attrs
+
+from deltaver._internal.formats import Formats
+from deltaver._internal.scan_report import ScanReport
+from deltaver._internal.stale_releases import StaleReleases
+from deltaver._internal.versions_memo import VersionsMemo
+
+_Rows = list[tuple[str, str, int]]
+_Scan = Callable[[str, Formats, VersionsMemo, StaleReleases, bool], _Rows]
+_Answer = dict[str, object]
+
+
+@final
+@attrs.define(frozen=True)
+class LagService:
+    """Lag queries served from warm in-process state.
+
+    Version lists memoized across queries. Recently queried lockfiles
+    are hot, refresh scans them again with empty memo revalidating
+    cached releases with registry and swaps memo when done,
+    so queries never wait for registry of hot packages.
+    Failed refresh of lockfile logged, other lockfiles still refreshed.
+    """
+
+    _scan: _Scan
+    _memo: list[VersionsMemo]
+    _hot: OrderedDict[tuple[str, Formats], None]
+    _lock: threading.Lock
+    _max_hot: int
+
+    @classmethod
+    def ctor(cls, scan: _Scan, max_hot: int = 64) -> 'LagService':
+        """Ctor."""
+        return cls(scan, [VersionsMemo.ctor()], OrderedDict(), threading.Lock(), max_hot)
+
+    def scanned(self, lockfile_content: str, file_format: Formats) -> _Answer:  # noqa: WPS210
+        """Packages, sum, max and average delta of lockfile."""
+        with self._lock:
+            self._hot[lockfile_content, file_format] = None
+            self._hot.move_to_end((lockfile_content, file_format))
+            while len(self._hot) > self._max_hot:
+                self._hot.popitem(last=False)
+            memo = self._memo[0]
+        stale = StaleReleases.ctor()
+        rows = self._scan(lockfile_content, file_format, memo, stale, False)  # noqa: FBT003
+        report = ScanReport.ctor(rows, stale)
+        return {
+            'packages': [
+                {
+                    'name': name,
+                    'version': version,
+                    'delta': delta,
+                    'stale': self._fetched(stale, name),
+                }
+                for name, version, delta in rows
+            ],
+            'sum_delta': sum(max(delta, 0) for _, _, delta in rows),
+            'max_delta': report.maximum(),
+            'average_delta': report.average(),
+        }
+
+    def scanned_many(self, lockfiles: Sequence[tuple[str, Formats]]) -> list[_Answer]:
+        """Results of many lockfiles in order of lockfiles."""
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix='deltaver-batch') as executor:
+            return list(executor.map(lambda lockfile: self.scanned(*lockfile), lockfiles))
+
+    def refreshed(self) -> int:
+        """Scan hot lockfiles with fresh memo, count of refreshed lockfiles."""
+        with self._lock:
+            hot = list(self._hot)
+        memo = VersionsMemo.ctor()
+        refreshed = 0
+        for lockfile_content, file_format in hot:
+            try:
+                self._scan(lockfile_content, file_format, memo, StaleReleases.ctor(), True)  # noqa: FBT003
+            except Exception:
+                logging.getLogger(__name__).warning('Refresh of %s lockfile failed', file_format.value, exc_info=True)
+                continue
+            refreshed += 1
+        with self._lock:
+            self._memo[0] = memo
+        return refreshed
+
+    def _fetched(self, stale: StaleReleases, name: str) -> str | None:
+        fetched = stale.fetched(name)
+        return None if fetched is None else fetched.isoformat()
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Requirements ordered by delta of previous run."""
+
+from collections.abc import Sequence
+from typing import final
+
+import attrs
+from typing_extensions import override
+
+from deltaver._internal.normalized_name import NormalizedName
+from deltaver._internal.parsed_reqs import ParsedReqs
+
+
+@final
+@attrs.define(frozen=True)
+class LaggingFirstReqs(ParsedReqs):
+    """Requirements ordered by delta of previous run.
+
+    Most outdated requirements go first, so threshold of fail-fast scan
+    reached early. Unknown requirements keep order at the end.
+    """
+
+    _dependencies: Sequence[tuple[str, str]]
+    _lags: dict[str, int]
+    _ecosystem: str
+
+    @override
+    def reqs(self) -> list[tuple[str, str]]:
+        """Requirements ordered by delta of previous run."""
+        return sorted(self._dependencies, key=self._lag, reverse=True)
+
+    def _lag(self, dependency: tuple[str, str]) -> int:
+        name = str(NormalizedName(self._ecosystem, dependency[0]))
+        return self._lags.get(name, -1)
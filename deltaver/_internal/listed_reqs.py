@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Requirements already parsed by caller."""
+
+from collections.abc import Sequence
+from typing import final
+
+import attrs
+from typing_extensions import override
+
+from deltaver._internal.parsed_reqs import ParsedReqs
+
+
+@final
+@attrs.define(frozen=True)
+class ListedReqs(ParsedReqs):
+    """Requirements already parsed by caller."""
+
+    _dependencies: Sequence[tuple[str, str]]
+
+    @override
+    def reqs(self) -> list[tuple[str, str]]:
+        """Requirements list."""
+        return list(self._dependencies)
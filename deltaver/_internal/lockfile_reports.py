@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Reports of many lockfiles in terminal."""
+
+from pathlib import Path
+from typing import final
+
+import attrs
+from rich import print as rich_print
+
+from deltaver._internal.failed_lockfiles import FailedLockfiles
+from deltaver._internal.scan_report import ScanReport
+from deltaver._internal.stale_releases import StaleReleases
+
+
+@final
+@attrs.define(frozen=True)
+class LockfileReports:
+    """Reports of many lockfiles in terminal.
+
+    Report of every lockfile followed by aggregate report
+    of distinct dependencies of all lockfiles.
+    Error printed instead of report of failed lockfile.
+    """
+
+    _files: list[tuple[Path, list[tuple[str, str, int]]]]  # noqa: WPS234
+    _stale: StaleReleases
+    _failed: FailedLockfiles = attrs.field(factory=FailedLockfiles.ctor)
+
+    def aggregate(self) -> ScanReport:
+        """Report of distinct dependencies of all lockfiles."""
+        packages = dict.fromkeys(
+            row
+            for _, rows in self._files
+            for row in rows
+        )
+        return ScanReport.ctor(
+            sorted(packages, key=lambda row: row[2], reverse=True),
+            self._stale,
+        )
+
+    def print(self) -> None:
+        """Print report of every lockfile and aggregate report."""
+        for path, rows in self._files:
+            rich_print('\n[bold]{0}[/bold]'.format(path))
+            error = self._failed.error(path)
+            if error is not None:
+                rich_print('[red]Lockfile not scanned: {0}[/red]'.format(error))
+                continue
+            ScanReport.ctor(rows, self._stale).print()
+        rich_print('\n[bold]Total: {0} lockfiles[/bold]'.format(len(self._files)))
+        self.aggregate().print()
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Requirements of lockfile in any supported format."""
+
+from typing import final
+
+import attrs
+from typing_extensions import override
+
+from deltaver._internal.formats import Formats
+from deltaver._internal.freezed_reqs import FreezedReqs
+from deltaver._internal.golang_reqs import GolangReqs
+from deltaver._internal.mix_lock_reqs import MixLockReqs
+from deltaver._internal.package_lock_reqs import PackageLockReqs
+from deltaver._internal.parsed_reqs import ParsedReqs
+from deltaver._internal.poetry_lock_reqs import PoetryLockReqs
+
+
+@final
+@attrs.define(frozen=True)
+class LockfileReqs(ParsedReqs):
+    """Requirements of lockfile in any supported format."""
+
+    _lock_file_content: str
+    _file_format: Formats
+
+    @override
+    def reqs(self) -> list[tuple[str, str]]:
+        """Parsed requirements list."""
+        file_format = Formats.pip_freeze if self._file_format == Formats.default else self._file_format
+        parsed_reqs: ParsedReqs = {
+            Formats.npm_lock: PackageLockReqs(self._lock_file_content),
+            Formats.pip_freeze: FreezedReqs(self._lock_file_content),
+            Formats.poetry_lock: PoetryLockReqs(self._lock_file_content),
+            Formats.golang: GolangReqs(self._lock_file_content),
+            Formats.mix_lock: MixLockReqs(self._lock_file_content),
+        }[file_format]
+        return parsed_reqs.reqs()
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Concurrent scans of many registries as one stream."""
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from typing import final
+
+import attrs
+
+from deltaver._internal.concurrent_scan import ConcurrentScan
+
+_Found = tuple[int, tuple[str, str, int]]
+
+
+@final
+@attrs.define(frozen=True)
+class MergedScans:
+    """Concurrent scans of many registries as one stream.
+
+    Rows of all scans run at once in order of completion,
+    tagged with index of their scan. Error of one scan stops stream,
+    other scans cancelled. Fail fast of scan sharing deadline
+    with others stops stream, other scans cancelled.
+    """
+
+    _scans: Sequence[ConcurrentScan]
+
+    async def stream(self) -> AsyncIterator[_Found]:  # noqa: WPS210, WPS231
+        """Rows (scan index, (name, version, delta)) in order of completion."""
+        found: asyncio.Queue[_Found | Exception | None] = asyncio.Queue()
+        tasks = [
+            asyncio.ensure_future(self._pumped(idx, scan, found))
+            for idx, scan in enumerate(self._scans)
+        ]
+        finished = 0
+        try:  # noqa: WPS501
+            while finished < len(tasks):
+                row = await found.get()  # noqa: WPS476
+                if isinstance(row, Exception):
+                    raise row
+                if row is None:
+                    finished += 1
+                    continue
+                yield row
+                if self._scans[row[0]].stopped():
+                    return
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _pumped(
+        self,
+        idx: int,
+        scan: ConcurrentScan,
+        found: 'asyncio.Queue[_Found | Exception | None]',
+    ) -> None:
+        try:
+            async for row in scan.stream():
+                found.put_nowait((idx, row))
+        except Exception as err:  # noqa: BLE001
+            found.put_nowait(err)
+            return
+        found.put_nowait(None)
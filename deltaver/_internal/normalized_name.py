@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Package name normalized by ecosystem rules."""
+
+import re
+from typing import final
+
+import attrs
+from typing_extensions import override
+
+
+@final
+@attrs.define(frozen=True)
+class NormalizedName:
+    """Package name normalized by ecosystem rules.
+
+    PyPI names normalized by PEP 503. Go module paths are case-sensitive,
+    upper-case letters escaped like in module proxy protocol.
+    Npm names are case-sensitive, scoped names of lockfile paths and urls
+    reduced to `@scope/name`.
+    """
+
+    _ecosystem: str
+    _name: str
+
+    @override
+    def __str__(self) -> str:
+        """Normalized name."""
+        if self._ecosystem == 'pypi':
+            # https://peps.python.org/pep-0503/#normalized-names
+            return re.sub(r'[-_.]+', '-', self._name).lower()
+        if self._ecosystem == 'golang':
+            # https://go.dev/ref/mod#goproxy-protocol
+            return re.sub('[A-Z]', self._escaped, self._name)
+        if self._ecosystem == 'npm':
+            name = self._name.rsplit('node_modules/', 1)[-1]
+            return name.replace('%2F', '/').replace('%2f', '/')
+        return self._name.lower()
+
+    def _escaped(self, letter: re.Match[str]) -> str:
+        return '!{0}'.format(letter[0].lower())
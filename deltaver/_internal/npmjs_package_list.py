@@ -13,9 +13,12 @@ import httpx
 from typing_extensions import override
 
 from deltaver._internal.exceptions import InvalidVersionError
-from deltaver._internal.fk_package import FkPackage
+from deltaver._internal.normalized_name import NormalizedName
 from deltaver._internal.package import Package
-from deltaver._internal.parsed_version import ParsedVersion
+from deltaver._internal.package_record import PackageRecord
+from deltaver._internal.stable_key import StableKey
+from deltaver._internal.streamed_json_members import StreamedJsonMembers
+from deltaver._internal.version_key import VersionKey
 from deltaver._internal.version_list import VersionList
 
 
@@ -25,22 +28,25 @@ class NpmjsPackageList(VersionList):
     """Npmjs package list."""
 
     _name: str
+    _client: httpx.Client
 
     @override
     # TODO: minimize variables
     def as_list(self) -> Sequence[Package]:  # noqa: WPS210
         """List representation."""
-        response = httpx.get(httpx.URL('https://registry.npmjs.org').join(self._name))
-        response.raise_for_status()
-        versions = response.json()['time'].items()
+        name = NormalizedName('npm', self._name)
+        url = httpx.URL('https://registry.npmjs.org').join(str(name))
+        with self._client.stream('GET', url) as response:
+            response.raise_for_status()
+            versions = list(StreamedJsonMembers(response.iter_bytes(), ('time',)).members())
         correct_versions = []
         for version_number, release_time in versions:
             # Skip non-version keys like 'created', 'modified', etc.
             if version_number in ['created', 'modified', 'unpublished']:
                 continue
             with suppress(InvalidVersionError, IndexError, KeyError):
-                parsed_version = ParsedVersion(version_number).parse()
-                if not parsed_version.is_prerelease:
+                version_key = VersionKey('npm', version_number).key()
+                if StableKey(version_key).stable():
                     parsed_release_time = (
                         datetime.datetime.strptime(
                             release_time,
@@ -50,10 +56,11 @@ class NpmjsPackageList(VersionList):
                         .date()
                     )
                     correct_versions.append(
-                        FkPackage(
+                        PackageRecord(
                             self._name,
                             version_number,
-                            parsed_release_time,
+                            version_key,
+                            parsed_release_time.toordinal(),
                         ),
                     )
         return correct_versions
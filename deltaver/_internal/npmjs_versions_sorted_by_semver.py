@@ -23,12 +23,13 @@ class NpmjsVersionsSortedBySemver(SortedVersions):
 
     _artifactory_domain: str
     _package_name: str
+    _client: httpx.Client
 
     @override
     # TODO: fix
     def fetch(self) -> SortedVersionsList:  # noqa: WPS210, WPS210
         """Sorted versions list."""
-        response = httpx.get(
+        response = self._client.get(
             httpx.URL(self._artifactory_domain).join(self._package_name),
         )
         response.raise_for_status()
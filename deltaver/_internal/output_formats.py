@@ -0,0 +1,14 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Scan output format."""
+
+from enum import Enum
+
+
+class OutputFormats(Enum):
+    """Scan output format."""
+
+    table = 'table'
+    ndjson = 'ndjson'
+    json = 'json'
@@ -4,7 +4,7 @@
 """Package."""
 
 import datetime
-from typing import Protocol
+from typing import Any, Protocol
 
 from packaging.version import Version
 
@@ -15,6 +15,12 @@ class Package(Protocol):
     def version(self) -> Version:
         """Version."""
 
+    def key(self) -> tuple[Any, ...]:
+        """Comparison key of version by ecosystem rules."""
+
+    def number(self) -> str:
+        """Version as published by registry."""
+
     def name(self) -> str:
         """Name."""
 
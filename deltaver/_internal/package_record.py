@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Package with version parsed once."""
+
+import datetime
+from typing import Any, final
+
+import attrs
+from packaging.version import Version
+from typing_extensions import override
+
+from deltaver._internal.package import Package
+from deltaver._internal.parsed_version import ParsedVersion
+from deltaver._internal.version_key import VersionKey
+
+
+@final
+@attrs.define(frozen=True)
+class PackageRecord(Package):
+    """Package with version parsed once.
+
+    Slotted record of version as published by registry, interned
+    comparison key and day ordinal of release,
+    cheap to compare and sort in hot loops.
+    """
+
+    _name: str
+    _version: str
+    _key: tuple[Any, ...]
+    _release_ordinal: int
+
+    @classmethod
+    def ctor(
+        cls,
+        name: str,
+        version: str,
+        release_date: datetime.date,
+        ecosystem: str = 'pypi',
+    ) -> 'PackageRecord':
+        """Ctor."""
+        return cls(name, version, VersionKey(ecosystem, version).key(), release_date.toordinal())
+
+    @override
+    def version(self) -> Version:
+        """Version."""
+        return ParsedVersion(self._version).parse()
+
+    @override
+    def key(self) -> tuple[Any, ...]:
+        """Comparison key of version by ecosystem rules."""
+        return self._key
+
+    @override
+    def number(self) -> str:
+        """Version as published by registry."""
+        return self._version
+
+    @override
+    def name(self) -> str:
+        """Name."""
+        return self._name
+
+    @override
+    def release_date(self) -> datetime.date:
+        """Release date."""
+        return datetime.date.fromordinal(self._release_ordinal)
+
+    def release_ordinal(self) -> int:
+        """Day ordinal of release date."""
+        return self._release_ordinal
@@ -3,12 +3,24 @@
 
 """Module for parsing version strings into semantic version objects."""
 
+from functools import lru_cache
 from typing import final
 
 import attrs
 from packaging import version as packaging_version
 
 from deltaver._internal.exceptions import InvalidVersionError
+from deltaver._internal.golang_pseudo_version import GolangPseudoVersion
+
+
+@lru_cache(maxsize=65536)  # noqa: WPS432
+def _interned(version: str) -> packaging_version.Version | None:
+    if GolangPseudoVersion(version).valid():
+        return GolangPseudoVersion(version).parse()
+    try:
+        return packaging_version.parse(version.removeprefix('v'))
+    except packaging_version.InvalidVersion:
+        return None
 
 
 @final
@@ -32,9 +44,11 @@ class ParsedVersion:
             return True
 
     def parse(self) -> packaging_version.Version:
-        """Parse version."""
-        origin = self._version.removeprefix('v')
-        try:
-            return packaging_version.parse(origin)
-        except packaging_version.InvalidVersion as err:
-            raise InvalidVersionError(self._version) from err
+        """Parse version.
+
+        Parsed versions are interned, equal strings share one object.
+        """
+        parsed = _interned(self._version)
+        if parsed is None:
+            raise InvalidVersionError(self._version)
+        return parsed
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Lockfiles waiting for lookups of their dependencies."""
+
+from collections.abc import Hashable, Sequence
+from collections.abc import Set as AbstractSet
+from typing import final
+
+import attrs
+
+
+@final
+@attrs.define(frozen=True)
+class PendingLockfiles:
+    """Lockfiles waiting for lookups of their dependencies.
+
+    Lockfiles identified by index, lookup shared by lockfiles
+    completes all of them.
+    """
+
+    _waiting: dict[Hashable, list[int]]
+    _left: list[int]
+
+    @classmethod
+    def ctor(cls, lookups: Sequence[AbstractSet[Hashable]]) -> 'PendingLockfiles':
+        """Ctor by lookups of every lockfile."""
+        waiting: dict[Hashable, list[int]] = {}
+        for idx, keys in enumerate(lookups):
+            for key in keys:
+                waiting.setdefault(key, []).append(idx)
+        return cls(waiting, [len(lockfile_keys) for lockfile_keys in lookups])
+
+    def empty(self) -> list[int]:
+        """Lockfiles without lookups."""
+        return [idx for idx, left in enumerate(self._left) if not left]
+
+    def resolved(self, key: Hashable) -> list[int]:
+        """Lockfiles completed by lookup."""
+        completed = []
+        for idx in self._waiting.pop(key, []):
+            self._left[idx] -= 1
+            if not self._left[idx]:
+                completed.append(idx)
+        return completed
+
+    def rest(self) -> list[int]:
+        """Lockfiles with lookups not resolved."""
+        return [idx for idx, left in enumerate(self._left) if left]
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Sorted package list with pinned package."""
+
+import bisect
+from collections.abc import Sequence
+from typing import final
+
+import attrs
+from typing_extensions import override
+
+from deltaver._internal.package import Package
+from deltaver._internal.version_list import VersionList
+
+
+@final
+@attrs.define(frozen=True)
+class PinnedPackageList(VersionList):
+    """Sorted package list with pinned package.
+
+    Pinned package may be absent in registry list,
+    for example golang pseudo-version. It inserted by version order.
+    """
+
+    _origin: VersionList
+    _pinned: Package
+
+    @override
+    def as_list(self) -> Sequence[Package]:
+        """List representation."""
+        packages = list(self._origin.as_list())
+        pinned_key = self._pinned.key()
+        position = bisect.bisect_left(packages, pinned_key, key=lambda pkg: pkg.key())
+        if position < len(packages) and packages[position].key() == pinned_key:
+            return packages
+        packages.insert(position, self._pinned)
+        return packages
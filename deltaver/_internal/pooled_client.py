@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Pooled http client."""
+
+from importlib.util import find_spec
+from typing import final
+
+import attrs
+import httpx
+
+from deltaver._internal.circuit_breaker import CircuitBreaker
+from deltaver._internal.circuit_breaker_transport import CircuitBreakerTransport
+from deltaver._internal.conditional_transport import ConditionalTransport
+from deltaver._internal.deadline import Deadline
+from deltaver._internal.deadline_transport import DeadlineTransport
+from deltaver._internal.host_rate_limit import HostRateLimit
+from deltaver._internal.rate_limit_transport import RateLimitTransport
+
+
+@final
+@attrs.define(frozen=True)
+class PooledClient:
+    """Pooled http client.
+
+    One client per run shares keep-alive connections, TLS sessions
+    and SSL context between all registry backends.
+    HTTP/2 multiplexing enabled when `h2` package installed.
+    Cached registry documents revalidated with conditional requests.
+    Request timeouts bounded by remaining time budget of scan.
+    Requests rate adapted to throttling of registry hosts.
+    Requests to registry host failed repeatedly fail fast.
+    """
+
+    _timeout: float
+    _deadline: Deadline = attrs.field(factory=Deadline.ctor)
+    _rate_limit: HostRateLimit = attrs.field(factory=HostRateLimit.ctor)
+    _breaker: CircuitBreaker = attrs.field(factory=CircuitBreaker.ctor)
+
+    def client(self) -> httpx.Client:
+        """Http client."""
+        return httpx.Client(
+            transport=DeadlineTransport(
+                ConditionalTransport(
+                    CircuitBreakerTransport(
+                        RateLimitTransport(
+                            httpx.HTTPTransport(
+                                http2=find_spec('h2') is not None,
+                                limits=httpx.Limits(
+                                    max_connections=100,
+                                    max_keepalive_connections=100,
+                                ),
+                            ),
+                            self._rate_limit,
+                            self._deadline,
+                        ),
+                        self._breaker,
+                    ),
+                ),
+                self._deadline,
+            ),
+            timeout=httpx.Timeout(self._timeout),
+        )
@@ -4,16 +4,16 @@
 """Pypi package list."""
 
 import datetime
-from typing import final
+from typing import Any, final
 
 import attrs
-import httpx
-import pytz
 from packaging.version import Version
 from typing_extensions import override
 
+from deltaver._internal.exceptions import VersionNotFoundError
 from deltaver._internal.package import Package
 from deltaver._internal.parsed_version import ParsedVersion
+from deltaver._internal.version_key import VersionKey
 from deltaver._internal.version_list import VersionList
 
 
@@ -31,6 +31,16 @@ class PypiPackage(Package):
         """Version."""
         return ParsedVersion(self._version).parse()
 
+    @override
+    def key(self) -> tuple[Any, ...]:
+        """Comparison key of version by ecosystem rules."""
+        return VersionKey('pypi', self._version).key()
+
+    @override
+    def number(self) -> str:
+        """Version as published by registry."""
+        return self._version
+
     @override
     def name(self) -> str:
         """Name."""
@@ -39,13 +49,8 @@ class PypiPackage(Package):
     @override
     def release_date(self) -> datetime.date:
         """Release date."""
-        response = httpx.get('https://pypi.org/pypi/{0}/json'.format(self._name))
-        releases = {
-            str(ParsedVersion(ver).parse()): pkg_info
-            for ver, pkg_info in response.json()['releases'].items()
-        }
-        response.raise_for_status()
-        return datetime.datetime.strptime(
-            releases[str(self.version())][0]['upload_time'],
-            '%Y-%m-%dT%H:%M:%S',
-        ).astimezone(pytz.UTC).date()
+        target_key = self.key()
+        for package in self._version_list.as_list():
+            if package.key() == target_key:
+                return package.release_date()
+        raise VersionNotFoundError(self._version)
@@ -13,9 +13,10 @@ import httpx
 from typing_extensions import override
 
 from deltaver._internal.exceptions import InvalidVersionError
-from deltaver._internal.fk_package import FkPackage
+from deltaver._internal.normalized_name import NormalizedName
 from deltaver._internal.package import Package
-from deltaver._internal.parsed_version import ParsedVersion
+from deltaver._internal.package_record import PackageRecord
+from deltaver._internal.streamed_json_members import StreamedJsonMembers
 from deltaver._internal.version_list import VersionList
 
 
@@ -25,19 +26,26 @@ class PypiPackageList(VersionList):
     """Pypi package list."""
 
     _name: str
+    _client: httpx.Client
 
     @override
     def as_list(self) -> Sequence[Package]:
         """List representation."""
-        response = httpx.get('https://pypi.org/pypi/{0}/json'.format(self._name))
-        response.raise_for_status()
+        with self._client.stream(
+            'GET',
+            'https://pypi.org/pypi/{0}/json'.format(NormalizedName('pypi', self._name)),
+        ) as response:
+            response.raise_for_status()
+            releases = [
+                (version_num, release_info[:1])
+                for version_num, release_info in StreamedJsonMembers(response.iter_bytes(), ('releases',)).members()
+            ]
         packages = []
-        for version_num, release_info in response.json()['releases'].items():
+        for version_num, release_info in releases:
             if not release_info or release_info[0]['yanked']:
                 continue
             with suppress(InvalidVersionError):
-                ParsedVersion(version_num).parse()
-                packages.append(FkPackage(
+                packages.append(PackageRecord.ctor(
                     self._name,
                     version_num,
                     (
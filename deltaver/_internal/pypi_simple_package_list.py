@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Pypi package list from simple repository API."""
+
+import datetime
+import logging
+from collections.abc import Sequence
+from contextlib import suppress
+from typing import final
+
+import attrs
+import httpx
+from packaging.utils import InvalidSdistFilename, InvalidWheelFilename, parse_sdist_filename, parse_wheel_filename
+from packaging.version import InvalidVersion, Version
+from typing_extensions import override
+
+from deltaver._internal.normalized_name import NormalizedName
+from deltaver._internal.package import Package
+from deltaver._internal.package_record import PackageRecord
+from deltaver._internal.version_list import VersionList
+
+_LEGACY_EXTENSIONS = (
+    '.tar.gz', '.tar.bz2', '.tar.xz', '.tar.Z', '.tar', '.tgz', '.tbz', '.zip',
+    '.egg', '.exe', '.msi', '.rpm', '.dmg',
+)
+
+
+@final
+@attrs.define(frozen=True)
+class PypiSimplePackageList(VersionList):
+    """Pypi package list from simple repository API.
+
+    JSON form of index page (PEP 691) with upload time of files (PEP 700),
+    release date is upload time of earliest file, release yanked when all files yanked.
+    Releases without upload time of any file skipped with warning.
+    Version of file taken from wheel or sdist filename,
+    files of legacy formats like `.tar.bz2` or `.egg` parsed by project name prefix.
+    """
+
+    _name: str
+    _client: httpx.Client
+    _index_url: str
+
+    @override
+    def as_list(self) -> Sequence[Package]:  # noqa: WPS210, WPS231
+        """List representation."""
+        response = self._client.get(
+            '{0}/{1}/'.format(self._index_url.rstrip('/'), NormalizedName('pypi', self._name)),
+            headers={'Accept': 'application/vnd.pypi.simple.v1+json'},
+        )
+        response.raise_for_status()
+        if 'json' not in response.headers.get('content-type', ''):
+            message = 'Index "{0}" does not serve JSON simple repository API'.format(self._index_url)
+            raise ValueError(message)
+        release_dates: dict[Version, datetime.date] = {}
+        available: set[Version] = set()
+        undated: set[Version] = set()
+        for file_info in response.json()['files']:
+            file_version = self._file_version(file_info['filename'])
+            if file_version is None:
+                continue
+            upload_time = file_info.get('upload-time')
+            if upload_time is None:
+                undated.add(file_version)
+                continue
+            upload_date = (
+                datetime.datetime.fromisoformat(upload_time.replace('Z', '+00:00'))
+                .astimezone(datetime.timezone.utc)
+                .date()
+            )
+            release_dates[file_version] = min(release_dates.get(file_version, upload_date), upload_date)
+            if not file_info.get('yanked'):
+                available.add(file_version)
+        self._warned(undated - release_dates.keys())
+        return [
+            PackageRecord.ctor(self._name, str(release_version), release_date)
+            for release_version, release_date in release_dates.items()
+            if release_version in available
+        ]
+
+    def _warned(self, undated: set[Version]) -> None:
+        if undated:
+            logging.getLogger(__name__).warning(
+                'Index %s does not report upload time of %s %s, these releases are skipped',
+                self._index_url,
+                self._name,
+                ', '.join(sorted(map(str, undated))),
+            )
+
+    def _file_version(self, filename: str) -> Version | None:
+        with suppress(InvalidWheelFilename, InvalidVersion):
+            if filename.endswith('.whl'):
+                return parse_wheel_filename(filename)[1]
+        with suppress(InvalidSdistFilename, InvalidVersion):
+            if filename.endswith(('.tar.gz', '.zip')):
+                return parse_sdist_filename(filename)[1]
+        return self._legacy_version(filename)
+
+    def _legacy_version(self, filename: str) -> Version | None:  # noqa: WPS210
+        extension = next((ext for ext in _LEGACY_EXTENSIONS if filename.endswith(ext)), None)
+        if extension is None:
+            return None
+        parts = filename.removesuffix(extension).split('-')
+        name = str(NormalizedName('pypi', self._name))
+        for idx, version_part in enumerate(parts[1:], start=1):
+            project = str(NormalizedName('pypi', '-'.join(parts[:idx])))
+            if project == name:
+                return self._leading_version(version_part)
+        return None
+
+    def _leading_version(self, candidate: str) -> Version | None:
+        # Platform may follow version after dot, like `1.0.win32`
+        while candidate:
+            with suppress(InvalidVersion):
+                return Version(candidate)
+            candidate = candidate.rpartition('.')[0]
+        return None
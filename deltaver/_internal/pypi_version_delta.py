@@ -11,8 +11,11 @@ from packaging import version
 from typing_extensions import override
 
 from deltaver._internal.exceptions import TargetGreaterLastError, VersionNotFoundError
+from deltaver._internal.package_record import PackageRecord
 from deltaver._internal.sorted_versions import SortedVersions
 from deltaver._internal.version_delta import VersionDelta
+from deltaver._internal.version_index import VersionIndex
+from deltaver._internal.version_key import VersionKey
 
 
 @final
@@ -24,35 +27,28 @@ class PypiVersionDelta(VersionDelta):
     _version: str
 
     @override
-    def days(self) -> int:  # noqa: C901, WPS210, WPS231. TODO
+    def days(self) -> int:  # noqa: WPS210
         """Delta in days."""
         parsed_version = version.parse(self._version)
         if parsed_version.pre or parsed_version.dev:
             return 0
-        sorted_versions = self._sorted_versions.fetch()
-        if not sorted_versions:
+        releases = [
+            next(iter(release_info.items()))
+            for release_info in self._sorted_versions.fetch()
+        ]
+        if not releases:
             return 0
-        last_version_number = version.parse(
-            next(iter(list(sorted_versions[-1].keys()))),
-        )
-        if version.parse(self._version) > last_version_number:
+        target = VersionKey('pypi', self._version).key()
+        latest = VersionKey('pypi', releases[-1][0]).key()
+        if target > latest:
             raise TargetGreaterLastError
-        if next(iter(sorted_versions[-1].keys())) == self._version:
+        if target == latest:
             return 0
-        start = None
-        next_available_release = None
-        flag = False
-        for release_info in sorted_versions:
-            release_number = next(iter(release_info.keys()))
-            if flag:
-                next_available_release = release_number
-                break
-            if release_number == self._version:
-                flag = True
-        for item in sorted_versions:  # noqa: WPS110, rename
-            release, upload_time = next(iter(item.items()))
-            if release == next_available_release:
-                start = upload_time
-        if not start:
+        successor = VersionIndex.ctor([
+            PackageRecord.ctor('', release_number, upload_time)
+            for release_number, upload_time in releases
+        ]).successor(target)
+        if successor is None:
             raise VersionNotFoundError
-        return (datetime.datetime.now(tz=datetime.timezone.utc).date() - start).days
+        today = datetime.datetime.now(tz=datetime.timezone.utc).date()
+        return (today - successor.release_date()).days
@@ -23,11 +23,12 @@ class PypiVersionsSortedBySemver(SortedVersions):
 
     _artifactory_domain: str
     _package_name: str
+    _client: httpx.Client
 
     @override
     def fetch(self) -> SortedVersionsList:  # noqa: WPS210. TODO
         """Sorted versions list."""
-        response = httpx.get(
+        response = self._client.get(
             httpx.URL(self._artifactory_domain).join('pypi/{0}/json'.format(self._package_name)),
         )
         response.raise_for_status()
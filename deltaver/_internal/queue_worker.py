@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Worker resolving lookups of shared work queue."""
+
+import asyncio
+import time
+from contextlib import ExitStack
+from functools import partial
+from typing import final
+
+import attrs
+import httpx
+
+from deltaver._internal.concurrent_scan import ConcurrentScan
+from deltaver._internal.config import ScanOptions
+from deltaver._internal.delta import Delta
+from deltaver._internal.failsafe_delta import FailsafeDelta
+from deltaver._internal.formats import Formats
+from deltaver._internal.host_limits import HostLimits
+from deltaver._internal.merged_scans import MergedScans
+from deltaver._internal.registry_deltas import RegistryDeltas
+from deltaver._internal.scan_context import ScanContext
+from deltaver._internal.sqlite_cache import SqliteCache
+from deltaver._internal.work_queue import WorkQueue
+
+_Leased = list[tuple[int, Formats, str, str]]
+_Ids = dict[tuple[int, str, str], int]
+
+
+@final
+@attrs.define(frozen=True)
+class QueueWorker:
+    """Worker resolving lookups of shared work queue.
+
+    Worker leases batch of lookups, computes deltas with registries
+    of all ecosystems of batch concurrently and saves them to queue.
+    Failed lookup does not stop worker, it returned to queue
+    for another attempt with other lookups not resolved.
+    Worker stops when no lookups left to resolve.
+    """
+
+    _queue: WorkQueue
+    _worker: str
+    _client: httpx.Client
+    _options: ScanOptions
+    _batch: int = 32
+    _lease: float = 300
+    _poll: float = 5
+    _context: ScanContext = attrs.field(factory=ScanContext)
+
+    def run(self) -> int:
+        """Resolve lookups until queue drained, count of resolved lookups."""
+        resolved = 0
+        with ExitStack() as stack:
+            cache = self._context.cache(stack, self._options)
+            while self._queue.pending() and not self._context.deadline().expired():
+                leased = self._queue.lease(self._worker, self._batch, self._lease)
+                if not leased:
+                    time.sleep(self._poll)
+                    continue
+                resolved += self._resolved(leased, cache)
+        return resolved
+
+    def _resolved(self, leased: _Leased, cache: SqliteCache) -> int:
+        try:
+            deltas = asyncio.run(self._deltas(leased, cache))
+        except BaseException:
+            self._queue.release([lookup[0] for lookup in leased])
+            raise
+        self._queue.complete(deltas)
+        self._queue.release([lookup[0] for lookup in leased])
+        return len(deltas)
+
+    async def _deltas(self, leased: _Leased, cache: SqliteCache) -> list[tuple[int, int]]:  # noqa: WPS210
+        file_formats = list(dict.fromkeys(lookup[1] for lookup in leased))
+        ids: _Ids = {}
+        scans = []
+        for scan_idx, file_format in enumerate(file_formats):
+            registry = RegistryDeltas.ctor(file_format, self._client, cache, self._options, self._context)
+            dependencies = []
+            for lookup_id, lookup_format, name, version in leased:
+                if lookup_format == file_format:
+                    ids[scan_idx, name, version] = lookup_id
+                    dependencies.append((name, version))
+            scans.append(ConcurrentScan(
+                dependencies,
+                partial(self._delta, registry),
+                registry.host(),
+                HostLimits.ctor(self._options.get('concurrency')),
+                deadline=self._context.deadline(),
+            ))
+        return [
+            (ids[found_idx, found_name, found_version], delta)
+            async for found_idx, (found_name, found_version, delta) in MergedScans(scans).stream()
+            if delta > -1
+        ]
+
+    def _delta(self, registry: RegistryDeltas, name: str, version: str) -> Delta:
+        return FailsafeDelta(registry.delta(name, version), name, version)
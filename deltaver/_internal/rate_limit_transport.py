@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Transport with adaptive rate limit of registry hosts."""
+
+import datetime
+import time
+from email.utils import parsedate_to_datetime
+from typing import final
+
+import attrs
+import httpx
+from typing_extensions import override
+
+from deltaver._internal.deadline import Deadline
+from deltaver._internal.exceptions import DeadlineExceededError
+from deltaver._internal.host_rate_limit import HostRateLimit
+
+_THROTTLED = frozenset((httpx.codes.TOO_MANY_REQUESTS, httpx.codes.SERVICE_UNAVAILABLE))
+_MAX_RETRY_AFTER = 60
+
+
+@final
+@attrs.define(frozen=True)
+class RateLimitTransport(httpx.BaseTransport):
+    """Transport with adaptive rate limit of registry hosts.
+
+    Requests wait for token of host. Responses 429 and 503 slow host down
+    and retried after `Retry-After` seconds or exponential backoff.
+    Response returned as is when retries exhausted or registry asks
+    to wait longer than minute.
+    """
+
+    _origin: httpx.BaseTransport
+    _limit: HostRateLimit
+    _deadline: Deadline
+    _retries: int = 3
+
+    @override
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send request."""
+        host = request.url.host
+        for attempt in range(self._retries + 1):
+            delay = self._limit.wait(host)
+            while delay:
+                self._sleep(delay)
+                delay = self._limit.wait(host)
+            response = self._origin.handle_request(request)
+            if response.status_code not in _THROTTLED:
+                self._limit.succeeded(host)
+                return response
+            retry_after = self._retry_after(response, attempt)
+            self._limit.throttled(host, retry_after)
+            if attempt == self._retries or retry_after > _MAX_RETRY_AFTER:
+                return response
+            response.close()
+        return response
+
+    @override
+    def close(self) -> None:
+        """Close transport."""
+        self._origin.close()
+
+    def _sleep(self, seconds: float) -> None:
+        remaining = self._deadline.remaining()
+        if remaining is not None and seconds >= remaining:
+            raise DeadlineExceededError
+        time.sleep(seconds)
+
+    def _retry_after(self, response: httpx.Response, attempt: int) -> float:
+        header = response.headers.get('retry-after', '')
+        if header.isdigit():
+            return float(header)
+        try:
+            delay = parsedate_to_datetime(header) - datetime.datetime.now(tz=datetime.timezone.utc)
+        except (TypeError, ValueError):
+            return float(2 ** attempt)
+        return max(delay.total_seconds(), 0)
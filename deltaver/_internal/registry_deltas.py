@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Deltas of dependencies from registry."""
+
+import datetime
+import threading
+from typing import final
+
+import attrs
+import httpx
+import pytz
+
+from deltaver._internal.cached_package_list import CachedPackageList
+from deltaver._internal.cached_sorted_versions import CachedSortedVersions
+from deltaver._internal.cached_successor_list import CachedSuccessorList
+from deltaver._internal.config import ScanOptions
+from deltaver._internal.days_delta import DaysDelta
+from deltaver._internal.delta import Delta
+from deltaver._internal.filtered_package_list import FilteredPackageList
+from deltaver._internal.formats import Formats
+from deltaver._internal.golang_package import GolangPackage
+from deltaver._internal.golang_package_list import GolangPackageList
+from deltaver._internal.golang_tag_list import GolangTagList
+from deltaver._internal.hex_package_list import HexPackageList
+from deltaver._internal.npmjs_package_list import NpmjsPackageList
+from deltaver._internal.pinned_package_list import PinnedPackageList
+from deltaver._internal.pypi_package_list import PypiPackageList
+from deltaver._internal.pypi_simple_package_list import PypiSimplePackageList
+from deltaver._internal.scan_context import ScanContext
+from deltaver._internal.sorted_package_list import SortedPackageList
+from deltaver._internal.sqlite_cache import SqliteCache
+from deltaver._internal.stale_releases import StaleReleases
+from deltaver._internal.successor_package_list import SuccessorPackageList
+from deltaver._internal.version_list import VersionList
+from deltaver._internal.versions_memo import VersionsMemo
+
+
+@final
+@attrs.define(frozen=True)
+class RegistryDeltas:  # noqa: WPS214
+    """Deltas of dependencies from registry."""
+
+    _file_format: Formats
+    _today: datetime.date
+    _client: httpx.Client
+    _cache: SqliteCache
+    _memo: VersionsMemo
+    _options: ScanOptions
+    _golang_fanout: threading.Semaphore
+    _stale: StaleReleases
+
+    @classmethod
+    def ctor(
+        cls,
+        file_format: Formats,
+        client: httpx.Client,
+        cache: SqliteCache,
+        options: ScanOptions,
+        context: ScanContext,
+    ) -> 'RegistryDeltas':
+        """Ctor, deltas counted to today."""
+        return cls(
+            file_format,
+            datetime.datetime.now(tz=pytz.UTC).date(),
+            client,
+            cache,
+            context.memo(),
+            options,
+            threading.BoundedSemaphore(8),
+            context.stale(),
+        )
+
+    def ecosystem(self) -> str:
+        """Registry ecosystem."""
+        return self._file_format.ecosystem()
+
+    def host(self) -> str:
+        """Registry host."""
+        if self._pypi_simple():
+            return httpx.URL(self._pypi_index()).host
+        return {
+            Formats.npm_lock: 'registry.npmjs.org',
+            Formats.pip_freeze: 'pypi.org',
+            Formats.poetry_lock: 'pypi.org',
+            Formats.golang: 'proxy.golang.org',
+            Formats.mix_lock: 'hex.pm',
+        }[self._file_format]
+
+    def registry(self) -> str:
+        """Registry url."""
+        if self._pypi_simple():
+            return self._pypi_index().rstrip('/')
+        return 'https://{0}'.format(self.host())
+
+    def delta(self, name: str, version: str) -> Delta:
+        """Delta of one dependency."""
+        return DaysDelta(
+            version,
+            CachedSuccessorList(
+                self._versions(name, version),
+                self._cache,
+                self.ecosystem(),
+                self.registry(),
+                name,
+                version,
+            ),
+            self._today,
+            self.ecosystem(),
+        )
+
+    def _versions(self, name: str, version: str) -> VersionList:
+        golang_resolution = self._options.get('golang_resolution', 'successor')
+        if self._file_format == Formats.golang and golang_resolution == 'successor':
+            return SuccessorPackageList(
+                PinnedPackageList(
+                    SortedPackageList(
+                        FilteredPackageList(
+                            GolangTagList(name, self._client),
+                        ),
+                    ),
+                    GolangPackage(name, version, self._client),
+                ),
+                version,
+                self.ecosystem(),
+            )
+        pypi_list: VersionList = PypiPackageList(name, self._client)
+        if self._pypi_simple():
+            pypi_list = PypiSimplePackageList(name, self._client, self._pypi_index())
+        package_list: VersionList = {
+            Formats.npm_lock: NpmjsPackageList(name, self._client),
+            Formats.pip_freeze: pypi_list,
+            Formats.poetry_lock: pypi_list,
+            Formats.golang: GolangPackageList(name, self._client, self._golang_fanout),
+            Formats.mix_lock: HexPackageList(name, self._client),
+        }[self._file_format]
+        return CachedPackageList(
+            CachedSortedVersions(
+                package_list,
+                self._cache,
+                self.ecosystem(),
+                self.registry(),
+                name,
+                self._stale,
+                revalidate=self._options.get('revalidate', False),
+            ),
+            self._memo,
+            self.ecosystem(),
+            self.registry(),
+            name,
+        )
+
+    def _pypi_simple(self) -> bool:
+        pypi_formats = {Formats.pip_freeze, Formats.poetry_lock}
+        return self._file_format in pypi_formats and self._options.get('pypi_api', 'json') == 'simple'
+
+    def _pypi_index(self) -> str:
+        return self._options.get('index_url', 'https://pypi.org/simple')
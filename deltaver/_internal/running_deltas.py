@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Sum, max and average of deltas computed online."""
+
+import threading
+from collections import Counter
+from typing import final
+
+import attrs
+
+
+@final
+@attrs.define(frozen=True)
+class RunningDeltas:  # noqa: WPS214
+    """Sum, max and average of deltas computed online.
+
+    Rows not kept, only counters. Max delta per package name
+    kept only when lags enabled for lagging first order of next run.
+    Rows with delta -1 are unresolved and not counted in average.
+    """
+
+    _totals: Counter[str]
+    _lags: dict[str, int]
+    _lock: threading.Lock
+    _per_name: bool = attrs.field(default=False, kw_only=True)
+
+    @classmethod
+    def ctor(cls, *, lags: bool = False) -> 'RunningDeltas':
+        """Ctor, without lags memory does not grow with count of rows."""
+        return cls(Counter(), {}, threading.Lock(), per_name=lags)
+
+    def add(self, name: str, version: str, delta: int) -> None:
+        """Count row (name, version, delta)."""
+        with self._lock:
+            self._totals['packages'] += 1
+            if delta == -1:
+                self._totals['unresolved'] += 1
+            self._totals['sum'] += max(delta, 0)
+            self._totals['max'] = max(self._totals['max'], delta)
+            if self._per_name:
+                self._lags[name] = max(self._lags.get(name, 0), delta)
+
+    def total(self) -> int:
+        """Sum of deltas of resolved dependencies."""
+        return self._totals['sum']
+
+    def maximum(self) -> int:
+        """Max delta."""
+        return self._totals['max']
+
+    def average(self) -> float:
+        """Average delta of resolved dependencies."""
+        resolved = self._totals['packages'] - self._totals['unresolved']
+        if not resolved:
+            return 0
+        return round(self._totals['sum'] / resolved, 2)
+
+    def packages(self) -> int:
+        """Count of rows."""
+        return self._totals['packages']
+
+    def unresolved(self) -> int:
+        """Count of rows without delta."""
+        return self._totals['unresolved']
+
+    def lags(self) -> dict[str, int]:
+        """Max delta of every package name, empty without lags."""
+        with self._lock:
+            return dict(self._lags)
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Requirements of lockfile on disk or error of its parse."""
+
+from pathlib import Path
+from typing import final
+
+import attrs
+
+from deltaver._internal.excluded_reqs import ExcludedReqs
+from deltaver._internal.formats import Formats
+from deltaver._internal.lockfile_reqs import LockfileReqs
+
+_Reqs = list[tuple[str, str]]
+
+
+@final
+@attrs.define(frozen=True)
+class SafeLockfileReqs:
+    """Requirements of lockfile on disk or error of its parse.
+
+    Lockfile read and parsed in worker of parse pool,
+    error returned instead of raised, so one broken lockfile
+    does not stop scan of others.
+    """
+
+    _path: Path
+    _file_format: Formats
+    _excluded: list[str]
+    _ecosystem: str
+
+    def parsed(self) -> tuple[_Reqs, str | None]:
+        """Requirements and error, empty requirements on error."""
+        try:
+            return ExcludedReqs(
+                LockfileReqs(self._path.read_text(), self._file_format),
+                self._excluded,
+                self._ecosystem,
+            ).reqs(), None
+        except Exception as err:  # noqa: BLE001
+            return [], '{0}: {1}'.format(type(err).__name__, err)
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Collaborators of scan injected by caller."""
+
+import datetime
+from contextlib import ExitStack
+from pathlib import Path
+from typing import final
+
+import attrs
+import httpx
+
+from deltaver._internal.config import ScanOptions
+from deltaver._internal.deadline import Deadline
+from deltaver._internal.host_rate_limit import HostRateLimit
+from deltaver._internal.pooled_client import PooledClient
+from deltaver._internal.sqlite_cache import SqliteCache
+from deltaver._internal.stale_releases import StaleReleases
+from deltaver._internal.streamed_output import StreamedOutput
+from deltaver._internal.versions_memo import VersionsMemo
+
+
+@final
+@attrs.define(frozen=True)
+class ScanContext:
+    """Collaborators of scan injected by caller.
+
+    Client and cache not passed created for one scan in `cache_dir`
+    and closed with it. Without memo of versions scans of process
+    share one memo keeping versions for five minutes.
+    """
+
+    _client: httpx.Client | None = None
+    _cache: SqliteCache | None = None
+    _memo: VersionsMemo = attrs.field(factory=VersionsMemo.shared)
+    _deadline: Deadline = attrs.field(factory=Deadline.ctor)
+    _stale: StaleReleases = attrs.field(factory=StaleReleases.ctor)
+    _output: StreamedOutput | None = None
+    _cache_dir: Path = Path('.deltaver_cache')  # noqa: WPS404
+
+    def client(self, stack: ExitStack, rate_limit: HostRateLimit) -> httpx.Client:
+        """Passed client or pooled client closed with stack."""
+        if self._client is not None:
+            return self._client
+        return stack.enter_context(PooledClient(10, self._deadline, rate_limit).client())
+
+    def cache(self, stack: ExitStack, options: ScanOptions) -> SqliteCache:
+        """Passed cache or cache of `cache_dir` closed with stack."""
+        if self._cache is not None:
+            return self._cache
+        cache = SqliteCache.ctor(
+            self._cache_dir,
+            datetime.timedelta(seconds=options.get('cache_ttl', 86400)),  # noqa: WPS432
+        )
+        stack.callback(cache.close)
+        return cache
+
+    def memo(self) -> VersionsMemo:
+        """Memo of versions."""
+        return self._memo
+
+    def deadline(self) -> Deadline:
+        """Time budget of scan."""
+        return self._deadline
+
+    def stale(self) -> StaleReleases:
+        """Releases resolved from expired cache."""
+        return self._stale
+
+    def output(self) -> StreamedOutput | None:
+        """Output of rows as they resolve, None to collect rows."""
+        return self._output
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Report of scan in terminal."""
+
+from typing import final
+
+import attrs
+from rich import print as rich_print
+from rich.console import Console
+from rich.table import Table
+
+from deltaver._internal.stale_releases import StaleReleases
+
+
+@final
+@attrs.define(frozen=True)
+class ScanReport:
+    """Report of scan in terminal.
+
+    Rows with delta -1 are dependencies unresolved before deadline
+    or with unavailable registry, they shown in table but not counted in average.
+    Deltas computed from expired cache marked with date of its fetch.
+    """
+
+    _packages: list[tuple[str, str, int]]
+    _sum_delta: int
+    _max_delta: int
+    _stale: StaleReleases = attrs.field(factory=StaleReleases.ctor)
+
+    @classmethod
+    def ctor(cls, packages: list[tuple[str, str, int]], stale: StaleReleases) -> 'ScanReport':
+        """Ctor, sum and max computed from rows."""
+        return cls(
+            packages,
+            sum(max(delta, 0) for _, _, delta in packages),
+            max((delta for _, _, delta in packages), default=0),
+            stale,
+        )
+
+    def maximum(self) -> int:
+        """Max delta."""
+        return self._max_delta
+
+    def average(self) -> float:
+        """Average delta of resolved dependencies."""
+        resolved = len(self._packages) - len(self._unresolved())
+        if not resolved:
+            return 0
+        return round(self._sum_delta / resolved, 2)
+
+    def print(self) -> None:
+        """Print table of outdated dependencies and summary."""
+        if self._packages:
+            Console().print(self._table())
+        unresolved = self._unresolved()
+        if unresolved:
+            rich_print('[yellow]{0} of {1} dependencies unresolved: {2}[/yellow]'.format(
+                len(unresolved),
+                len(self._packages),
+                ', '.join(unresolved),
+            ))
+        stale = self._stale.names()
+        if stale:
+            rich_print('[yellow]Registry unavailable, cached releases used: {0}[/yellow]'.format(
+                ', '.join(stale),
+            ))
+        rich_print('Max delta: {0}'.format(self._max_delta))
+        average = '0'
+        if len(unresolved) < len(self._packages):
+            average = '{0:.2f}'.format(self.average())
+        rich_print('Average delta: {0}'.format(average))
+
+    def _table(self) -> Table:
+        table = Table(show_header=True, header_style='bold magenta')
+        table.add_column('Package')
+        table.add_column('Version')
+        table.add_column('Delta (days)')
+        for package, version, delta in self._packages:
+            if delta == -1:
+                table.add_row(package, version, '[yellow]unresolved[/yellow]')
+            elif delta != 0:
+                table.add_row(package, version, self._delta(package, delta))
+        return table
+
+    def _delta(self, package: str, delta: int) -> str:
+        fetched = self._stale.fetched(package)
+        if fetched is None:
+            return str(delta)
+        return '{0} [yellow](stale, cached {1})[/yellow]'.format(delta, fetched.isoformat())
+
+    def _unresolved(self) -> list[str]:
+        return [package for package, _, delta in self._packages if delta == -1]
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Result of lockfile scan."""
+
+import datetime
+from typing import final
+
+import attrs
+
+from deltaver._internal.stale_releases import StaleReleases
+
+
+@final
+@attrs.define(frozen=True)
+class ScanResult:
+    """Result of lockfile scan.
+
+    Packages ordered by delta. Dependencies not resolved before deadline
+    or with unavailable registry have delta -1 and not counted in average.
+    """
+
+    _packages: list[tuple[str, str, int]]
+    _stale: StaleReleases
+
+    def packages(self) -> list[tuple[str, str, int]]:
+        """Packages (name, version, delta in days)."""
+        return list(self._packages)
+
+    def unresolved(self) -> list[str]:
+        """Names of dependencies without delta."""
+        return [name for name, _, delta in self._packages if delta == -1]
+
+    def stale(self) -> dict[str, datetime.date]:
+        """Dates of fetch of expired cache used for dependencies with unavailable registry."""
+        fetched = {name: self._stale.fetched(name) for name in self._stale.names()}
+        return {name: date for name, date in fetched.items() if date is not None}
+
+    def total(self) -> int:
+        """Sum of deltas of resolved dependencies."""
+        return sum(max(delta, 0) for _, _, delta in self._packages)
+
+    def maximum(self) -> int:
+        """Max delta."""
+        return max((delta for _, _, delta in self._packages), default=0)
+
+    def average(self) -> float:
+        """Average delta of resolved dependencies."""
+        resolved = [delta for _, _, delta in self._packages if delta > -1]
+        if not resolved:
+            return 0
+        return round(sum(resolved) / len(resolved), 2)
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Coalesced concurrent loads of version lists."""
+
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from typing import final
+
+import attrs
+
+from deltaver._internal.package import Package
+
+
+@final
+@attrs.define(frozen=True)
+class SingleFlight:
+    """Coalesced concurrent loads of version lists.
+
+    First caller of key loads version list, callers of same key
+    arrived before load finished wait for its result or error.
+    """
+
+    _flights: dict[tuple[str, str, str], Future[Sequence[Package]]]  # noqa: WPS234
+    _lock: threading.Lock
+
+    @classmethod
+    def ctor(cls) -> 'SingleFlight':
+        """Ctor."""
+        return cls({}, threading.Lock())
+
+    def loaded(
+        self,
+        key: tuple[str, str, str],
+        load: Callable[[], Sequence[Package]],
+    ) -> Sequence[Package]:
+        """Version list of one load per key."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = Future()
+                self._flights[key] = flight
+        if not leader:
+            return flight.result()
+        try:
+            packages = load()
+        except BaseException as err:
+            flight.set_exception(err)
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key)
+        flight.set_result(packages)
+        return packages
@@ -25,5 +25,5 @@ class SortedPackageList(VersionList):
         """List representation."""
         return sorted(
             self._origin.as_list(),
-            key=lambda pkg: pkg.version(),
+            key=lambda pkg: pkg.key(),
         )
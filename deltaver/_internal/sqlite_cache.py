@@ -0,0 +1,321 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Releases cache in sqlite database."""
+
+import datetime
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import final
+
+import attrs
+
+from deltaver._internal.normalized_name import NormalizedName
+
+_Key = tuple[str, str, str]
+
+
+@final
+@attrs.define(frozen=True)
+class SqliteCache:  # noqa: WPS214
+    """Releases cache in sqlite database.
+
+    Entry keyed by ecosystem, registry and normalized package name,
+    release dates stored as day ordinals. Daily json files
+    `<dir>/<package>/<date>.json` of previous versions migrated on read,
+    names with slashes like `@scope/name` kept in nested directories.
+    Successors of pinned versions never change, so they stored without expiration.
+    Lags of previous run kept to schedule most outdated dependencies first.
+    """
+
+    _dir: Path
+    _connection: sqlite3.Connection
+    _lock: threading.Lock
+    _ttl: datetime.timedelta
+
+    @classmethod
+    def ctor(cls, cache_dir: Path, ttl: datetime.timedelta) -> 'SqliteCache':  # noqa: WPS213
+        """Ctor."""
+        cache_dir.mkdir(exist_ok=True, parents=True)
+        connection = sqlite3.connect(
+            cache_dir / 'deltaver.sqlite3',
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(' '.join([
+            'CREATE TABLE IF NOT EXISTS releases (',
+            'ecosystem TEXT NOT NULL,',
+            'registry TEXT NOT NULL,',
+            'name TEXT NOT NULL,',
+            'expires_at INTEGER NOT NULL,',
+            'releases TEXT NOT NULL,',
+            "validators TEXT NOT NULL DEFAULT '{}',",
+            'fetched_at INTEGER NOT NULL DEFAULT 0,',
+            'PRIMARY KEY (ecosystem, registry, name))',
+        ]))
+        columns = {column[1] for column in connection.execute('PRAGMA table_info(releases)')}
+        if 'validators' not in columns:
+            connection.execute("ALTER TABLE releases ADD COLUMN validators TEXT NOT NULL DEFAULT '{}'")
+        if 'fetched_at' not in columns:
+            connection.execute('ALTER TABLE releases ADD COLUMN fetched_at INTEGER NOT NULL DEFAULT 0')
+            # Entries of previous versions fetched one ttl before expiration at best
+            connection.execute(
+                'UPDATE releases SET fetched_at = expires_at - ?',
+                (int(ttl.total_seconds()),),
+            )
+        connection.execute(' '.join([
+            'CREATE TABLE IF NOT EXISTS successors (',
+            'ecosystem TEXT NOT NULL,',
+            'registry TEXT NOT NULL,',
+            'name TEXT NOT NULL,',
+            'version TEXT NOT NULL,',
+            'successor TEXT NOT NULL,',
+            'release_date INTEGER NOT NULL,',
+            'PRIMARY KEY (ecosystem, registry, name, version))',
+        ]))
+        connection.execute(' '.join([
+            'CREATE TABLE IF NOT EXISTS lags (',
+            'ecosystem TEXT NOT NULL,',
+            'registry TEXT NOT NULL,',
+            'name TEXT NOT NULL,',
+            'delta INTEGER NOT NULL,',
+            'PRIMARY KEY (ecosystem, registry, name))',
+        ]))
+        cache = cls(cache_dir, connection, threading.Lock(), ttl)
+        cache.remove_outdated_files()
+        return cache
+
+    def releases(
+        self,
+        ecosystem: str,
+        registry: str,
+        name: str,
+    ) -> list[tuple[str, datetime.date]] | None:
+        """Not expired releases (version, release date) of package."""
+        row = self._row(ecosystem, registry, name)
+        if row is None:
+            return self._legacy_releases(ecosystem, registry, name)
+        if row[0] <= self._now().timestamp():
+            return None
+        return self._decoded(row[1])
+
+    def stale(
+        self,
+        ecosystem: str,
+        registry: str,
+        name: str,
+    ) -> tuple[list[tuple[str, datetime.date]], dict[str, str]] | None:  # noqa: WPS221
+        """Releases of package and validators of registry response regardless of expiration."""
+        row = self._row(ecosystem, registry, name)
+        if row is None:
+            return None
+        return self._decoded(row[1]), json.loads(row[2])
+
+    def fetched(self, ecosystem: str, registry: str, name: str) -> datetime.date | None:
+        """Date of last registry fetch of package releases."""
+        row = self._row(ecosystem, registry, name)
+        if row is None:
+            return None
+        return datetime.datetime.fromtimestamp(row[3], tz=datetime.timezone.utc).date()
+
+    def save(
+        self,
+        ecosystem: str,
+        registry: str,
+        name: str,
+        releases: list[tuple[str, datetime.date]],
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """Save releases of package."""
+        now = self._now()
+        expires_at = now + self._ttl
+        self._save((ecosystem, registry, name), releases, now, expires_at, validators or {})
+
+    def refresh(self, ecosystem: str, registry: str, name: str) -> None:
+        """Extend expiration of not modified releases."""
+        now = self._now()
+        with self._lock:
+            self._connection.execute(
+                ' '.join([
+                    'UPDATE releases SET expires_at = ?, fetched_at = ?',
+                    'WHERE ecosystem = ? AND registry = ? AND name = ?',
+                ]),
+                (
+                    int((now + self._ttl).timestamp()),
+                    int(now.timestamp()),
+                    ecosystem,
+                    registry,
+                    str(NormalizedName(ecosystem, name)),
+                ),
+            )
+
+    def successor(
+        self,
+        ecosystem: str,
+        registry: str,
+        name: str,
+        version: str,
+    ) -> tuple[str, datetime.date] | None:
+        """Next release (version, release date) after pinned version."""
+        with self._lock:
+            row = self._connection.execute(
+                ' '.join([
+                    'SELECT successor, release_date FROM successors',
+                    'WHERE ecosystem = ? AND registry = ? AND name = ? AND version = ?',
+                ]),
+                (ecosystem, registry, str(NormalizedName(ecosystem, name)), version),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], datetime.date.fromordinal(row[1])
+
+    def save_successor(
+        self,
+        ecosystem: str,
+        registry: str,
+        name: str,
+        version: str,
+        successor: tuple[str, datetime.date],
+    ) -> None:
+        """Save next release after pinned version."""
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO successors VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    ecosystem,
+                    registry,
+                    str(NormalizedName(ecosystem, name)),
+                    version,
+                    successor[0],
+                    successor[1].toordinal(),
+                ),
+            )
+
+    def lags(self, ecosystem: str, registry: str) -> dict[str, int]:
+        """Deltas of previous run by normalized package name."""
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT name, delta FROM lags WHERE ecosystem = ? AND registry = ?',
+                (ecosystem, registry),
+            ).fetchall()
+        return dict(rows)
+
+    def save_lags(self, ecosystem: str, registry: str, lags: dict[str, int]) -> None:
+        """Save deltas of run by package name."""
+        with self._lock:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO lags VALUES (?, ?, ?, ?)',
+                [
+                    (ecosystem, registry, str(NormalizedName(ecosystem, name)), delta)
+                    for name, delta in lags.items()
+                ],
+            )
+
+    def remove_outdated_files(self) -> None:
+        """Remove daily json files of previous days."""
+        expected_filename = '{0}.json'.format(self._now().date())
+        for cache_file in list(self._dir.glob('*/**/*.json')):
+            if cache_file.name != expected_filename:
+                cache_file.unlink(missing_ok=True)
+                self._remove_empty_dir(cache_file.parent)
+
+    def close(self) -> None:
+        """Close database."""
+        with self._lock:
+            self._connection.close()
+
+    def _save(  # noqa: WPS210
+        self,
+        key: _Key,
+        releases: list[tuple[str, datetime.date]],
+        fetched_at: datetime.datetime,
+        expires_at: datetime.datetime,
+        validators: dict[str, str],
+    ) -> None:
+        ecosystem, registry, name = key
+        payload = json.dumps([
+            (version, release_date.toordinal())
+            for version, release_date in releases
+        ])
+        with self._lock:
+            self._connection.execute(
+                ' '.join([
+                    'INSERT OR REPLACE INTO releases',
+                    '(ecosystem, registry, name, expires_at, releases, validators, fetched_at)',
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                ]),
+                (
+                    ecosystem,
+                    registry,
+                    str(NormalizedName(ecosystem, name)),
+                    int(expires_at.timestamp()),
+                    payload,
+                    json.dumps(validators),
+                    int(fetched_at.timestamp()),
+                ),
+            )
+
+    def _legacy_releases(
+        self,
+        ecosystem: str,
+        registry: str,
+        name: str,
+    ) -> list[tuple[str, datetime.date]] | None:
+        today = self._now().date()
+        legacy_file = self._dir / name / '{0}.json'.format(today)
+        if not legacy_file.exists():
+            return None
+        tomorrow = today + datetime.timedelta(days=1)
+        try:
+            releases = [
+                (
+                    next(iter(package_info.keys())),
+                    datetime.datetime.strptime(
+                        next(iter(package_info.values())),
+                        '%Y-%m-%dT%H:%M:%S',
+                    ).replace(tzinfo=datetime.timezone.utc).date(),
+                )
+                for package_info in json.loads(legacy_file.read_text())
+            ]
+        except (ValueError, AttributeError, StopIteration):
+            return None
+        else:
+            self._save(
+                (ecosystem, registry, name),
+                releases,
+                datetime.datetime.combine(today, datetime.time(), datetime.timezone.utc),
+                datetime.datetime.combine(tomorrow, datetime.time(), datetime.timezone.utc),
+                {},
+            )
+            return releases
+        finally:
+            legacy_file.unlink(missing_ok=True)
+            self._remove_empty_dir(legacy_file.parent)
+
+    def _row(self, ecosystem: str, registry: str, name: str) -> tuple[int, str, str, int] | None:  # noqa: WPS221
+        with self._lock:
+            return self._connection.execute(
+                ' '.join([
+                    'SELECT expires_at, releases, validators, fetched_at FROM releases',
+                    'WHERE ecosystem = ? AND registry = ? AND name = ?',
+                ]),
+                (ecosystem, registry, str(NormalizedName(ecosystem, name))),
+            ).fetchone()
+
+    def _decoded(self, payload: str) -> list[tuple[str, datetime.date]]:
+        return [
+            (version, datetime.date.fromordinal(ordinal))
+            for version, ordinal in json.loads(payload)
+        ]
+
+    def _remove_empty_dir(self, directory: Path) -> None:
+        while directory != self._dir and not any(directory.iterdir()):
+            directory.rmdir()
+            directory = directory.parent
+
+    def _now(self) -> datetime.datetime:
+        return datetime.datetime.now(tz=datetime.timezone.utc)
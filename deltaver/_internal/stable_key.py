@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Version key of stable release."""
+
+import string
+from typing import Any, final
+
+import attrs
+
+_LETTERS = frozenset(string.ascii_letters)
+_RELEASE = (1,)
+
+
+@final
+@attrs.define(frozen=True)
+class StableKey:
+    """Version key of stable release.
+
+    PEP 440 versions with letters (pre, post, dev and local releases)
+    are not stable, semver versions are not stable with pre-release part only.
+    """
+
+    _key: tuple[Any, ...]
+
+    def stable(self) -> bool:
+        """Key of stable release."""
+        if len(self._key) == 1:
+            return _LETTERS.isdisjoint(str(self._key[0]))
+        return self._key[-1] == _RELEASE
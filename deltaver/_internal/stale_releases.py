@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Packages resolved from expired cache entries."""
+
+import datetime
+import threading
+from typing import final
+
+import attrs
+
+
+@final
+@attrs.define(frozen=True)
+class StaleReleases:
+    """Packages resolved from expired cache entries.
+
+    Registry of package was unavailable, release list of previous run used.
+    """
+
+    _fetched: dict[str, datetime.date]
+    _lock: threading.Lock
+
+    @classmethod
+    def ctor(cls) -> 'StaleReleases':
+        """Ctor."""
+        return cls({}, threading.Lock())
+
+    def add(self, name: str, fetched: datetime.date) -> None:
+        """Mark package resolved from releases fetched at date."""
+        with self._lock:
+            self._fetched[name] = fetched
+
+    def fetched(self, name: str) -> datetime.date | None:
+        """Date of stale releases fetch, None for fresh package."""
+        with self._lock:
+            return self._fetched.get(name)
+
+    def names(self) -> list[str]:
+        """Names of stale packages."""
+        with self._lock:
+            return sorted(self._fetched)
@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Members of nested json object read from stream."""
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, final
+
+import attrs
+
+from deltaver._internal.json_scanner import JsonScanner
+
+
+@final
+@attrs.define(frozen=True)
+class StreamedJsonMembers:
+    """Members of nested json object read from stream.
+
+    Only members of object on `path` decoded,
+    reading stops after the object.
+    """
+
+    _chunks: Iterable[bytes]
+    _path: Sequence[str]
+
+    def members(self) -> Iterator[tuple[str, Any]]:
+        """Pairs (key, decoded value)."""
+        yield from self._members(JsonScanner.ctor(self._chunks), self._path)
+
+    def _members(self, scanner: JsonScanner, path: Sequence[str]) -> Iterator[tuple[str, Any]]:
+        for key in scanner.member_names():
+            if path and key == path[0]:
+                yield from self._members(scanner, path[1:])
+                return
+            if path:
+                scanner.skip()
+            else:
+                yield key, scanner.decoded()
+        if path:
+            raise KeyError(path[0])
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Scan results written as JSON while scan runs."""
+
+import json
+from collections.abc import AsyncIterator
+from typing import TextIO, final
+
+import attrs
+
+from deltaver._internal.running_deltas import RunningDeltas
+from deltaver._internal.stale_releases import StaleReleases
+
+_Row = tuple[str, str, int]
+
+
+@final
+@attrs.define(frozen=True)
+class StreamedOutput:
+    """Scan results written as JSON while scan runs.
+
+    With `per_row` every row written and flushed as JSON line as soon as
+    it resolved, summary line written last. Without it only summary written.
+    """
+
+    _output: TextIO
+    _stale: StaleReleases
+    _deltas: RunningDeltas = attrs.field(factory=RunningDeltas.ctor)
+    _per_row: bool = attrs.field(default=False, kw_only=True)
+
+    async def written(self, rows: AsyncIterator[_Row]) -> RunningDeltas:
+        """Write rows and summary, deltas of written rows."""
+        async for name, version, delta in rows:
+            self._deltas.add(name, version, delta)
+            if self._per_row:
+                fetched = self._stale.fetched(name)
+                self._line({
+                    'type': 'package',
+                    'name': name,
+                    'version': version,
+                    'delta': delta,
+                    'stale': None if fetched is None else fetched.isoformat(),
+                })
+        summary: dict[str, object] = {
+            'packages': self._deltas.packages(),
+            'unresolved': self._deltas.unresolved(),
+            'sum_delta': self._deltas.total(),
+            'max_delta': self._deltas.maximum(),
+            'average_delta': self._deltas.average(),
+        }
+        if self._per_row:
+            summary = {'type': 'summary', **summary}
+        self._line(summary)
+        return self._deltas
+
+    def _line(self, record: dict[str, object]) -> None:
+        self._output.write('{0}\n'.format(json.dumps(record)))
+        self._output.flush()
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Target package with the next released version."""
+
+from collections.abc import Sequence
+from contextlib import suppress
+from typing import final
+
+import attrs
+from typing_extensions import override
+
+from deltaver._internal.dated_package import DatedPackage
+from deltaver._internal.exceptions import VersionNotFoundError
+from deltaver._internal.package import Package
+from deltaver._internal.version_key import VersionKey
+from deltaver._internal.version_list import VersionList
+
+
+@final
+@attrs.define(frozen=True)
+class SuccessorPackageList(VersionList):
+    """Target package with the next released version.
+
+    Release date requested only for the successor of target,
+    versions without release date skipped.
+    """
+
+    _origin: VersionList
+    _version: str
+    _ecosystem: str = 'pypi'
+
+    @override
+    def as_list(self) -> Sequence[Package]:
+        """List representation."""
+        target_key = VersionKey(self._ecosystem, self._version).key()
+        packages = iter(self._origin.as_list())
+        target = next((pkg for pkg in packages if pkg.key() == target_key), None)
+        if target is None:
+            return []
+        for successor in packages:
+            with suppress(VersionNotFoundError):
+                return [target, DatedPackage.ctor(successor)]
+        return [target]
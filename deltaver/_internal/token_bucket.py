@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Token bucket with AIMD refill rate."""
+
+from collections.abc import Sequence
+from typing import final
+
+import attrs
+
+_INITIAL_RATE = 100.0
+_MAX_RATE = 1000.0
+_MIN_RATE = 0.5
+
+
+@final
+@attrs.define(frozen=True)
+class TokenBucket:  # noqa: WPS214
+    """Token bucket with AIMD refill rate.
+
+    Bucket holds up to one second of tokens. Rate grows by one request
+    per second for every `rate` successful responses and halves on throttling.
+    """
+
+    _rate: float
+    _tokens: float
+    _stamp: float
+    _blocked_until: float
+
+    @classmethod
+    def ctor(cls, now: float) -> 'TokenBucket':
+        """Ctor."""
+        return cls(_INITIAL_RATE, _INITIAL_RATE, now, 0)
+
+    @classmethod
+    def loaded(cls, state: Sequence[float]) -> 'TokenBucket':
+        """Bucket from state."""
+        return cls(*state)
+
+    def state(self) -> list[float]:
+        """Serializable state."""
+        return [self._rate, self._tokens, self._stamp, self._blocked_until]
+
+    def refilled(self, now: float) -> 'TokenBucket':
+        """Bucket with tokens accumulated by now."""
+        elapsed = max(now - self._stamp, 0)
+        return TokenBucket(
+            self._rate,
+            min(self._tokens + elapsed * self._rate, self._rate),
+            max(now, self._stamp),
+            self._blocked_until,
+        )
+
+    def delay(self) -> float:
+        """Seconds before token available."""
+        blocked = self._blocked_until - self._stamp
+        if blocked > 0:
+            return blocked
+        return max(1 - self._tokens, 0) / self._rate
+
+    def taken(self) -> 'TokenBucket':
+        """Bucket without one token."""
+        return TokenBucket(self._rate, self._tokens - 1, self._stamp, self._blocked_until)
+
+    def increased(self) -> 'TokenBucket':
+        """Bucket with additively increased rate."""
+        return TokenBucket(
+            min(self._rate + 1 / self._rate, _MAX_RATE),
+            self._tokens,
+            self._stamp,
+            self._blocked_until,
+        )
+
+    def decreased(self, retry_after: float) -> 'TokenBucket':
+        """Bucket with halved rate, blocked for retry after seconds."""
+        rate = max(self._rate / 2, _MIN_RATE)
+        return TokenBucket(
+            rate,
+            min(self._tokens, rate),
+            self._stamp,
+            max(self._blocked_until, self._stamp + retry_after),
+        )
+
+    def merged(self, other: 'TokenBucket') -> 'TokenBucket':
+        """More recently refilled of buckets, blocked while any of them blocked."""
+        mine, theirs = self.state(), other.state()
+        recent = mine if mine[2] >= theirs[2] else theirs
+        blocked_until = max(mine[3], theirs[3])
+        return TokenBucket.loaded([*recent[:3], blocked_until])
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Index of package releases."""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any, final, overload
+
+import attrs
+from typing_extensions import override
+
+from deltaver._internal.package import Package
+
+
+@final
+@attrs.define(frozen=True)
+class VersionIndex(Sequence[Package]):
+    """Index of package releases.
+
+    Releases keep order of origin list, comparison keys of versions
+    looked up by bisection of sorted copy, release dates are not requested
+    until package returned. Index is sequence of releases itself,
+    so memoized index serves lookups of all pinned versions of package.
+    """
+
+    _packages: tuple[Package, ...]
+    _keys: tuple[tuple[Any, ...], ...]
+    _positions: tuple[int, ...]
+
+    @classmethod
+    def ctor(cls, packages: Sequence[Package]) -> 'VersionIndex':
+        """Ctor."""
+        keys = [package.key() for package in packages]
+        positions = sorted(range(len(keys)), key=keys.__getitem__)
+        return cls(
+            tuple(packages),
+            tuple(keys[position] for position in positions),
+            tuple(positions),
+        )
+
+    @classmethod
+    def of(cls, packages: Sequence[Package]) -> 'VersionIndex':
+        """Index of releases, built only when releases are not index already."""
+        if isinstance(packages, VersionIndex):
+            return packages
+        return cls.ctor(packages)
+
+    @overload
+    def __getitem__(self, idx: int) -> Package:
+        """Release by position."""
+
+    @overload
+    def __getitem__(self, idx: slice) -> Sequence[Package]:
+        """Releases of positions."""
+
+    @override
+    def __getitem__(self, idx: int | slice) -> Package | Sequence[Package]:
+        """Release by position in origin list."""
+        return self._packages[idx]
+
+    @override
+    def __len__(self) -> int:
+        """Count of releases."""
+        return len(self._packages)
+
+    def position(self, key: tuple[Any, ...]) -> int | None:
+        """Position of release in origin list."""
+        idx = bisect_left(self._keys, key)
+        if idx == len(self._keys) or self._keys[idx] != key:
+            return None
+        return self._positions[idx]
+
+    def successor(self, key: tuple[Any, ...]) -> Package | None:
+        """Release next to released version."""
+        position = self.position(key)
+        if position is None or position + 1 == len(self._packages):
+            return None
+        return self._packages[position + 1]
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Comparison key of version by ecosystem rules."""
+
+import re
+from functools import lru_cache
+from typing import Any, final
+
+import attrs
+
+from deltaver._internal.exceptions import InvalidVersionError
+from deltaver._internal.parsed_version import ParsedVersion
+
+_SEMVER = re.compile(
+    r'v?(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)'
+    r'(?:-(?P<pre>[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?'
+    r'(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?',
+)
+_SEMVER_ECOSYSTEMS = frozenset(('npm', 'hex', 'golang'))
+_RELEASE = (1,)
+
+
+def _prerelease(pre: str | None) -> tuple[Any, ...]:
+    if pre is None:
+        return _RELEASE
+    return (0, *(
+        (0, int(identifier)) if identifier.isdigit() else (1, identifier)
+        for identifier in pre.split('.')
+    ))
+
+
+@lru_cache(maxsize=65536)  # noqa: WPS432
+def _semver(version: str) -> tuple[Any, ...] | None:
+    match = _SEMVER.fullmatch(version)
+    if match is None:
+        return None
+    release = tuple(map(int, match.group('major', 'minor', 'patch')))
+    return (*release, _prerelease(match['pre']))
+
+
+@final
+@attrs.define(frozen=True)
+class VersionKey:
+    """Comparison key of version by ecosystem rules.
+
+    Npm and hex versions ordered by semver 2.0 precedence, golang
+    by module rules: semver with "v" prefix, pseudo-versions are
+    pre-releases of base version, "+incompatible" ignored as build metadata.
+    Other ecosystems ordered by PEP 440.
+    """
+
+    _ecosystem: str
+    _version: str
+
+    def key(self) -> tuple[Any, ...]:
+        """Tuple comparable with keys of same ecosystem."""
+        if self._ecosystem not in _SEMVER_ECOSYSTEMS:
+            return (ParsedVersion(self._version).parse(),)
+        semver = _semver(self._version)
+        if semver is None:
+            raise InvalidVersionError(self._version)
+        return semver
+
+    def valid(self) -> bool:
+        """Version valid."""
+        try:
+            self.key()
+        except InvalidVersionError:
+            return False
+        else:
+            return True
@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Bounded in-process memo of version lists."""
+
+import math
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Sequence
+from typing import final
+
+import attrs
+
+from deltaver._internal.normalized_name import NormalizedName
+from deltaver._internal.package import Package
+from deltaver._internal.single_flight import SingleFlight
+
+
+@final
+@attrs.define(frozen=True)
+class VersionsMemo:  # noqa: WPS214
+    """Bounded in-process memo of version lists.
+
+    Entries keyed by ecosystem, registry and normalized package name.
+    Least recently used entries evicted when entries count or their
+    approximate size in bytes exceed limits.
+    Concurrent loads of one entry coalesced, so every package fetched once.
+    Entries older than ttl seconds loaded again.
+    """
+
+    _entries: OrderedDict[tuple[str, str, str], tuple[Sequence[Package], int, float]]  # noqa: WPS234
+    _lock: threading.Lock
+    _stats: Counter[str]
+    _size: list[int]
+    _max_entries: int
+    _max_bytes: int
+    _ttl: float
+    _flight: SingleFlight
+
+    @classmethod
+    def ctor(
+        cls,
+        max_entries: int = 4096,
+        max_bytes: int = 67108864,  # noqa: WPS432
+        ttl: float = math.inf,
+    ) -> 'VersionsMemo':
+        """Ctor."""
+        return cls(
+            OrderedDict(),
+            threading.Lock(),
+            Counter(),
+            [0],
+            max_entries,
+            max_bytes,
+            ttl,
+            SingleFlight.ctor(),
+        )
+
+    @classmethod
+    def shared(cls) -> 'VersionsMemo':
+        """Memo shared by scans of process, entries kept for five minutes."""
+        return _SHARED
+
+    def loaded(
+        self,
+        ecosystem: str,
+        registry: str,
+        name: str,
+        load: Callable[[], Sequence[Package]],
+    ) -> Sequence[Package]:
+        """Memoized version list, loaded once on miss."""
+        memoized = self.packages(ecosystem, registry, name)
+        if memoized is not None:
+            return memoized
+        key = (ecosystem, registry, str(NormalizedName(ecosystem, name)))
+        return self._flight.loaded(key, lambda: self._saved(key, load))
+
+    def packages(self, ecosystem: str, registry: str, name: str) -> Sequence[Package] | None:
+        """Memoized version list."""
+        key = (ecosystem, registry, str(NormalizedName(ecosystem, name)))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] <= time.monotonic():
+                self._stats['misses'] += 1
+                return None
+            self._stats['hits'] += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def save(self, ecosystem: str, registry: str, name: str, packages: Sequence[Package]) -> None:
+        """Memoize version list."""
+        key = (ecosystem, registry, str(NormalizedName(ecosystem, name)))
+        size = sum(sys.getsizeof(package) for package in packages)
+        size += sys.getsizeof(packages)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size[0] -= previous[1]
+            self._entries[key] = (packages, size, time.monotonic() + self._ttl)
+            self._size[0] += size
+            while len(self._entries) > self._max_entries or self._size[0] > self._max_bytes:  # noqa: WPS221
+                evicted = self._entries.popitem(last=False)
+                self._size[0] -= evicted[1][1]
+                self._stats['evictions'] += 1
+
+    def hits(self) -> int:
+        """Lookups served from memo."""
+        return self._stats['hits']
+
+    def misses(self) -> int:
+        """Lookups not found in memo."""
+        return self._stats['misses']
+
+    def _saved(
+        self,
+        key: tuple[str, str, str],
+        load: Callable[[], Sequence[Package]],
+    ) -> Sequence[Package]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[2] > time.monotonic():
+            return entry[0]
+        packages = load()
+        self.save(*key, packages)
+        return packages
+
+
+_SHARED = VersionsMemo.ctor(ttl=300)  # noqa: WPS432
@@ -22,11 +22,12 @@ class VersionsSortedByDate(SortedVersions):
     """Versions sorted by date."""
 
     _package_name: str
+    _client: httpx.Client
 
     @override
     def fetch(self) -> SortedVersionsList:
         """Sorted versions list."""
-        response = httpx.get('https://pypi.org/pypi/{0}/json'.format(self._package_name))
+        response = self._client.get('https://pypi.org/pypi/{0}/json'.format(self._package_name))
         response.raise_for_status()
         versions = list(response.json()['releases'].items())
         correct_versions = []
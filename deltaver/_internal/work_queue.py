@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Durable queue of dependency lookups in sqlite database."""
+
+import sqlite3
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import final
+
+import attrs
+
+from deltaver._internal.formats import Formats
+from deltaver._internal.normalized_name import NormalizedName
+
+_Reqs = list[tuple[str, str]]
+_Rows = list[tuple[str, str, int]]
+_Lockfile = tuple[str, Path, Formats, _Reqs]
+_Leased = tuple[int, Formats, str, str]
+
+
+@final
+@attrs.define(frozen=True)
+class WorkQueue:  # noqa: WPS214
+    """Durable queue of dependency lookups in sqlite database.
+
+    Lookups of all published lockfiles deduplicated by ecosystem,
+    normalized name and version. Workers lease lookups for limited time,
+    lookups of crashed workers leased again after expiration.
+    Lookup failed `max_attempts` times stays unresolved.
+    Database file may be shared by workers of many nodes,
+    every lease made in exclusive transaction.
+    """
+
+    _connection: sqlite3.Connection
+    _max_attempts: int
+
+    @classmethod
+    def ctor(cls, path: Path, max_attempts: int = 3) -> 'WorkQueue':
+        """Ctor."""
+        connection = sqlite3.connect(path, timeout=60, isolation_level=None)
+        connection.execute(' '.join([
+            'CREATE TABLE IF NOT EXISTS lookups (',
+            'id INTEGER PRIMARY KEY,',
+            'ecosystem TEXT NOT NULL,',
+            'name TEXT NOT NULL,',
+            'version TEXT NOT NULL,',
+            'dependency TEXT NOT NULL,',
+            'file_format TEXT NOT NULL,',
+            'attempts INTEGER NOT NULL DEFAULT 0,',
+            'leased_until REAL NOT NULL DEFAULT 0,',
+            'worker TEXT,',
+            'delta INTEGER,',
+            'UNIQUE (ecosystem, name, version))',
+        ]))
+        connection.execute(' '.join([
+            'CREATE TABLE IF NOT EXISTS lockfiles (',
+            'id INTEGER PRIMARY KEY,',
+            'repo TEXT NOT NULL,',
+            'path TEXT NOT NULL,',
+            'file_format TEXT NOT NULL)',
+        ]))
+        connection.execute(' '.join([
+            'CREATE TABLE IF NOT EXISTS dependencies (',
+            'lockfile_id INTEGER NOT NULL REFERENCES lockfiles (id),',
+            'lookup_id INTEGER NOT NULL REFERENCES lookups (id),',
+            'name TEXT NOT NULL,',
+            'version TEXT NOT NULL)',
+        ]))
+        return cls(connection, max_attempts)
+
+    def publish(self, lockfiles: Sequence[_Lockfile]) -> None:  # noqa: WPS210
+        """Publish lookups of lockfiles (repo, path, format, requirements)."""
+        with self._transaction():
+            for repo, path, file_format, reqs in lockfiles:
+                lockfile_id = self._connection.execute(
+                    'INSERT INTO lockfiles (repo, path, file_format) VALUES (?, ?, ?)',
+                    (repo, str(path), file_format.value),
+                ).lastrowid
+                for name, version in reqs:
+                    self._connection.execute(
+                        'INSERT INTO dependencies (lockfile_id, lookup_id, name, version) VALUES (?, ?, ?, ?)',
+                        (lockfile_id, self._lookup(file_format, name, version), name, version),
+                    )
+
+    def lease(self, worker: str, count: int, seconds: float) -> list[_Leased]:  # noqa: WPS210
+        """Lease not resolved lookups (id, format, name, version) for seconds."""
+        now = time.time()
+        with self._transaction():
+            rows = self._connection.execute(
+                ' '.join([
+                    'SELECT id, file_format, dependency, version FROM lookups',
+                    'WHERE delta IS NULL AND attempts < ? AND leased_until < ?',
+                    'ORDER BY id LIMIT ?',
+                ]),
+                (self._max_attempts, now, count),
+            ).fetchall()
+            self._connection.executemany(
+                'UPDATE lookups SET attempts = attempts + 1, leased_until = ?, worker = ? WHERE id = ?',
+                [(now + seconds, worker, row[0]) for row in rows],
+            )
+        leased = []
+        for lookup_id, file_format, name, version in rows:
+            leased.append((lookup_id, Formats(file_format), name, version))
+        return leased
+
+    def complete(self, deltas: Sequence[tuple[int, int]]) -> None:
+        """Save deltas of leased lookups."""
+        with self._transaction():
+            self._connection.executemany(
+                'UPDATE lookups SET delta = ?, leased_until = 0 WHERE id = ? AND delta IS NULL',
+                [(delta, lookup_id) for lookup_id, delta in deltas],
+            )
+
+    def release(self, lookup_ids: Sequence[int]) -> None:
+        """Return leased lookups to queue before lease expiration."""
+        with self._transaction():
+            self._connection.executemany(
+                'UPDATE lookups SET leased_until = 0 WHERE id = ? AND delta IS NULL',
+                [(lookup_id,) for lookup_id in lookup_ids],
+            )
+
+    def pending(self) -> int:
+        """Count of lookups not resolved and not exhausted."""
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM lookups WHERE delta IS NULL AND attempts < ?',
+            (self._max_attempts,),
+        ).fetchone()[0]
+
+    def lockfiles(self) -> list[tuple[str, Path, _Rows]]:
+        """Lockfiles (repo, path, rows ordered by delta), unresolved lookups have delta -1."""
+        lockfiles = []
+        for lockfile_id, repo, path in self._connection.execute('SELECT id, repo, path FROM lockfiles ORDER BY id'):
+            rows = self._connection.execute(
+                ' '.join([
+                    'SELECT dependencies.name, dependencies.version, COALESCE(lookups.delta, -1)',
+                    'FROM dependencies JOIN lookups ON lookups.id = dependencies.lookup_id',
+                    'WHERE dependencies.lockfile_id = ?',
+                    'ORDER BY COALESCE(lookups.delta, -1) DESC, dependencies.rowid',
+                ]),
+                (lockfile_id,),
+            ).fetchall()
+            lockfiles.append((repo, Path(path), rows))
+        return lockfiles
+
+    def close(self) -> None:
+        """Close database connection."""
+        self._connection.close()
+
+    def _lookup(self, file_format: Formats, name: str, version: str) -> int:
+        ecosystem = file_format.ecosystem()
+        key = (ecosystem, str(NormalizedName(ecosystem, name)), version)
+        self._connection.execute(
+            ' '.join([
+                'INSERT OR IGNORE INTO lookups (ecosystem, name, version, dependency, file_format)',
+                'VALUES (?, ?, ?, ?, ?)',
+            ]),
+            (*key, name, file_format.value),
+        )
+        return self._connection.execute(
+            'SELECT id FROM lookups WHERE ecosystem = ? AND name = ? AND version = ?',
+            key,
+        ).fetchone()[0]
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except BaseException:
+            self._connection.execute('ROLLBACK')
+            raise
+        self._connection.execute('COMMIT')
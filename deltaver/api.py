@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Python API of lockfile scan.
+
+Scan never writes to terminal, warnings go to `deltaver` logger.
+"""
+
+import asyncio
+from collections.abc import Sequence
+from contextlib import ExitStack
+
+from deltaver._internal.concurrent_scan import ConcurrentScan
+from deltaver._internal.config import ScanOptions
+from deltaver._internal.excluded_reqs import ExcludedReqs
+from deltaver._internal.formats import Formats
+from deltaver._internal.host_limits import HostLimits
+from deltaver._internal.host_rate_limit import HostRateLimit
+from deltaver._internal.lagging_first_reqs import LaggingFirstReqs
+from deltaver._internal.listed_reqs import ListedReqs
+from deltaver._internal.lockfile_reqs import LockfileReqs
+from deltaver._internal.parsed_reqs import ParsedReqs
+from deltaver._internal.registry_deltas import RegistryDeltas
+from deltaver._internal.running_deltas import RunningDeltas
+from deltaver._internal.scan_context import ScanContext
+from deltaver._internal.scan_result import ScanResult
+
+_Lockfile = str | Sequence[tuple[str, str]]
+
+
+async def ascan(  # noqa: WPS210
+    lockfile: _Lockfile,
+    file_format: Formats = Formats.pip_freeze,
+    *,
+    excluded: Sequence[str] = (),
+    options: ScanOptions | None = None,
+    context: ScanContext | None = None,
+) -> ScanResult:
+    """Scan lockfile content or parsed requirements (name, version).
+
+    Client, cache and memo of versions passed in context shared between scans,
+    without client pooled client with 10 seconds timeout created for scan.
+    Lookups run in threads, so event loop of caller not blocked.
+    With fail fast option scan stops on first delta reached fail on max,
+    with lagging first option dependencies most outdated in previous scan looked up first.
+    """
+    file_format = Formats.pip_freeze if file_format == Formats.default else file_format
+    options = options or ScanOptions()
+    context = context or ScanContext()
+    with ExitStack() as stack:
+        cache = context.cache(stack, options)
+        deltas = RegistryDeltas.ctor(
+            file_format,
+            context.client(stack, HostRateLimit.ctor()),
+            cache,
+            options,
+            context,
+        )
+        if isinstance(lockfile, str):
+            parsed: ParsedReqs = LockfileReqs(lockfile, file_format)
+        else:
+            parsed = ListedReqs(lockfile)
+        dependencies = ExcludedReqs(parsed, list(excluded), deltas.ecosystem()).reqs()
+        fail_on_max = -1
+        if options.get('fail_fast', False):
+            fail_on_max = options.get('fail_on_max', -1)
+        lagging_first = options.get('lagging_first', False)
+        scheduled = dependencies
+        if lagging_first:
+            scheduled = LaggingFirstReqs(
+                dependencies,
+                cache.lags(deltas.ecosystem(), deltas.registry()),
+                deltas.ecosystem(),
+            ).reqs()
+        packages = await ConcurrentScan(
+            scheduled,
+            deltas.delta,
+            deltas.host(),
+            HostLimits.ctor(options.get('concurrency')),
+            fail_on_max,
+            context.deadline(),
+        ).rows()
+        if lagging_first:
+            running = RunningDeltas.ctor(lags=True)
+            for package in packages:
+                running.add(*package)
+            cache.save_lags(deltas.ecosystem(), deltas.registry(), running.lags())
+    position = {dependency: idx for idx, dependency in enumerate(dependencies)}
+    packages = sorted(packages, key=lambda row: position[row[:2]])
+    packages = sorted(packages, key=lambda row: row[2], reverse=True)
+    return ScanResult(packages, context.stale())
+
+
+def scan(
+    lockfile: _Lockfile,
+    file_format: Formats = Formats.pip_freeze,
+    *,
+    excluded: Sequence[str] = (),
+    options: ScanOptions | None = None,
+    context: ScanContext | None = None,
+) -> ScanResult:
+    """Scan lockfile content or parsed requirements (name, version).
+
+    Runs own event loop, use `ascan` inside running event loop.
+    """
+    return asyncio.run(ascan(
+        lockfile,
+        file_format,
+        excluded=excluded,
+        options=options,
+        context=context,
+    ))
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Batch scan of many repositories in one process."""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich import print as rich_print
+from rich.logging import RichHandler
+
+from deltaver._internal.batch_manifest import BatchManifest
+from deltaver._internal.batch_results import BatchResults
+from deltaver._internal.config import ScanOptions
+from deltaver._internal.deadline import Deadline
+from deltaver._internal.directory_scan import DirectoryScan
+from deltaver._internal.failed_lockfiles import FailedLockfiles
+from deltaver._internal.formats import Formats
+from deltaver._internal.host_rate_limit import HostRateLimit
+from deltaver._internal.pooled_client import PooledClient
+from deltaver._internal.scan_context import ScanContext
+from deltaver._internal.stale_releases import StaleReleases
+from deltaver.entry import config_ctor, config_from_cli, pyproject_config
+
+app = typer.Typer()
+
+
+@app.command()
+def main(  # noqa: WPS210
+    manifest: Annotated[Path, typer.Argument(
+        help='JSON lines file of {"repo": ..., "lockfile": ..., "format": ...} entries',
+    )],
+    output: Annotated[Path, typer.Option(
+        '--output',
+        help='JSON lines file of results, one line per lockfile',
+    )] = Path('deltaver-results.jsonl'),  # noqa: WPS404
+    deadline: Annotated[float, typer.Option(
+        '--deadline',
+        help='Time budget of batch in seconds, unresolved dependencies have delta -1',
+    )] = -1,
+) -> None:
+    """Scan lockfiles of many repositories with one fetch pipeline.
+
+    Lockfiles parsed by pool of processes sized to available cores,
+    registry responses shared by all repositories of batch.
+    """
+    logging.basicConfig(format='%(message)s', handlers=[RichHandler(show_time=False, show_path=False)])
+    cli_config = config_from_cli(manifest, Formats.default, -1, -1, [])
+    cli_config['deadline'] = None if deadline == -1 else deadline
+    config = config_ctor(cli_config, pyproject_config())
+    batch_deadline = Deadline.ctor()
+    if config['deadline'] > -1:
+        batch_deadline = Deadline.ctor(config['deadline'])
+    entries = BatchManifest(manifest.read_text()).entries()
+    stale = StaleReleases.ctor()
+    failed = FailedLockfiles.ctor()
+    with PooledClient(
+        config['timeout'],
+        batch_deadline,
+        HostRateLimit.ctor(Path('.deltaver_cache') / 'ratelimit.json'),
+    ).client() as client, output.open('w') as results_file:
+        scan = DirectoryScan(
+            [(path, file_format) for _, path, file_format in entries],
+            config['excluded'],
+            ScanOptions({
+                'concurrency': config['concurrency'],
+                'golang_resolution': config['golang_resolution'],
+                'cache_ttl': config['cache_ttl'],
+                'pypi_api': config['pypi_api'],
+                'index_url': config['index_url'],
+            }),
+            client,
+            context=ScanContext(deadline=batch_deadline, stale=stale),
+            failed=failed,
+        )
+        batch_results = BatchResults(results_file, entries, stale, failed)
+        written = asyncio.run(batch_results.written(scan.stream()))
+    rich_print('{0} lockfiles of {1} written to {2}'.format(written, manifest, output))
@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Scan job shared by many workers through queue database."""
+
+import logging
+import os
+import socket
+from collections.abc import Callable
+from contextlib import closing
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich import print as rich_print
+from rich.logging import RichHandler
+
+from deltaver._internal.batch_manifest import BatchManifest
+from deltaver._internal.config import ScanOptions
+from deltaver._internal.deadline import Deadline
+from deltaver._internal.excluded_reqs import ExcludedReqs
+from deltaver._internal.formats import Formats
+from deltaver._internal.host_rate_limit import HostRateLimit
+from deltaver._internal.lockfile_reports import LockfileReports
+from deltaver._internal.lockfile_reqs import LockfileReqs
+from deltaver._internal.pooled_client import PooledClient
+from deltaver._internal.queue_worker import QueueWorker
+from deltaver._internal.scan_context import ScanContext
+from deltaver._internal.scan_report import ScanReport
+from deltaver._internal.stale_releases import StaleReleases
+from deltaver._internal.work_queue import WorkQueue
+from deltaver.entry import config_ctor, config_from_cli, pyproject_config
+
+app = typer.Typer()
+
+_Rows = list[tuple[str, str, int]]
+_Reports = dict[str, LockfileReports]
+_QueueArgument = Annotated[Path, typer.Argument(help='Path to queue database on storage shared by workers')]
+
+
+@app.command()
+def publish(  # noqa: WPS210
+    queue: _QueueArgument,
+    manifest: Annotated[Path, typer.Argument(
+        help='JSON lines file of {"repo": ..., "lockfile": ..., "format": ...} entries',
+    )],
+) -> None:
+    """Publish dependency lookups of lockfiles to queue."""
+    config = config_ctor(
+        config_from_cli(manifest, Formats.default, -1, -1, []),
+        pyproject_config(),
+    )
+    lockfiles = []
+    for repo, path, file_format in BatchManifest(manifest.read_text()).entries():
+        lockfile_format = Formats.pip_freeze if file_format == Formats.default else file_format
+        reqs = ExcludedReqs(
+            LockfileReqs(path.read_text(), lockfile_format),
+            config['excluded'],
+            lockfile_format.ecosystem(),
+        ).reqs()
+        lockfiles.append((repo, path, lockfile_format, reqs))
+    with closing(WorkQueue.ctor(queue)) as work_queue:
+        work_queue.publish(lockfiles)
+        rich_print('{0} lockfiles published, {1} lookups pending'.format(len(lockfiles), work_queue.pending()))
+
+
+@app.command()
+def worker(  # noqa: WPS210
+    queue: _QueueArgument,
+    lease: Annotated[float, typer.Option(
+        '--lease',
+        help='Seconds lookups leased for, lookups of crashed worker leased again after it',
+    )] = 300,
+    batch: Annotated[int, typer.Option('--batch', help='Count of lookups leased at once')] = 32,
+    deadline: Annotated[float, typer.Option(
+        '--deadline',
+        help='Time budget of worker in seconds',
+    )] = -1,
+) -> None:
+    """Resolve lookups of queue until it drained."""
+    logging.basicConfig(format='%(message)s', handlers=[RichHandler(show_time=False, show_path=False)])
+    cli_config = config_from_cli(queue, Formats.default, -1, -1, [])
+    cli_config['deadline'] = None if deadline == -1 else deadline
+    config = config_ctor(cli_config, pyproject_config())
+    worker_deadline = Deadline.ctor()
+    if config['deadline'] > -1:
+        worker_deadline = Deadline.ctor(config['deadline'])
+    with PooledClient(
+        config['timeout'],
+        worker_deadline,
+        HostRateLimit.ctor(Path('.deltaver_cache') / 'ratelimit.json'),
+    ).client() as client, closing(WorkQueue.ctor(queue)) as work_queue:
+        resolved = QueueWorker(
+            work_queue,
+            '{0}-{1}'.format(socket.gethostname(), os.getpid()),
+            client,
+            ScanOptions({
+                'concurrency': config['concurrency'],
+                'golang_resolution': config['golang_resolution'],
+                'cache_ttl': config['cache_ttl'],
+                'pypi_api': config['pypi_api'],
+                'index_url': config['index_url'],
+            }),
+            batch,
+            lease,
+            context=ScanContext(deadline=worker_deadline),
+        ).run()
+    rich_print('{0} lookups resolved'.format(resolved))
+
+
+@app.command()
+def aggregate(queue: _QueueArgument) -> None:  # noqa: WPS210
+    """Print reports of published lockfiles per repository, fail on thresholds of any repository like deltaver."""
+    config = config_ctor(
+        config_from_cli(queue, Formats.default, -1, -1, []),
+        pyproject_config(),
+    )
+    with closing(WorkQueue.ctor(queue)) as work_queue:
+        pending = work_queue.pending()
+        lockfiles = work_queue.lockfiles()
+    if pending:
+        rich_print('[yellow]{0} lookups still pending[/yellow]'.format(pending))
+    reports = _repo_reports(lockfiles)
+    for repo, repo_reports in reports.items():
+        rich_print('\n[bold]Repository {0}[/bold]'.format(repo))
+        repo_reports.print()
+    over_avg = _breached(reports, config['fail_on_avg'], ScanReport.average)
+    if over_avg:
+        rich_print('\n[red]Error: average delta greater than available in {0}[/red]'.format(', '.join(over_avg)))
+        raise typer.Exit(1)
+    over_max = _breached(reports, config['fail_on_max'], ScanReport.maximum)
+    if over_max:
+        rich_print('\n[red]Error: max delta greater than available in {0}[/red]'.format(', '.join(over_max)))
+        raise typer.Exit(1)
+
+
+def _repo_reports(lockfiles: list[tuple[str, Path, _Rows]]) -> _Reports:  # noqa: WPS210
+    files: dict[str, list[tuple[Path, _Rows]]] = {}  # noqa: WPS234
+    for repo, path, rows in lockfiles:
+        files.setdefault(repo, []).append((path, rows))
+    return {
+        repo_name: LockfileReports(repo_files, StaleReleases.ctor())
+        for repo_name, repo_files in files.items()
+    }
+
+
+def _breached(reports: _Reports, threshold: int, metric: Callable[[ScanReport], float]) -> list[str]:
+    if threshold == -1:
+        return []
+    return [
+        repo
+        for repo, repo_reports in reports.items()
+        if metric(repo_reports.aggregate()) >= threshold
+    ]
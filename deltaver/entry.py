@@ -3,42 +3,43 @@
 
 """Python project designed to calculate the lag or delay in dependencies in terms of days."""
 
-import datetime
+import asyncio
+import logging
 import sys
 import traceback
-from contextlib import suppress
+from contextlib import ExitStack, suppress
 from pathlib import Path
 from typing import Annotated
 
-import pytz
 import toml
 import typer
-from rich import print as rich_print
 from rich.console import Console
-from rich.progress import track
-from rich.table import Table
+from rich.logging import RichHandler
+from rich.progress import Progress
 
-from deltaver._internal.cached_package_list import CachedPackageList
-from deltaver._internal.cached_sorted_versions import CachedSortedVersions
-from deltaver._internal.config import CliInputConfig, Config, PyprojectConfig
-from deltaver._internal.days_delta import DaysDelta
+from deltaver._internal.concurrent_scan import ConcurrentScan
+from deltaver._internal.config import CliInputConfig, Config, PyprojectConfig, ScanOptions
+from deltaver._internal.deadline import Deadline
+from deltaver._internal.directory_scan import DirectoryScan
+from deltaver._internal.discovered_lockfiles import DiscoveredLockfiles
 from deltaver._internal.exceptions import ThresholdReachedError
 from deltaver._internal.excluded_reqs import ExcludedReqs
+from deltaver._internal.failed_lockfiles import FailedLockfiles
 from deltaver._internal.file_not_foudn_safe_reqs import FileNotFoundSafeReqs
-from deltaver._internal.filtered_package_list import FilteredPackageList
 from deltaver._internal.formats import Formats
-from deltaver._internal.freezed_reqs import FreezedReqs
-from deltaver._internal.golang_package_list import GolangPackageList
-from deltaver._internal.golang_reqs import GolangReqs
-from deltaver._internal.hex_package_list import HexPackageList
-from deltaver._internal.mix_lock_reqs import MixLockReqs
-from deltaver._internal.npmjs_package_list import NpmjsPackageList
-from deltaver._internal.package_lock_reqs import PackageLockReqs
-from deltaver._internal.parsed_reqs import ParsedReqs
-from deltaver._internal.poetry_lock_reqs import PoetryLockReqs
-from deltaver._internal.pypi_package_list import PypiPackageList
-from deltaver._internal.sorted_package_list import SortedPackageList
-from deltaver._internal.version_list import VersionList
+from deltaver._internal.host_limits import HostLimits
+from deltaver._internal.host_rate_limit import HostRateLimit
+from deltaver._internal.lagging_first_reqs import LaggingFirstReqs
+from deltaver._internal.lockfile_reports import LockfileReports
+from deltaver._internal.lockfile_reqs import LockfileReqs
+from deltaver._internal.output_formats import OutputFormats
+from deltaver._internal.pooled_client import PooledClient
+from deltaver._internal.registry_deltas import RegistryDeltas
+from deltaver._internal.running_deltas import RunningDeltas
+from deltaver._internal.scan_context import ScanContext
+from deltaver._internal.scan_report import ScanReport
+from deltaver._internal.stale_releases import StaleReleases
+from deltaver._internal.streamed_output import StreamedOutput
 
 app = typer.Typer()
 
@@ -50,13 +51,16 @@ def config_from_cli(
     fail_on_max: int,
     excluded: list[str],
 ) -> CliInputConfig:
-    """Config from cli."""
+    """Config from cli, flags are unset."""
     return CliInputConfig({
         'path_to_file': path_to_file,
         'file_format': file_format,
         'excluded': excluded,
         'fail_on_avg': None if fail_on_avg == -1 else fail_on_avg,
         'fail_on_max': None if fail_on_max == -1 else fail_on_max,
+        'fail_fast': False,
+        'lagging_first': False,
+        'deadline': None,
     })
 
 
@@ -77,6 +81,15 @@ def pyproject_config() -> PyprojectConfig:
         'excluded': pyproject_cfg.get('excluded', []),  # TODO
         'fail_on_avg': pyproject_cfg.get('fail_on_avg'),
         'fail_on_max': pyproject_cfg.get('fail_on_max'),
+        'concurrency': pyproject_cfg.get('concurrency', {}),
+        'timeout': pyproject_cfg.get('timeout'),
+        'golang_resolution': pyproject_cfg.get('golang_resolution'),
+        'cache_ttl': pyproject_cfg.get('cache_ttl'),
+        'pypi_api': pyproject_cfg.get('pypi_api'),
+        'index_url': pyproject_cfg.get('index_url'),
+        'fail_fast': pyproject_cfg.get('fail_fast'),
+        'lagging_first': pyproject_cfg.get('lagging_first'),
+        'deadline': pyproject_cfg.get('deadline'),
     })
 
 
@@ -91,123 +104,188 @@ def config_ctor(
         'excluded': pyproject_cfg.get('excluded', []),
         'fail_on_avg': pyproject_cfg['fail_on_avg'] or cli_config['fail_on_avg'] or -1,
         'fail_on_max': pyproject_cfg['fail_on_max'] or cli_config['fail_on_max'] or -1,
+        'concurrency': pyproject_cfg.get('concurrency', {}),
+        'timeout': pyproject_cfg.get('timeout') or 10,
+        'golang_resolution': pyproject_cfg.get('golang_resolution') or 'successor',
+        'cache_ttl': pyproject_cfg.get('cache_ttl') or 86400,  # noqa: WPS432
+        'pypi_api': pyproject_cfg.get('pypi_api') or 'json',
+        'index_url': pyproject_cfg.get('index_url') or 'https://pypi.org/simple',
+        'fail_fast': any((cli_config['fail_fast'], pyproject_cfg.get('fail_fast'))),
+        'lagging_first': any((cli_config['lagging_first'], pyproject_cfg.get('lagging_first'))),
+        'deadline': cli_config['deadline'] or pyproject_cfg.get('deadline') or -1,
     })
     if config['file_format'] == Formats.default:
         config['file_format'] = Formats.pip_freeze
     return config
 
 
+async def tracked_rows(scan: ConcurrentScan, total: int) -> list[tuple[str, str, int]]:
+    """Scan rows with progress bar."""
+    rows = []
+    with Progress() as progress:
+        task = progress.add_task('Scanning...', total=total)
+        async for row in scan.stream():
+            rows.append(row)
+            progress.advance(task)
+    return rows
+
+
 # TODO: fix
 def logic(  # noqa: WPS210, WPS234
     requirements_file_content: str,
     excluded_reqs: list[str],
     file_format: Formats,
+    options: ScanOptions | None = None,
+    context: ScanContext | None = None,
 ) -> tuple[list[tuple[str, str, int]], int, int]:
-    """Logic."""
+    """Logic.
+
+    Dependencies not resolved before deadline or with unavailable registry have delta -1.
+    Dependencies resolved from expired cache collected to stale releases of context.
+    Client and cache created for one scan when not passed in context.
+    With output of context rows written as they resolve and not returned.
+    """
     file_format = Formats.pip_freeze if file_format == Formats.default else file_format
-    parsed_reqs: ParsedReqs = {
-        Formats.npm_lock: PackageLockReqs(requirements_file_content),
-        Formats.pip_freeze: FreezedReqs(requirements_file_content),
-        Formats.poetry_lock: PoetryLockReqs(requirements_file_content),
-        Formats.golang: GolangReqs(requirements_file_content),
-        Formats.mix_lock: MixLockReqs(requirements_file_content),
-    }[file_format]
-    dependencies = FileNotFoundSafeReqs(
-        ExcludedReqs(
-            parsed_reqs,
-            excluded_reqs,
-        ),
-    ).reqs()
-    packages = []
-    sum_delta = 0
-    max_delta = 0
-    for name, version in track(dependencies, description='Scanning...'):
-        package_list: VersionList = {
-            Formats.npm_lock: NpmjsPackageList(name),
-            Formats.pip_freeze: PypiPackageList(name),
-            Formats.poetry_lock: PypiPackageList(name),
-            Formats.golang: GolangPackageList(name),
-            Formats.mix_lock: HexPackageList(name),
-        }[file_format]
-        delta = DaysDelta(
-            version,
-            CachedSortedVersions(
-                CachedPackageList.ctor(
-                    SortedPackageList(
-                        FilteredPackageList(
-                            package_list,
-                        ),
-                    ),
-                    ),
-                name,
+    options = options or ScanOptions()
+    context = context or ScanContext()
+    with ExitStack() as stack:
+        client = context.client(stack, HostRateLimit.ctor(Path('.deltaver_cache') / 'ratelimit.json'))
+        cache = context.cache(stack, options)
+        deltas = RegistryDeltas.ctor(file_format, client, cache, options, context)
+        dependencies = FileNotFoundSafeReqs(
+            ExcludedReqs(
+                LockfileReqs(requirements_file_content, file_format),
+                excluded_reqs,
+                deltas.ecosystem(),
             ),
-            datetime.datetime.now(tz=pytz.UTC).date(),
-        ).days()
-        sum_delta += delta
-        max_delta = max(max_delta, delta)
-        packages.append((name, version, delta))
+        ).reqs()
+        fail_on_max = -1
+        if options.get('fail_fast', False):
+            fail_on_max = options.get('fail_on_max', -1)
+        scheduled = dependencies
+        lagging_first = options.get('lagging_first', False)
+        if lagging_first:
+            scheduled = LaggingFirstReqs(
+                dependencies,
+                cache.lags(deltas.ecosystem(), deltas.registry()),
+                deltas.ecosystem(),
+            ).reqs()
+        scan = ConcurrentScan(
+            scheduled,
+            deltas.delta,
+            deltas.host(),
+            HostLimits.ctor(options.get('concurrency')),
+            fail_on_max,
+            context.deadline(),
+        )
+        packages = []
+        output = context.output()
+        if output is None:
+            packages = asyncio.run(tracked_rows(scan, len(dependencies)))
+            running = RunningDeltas.ctor(lags=lagging_first)
+            for package in packages:
+                running.add(*package)
+        else:
+            running = asyncio.run(output.written(scan.stream()))
+        if lagging_first:
+            cache.save_lags(deltas.ecosystem(), deltas.registry(), running.lags())
+    position = {dependency: idx for idx, dependency in enumerate(dependencies)}
+    packages = sorted(packages, key=lambda row: position[row[:2]])
     packages = sorted(packages, key=lambda row: row[2], reverse=True)
-    return packages, sum_delta, max_delta
+    return packages, running.total(), running.maximum()
 
 
 # TODO: fix
-def cli(  # noqa: WPS210, WPS213
-    path_to_file: Path,
-    file_format: Formats,
-    fail_on_average: int,
-    fail_on_max: int,
-    excluded: list[str],
+def cli(  # noqa: WPS210, WPS213, WPS231
+    cli_config: CliInputConfig,
+    output: OutputFormats = OutputFormats.table,
 ) -> None:
-    """Cli."""
-    config = config_ctor(
-        config_from_cli(
-            path_to_file,
-            file_format,
-            fail_on_average,
-            fail_on_max,
-            excluded,
-        ),
-        pyproject_config(),
-    )
-    console = Console()
-    table = Table(show_header=True, header_style='bold magenta')
-    table.add_column('Package')
-    table.add_column('Version')
-    table.add_column('Delta (days)')
-    packages, sum_delta, max_delta = logic(
-        config['path_to_file'].read_text(),
-        config['excluded'],
-        file_format,
+    """Cli.
+
+    Output other than table written to stdout as JSON, messages go to stderr.
+    """
+    console = Console(stderr=output != OutputFormats.table)
+    logging.basicConfig(
+        format='%(message)s',
+        handlers=[RichHandler(console=console, show_time=False, show_path=False)],
     )
-    for package, version, delta in packages:
-        if delta != 0:
-            table.add_row(package, version, str(delta))
-    if packages:
-        console.print(table)
-        average_delta = '{0:.2f}'.format(sum_delta / len(packages))
-    else:
-        average_delta = '0'
-    rich_print('Max delta: {0}'.format(max_delta))
-    rich_print('Average delta: {0}'.format(average_delta))
+    config = config_ctor(cli_config, pyproject_config())
+    scan_deadline = Deadline.ctor()
+    if config['deadline'] > -1:
+        scan_deadline = Deadline.ctor(config['deadline'])
+    rate_limit = HostRateLimit.ctor(Path('.deltaver_cache') / 'ratelimit.json')
+    stale = StaleReleases.ctor()
+    options = ScanOptions({
+        'concurrency': config['concurrency'],
+        'golang_resolution': config['golang_resolution'],
+        'cache_ttl': config['cache_ttl'],
+        'pypi_api': config['pypi_api'],
+        'index_url': config['index_url'],
+        'fail_on_max': config['fail_on_max'],
+        'fail_fast': config['fail_fast'],
+        'lagging_first': config['lagging_first'],
+    })
+    running = RunningDeltas.ctor(lags=config['lagging_first'])
+    streamed = StreamedOutput(sys.stdout, stale, running, per_row=output == OutputFormats.ndjson)
+    report: ScanReport | RunningDeltas = running
+    table = output == OutputFormats.table
+    with PooledClient(config['timeout'], scan_deadline, rate_limit).client() as client:
+        if config['path_to_file'].is_dir():
+            failed = FailedLockfiles.ctor()
+            directory_scan = DirectoryScan(
+                DiscoveredLockfiles(config['path_to_file']).files(),
+                config['excluded'],
+                options,
+                client,
+                context=ScanContext(deadline=scan_deadline, stale=stale),
+                failed=failed,
+            )
+            if table:
+                reports = LockfileReports(directory_scan.files(), stale, failed)
+                reports.print()
+                report = reports.aggregate()
+            else:
+                asyncio.run(streamed.written(directory_scan.rows()))
+        else:
+            packages, sum_delta, max_delta = logic(
+                config['path_to_file'].read_text(),
+                config['excluded'],
+                cli_config['file_format'],
+                options,
+                ScanContext(
+                    client=client,
+                    deadline=scan_deadline,
+                    stale=stale,
+                    output=None if table else streamed,
+                ),
+            )
+            if table:
+                report = ScanReport(packages, sum_delta, max_delta, stale)
+                report.print()
+    max_delta = report.maximum()
     # TODO: fix
-    if config['fail_on_avg'] > -1 and float(average_delta) >= config['fail_on_avg']:  # noqa: WPS221, WPS333
-        rich_print('\n[red]Error: average delta greater than available[/red]')
+    if config['fail_on_avg'] > -1 and report.average() >= config['fail_on_avg']:  # noqa: WPS221, WPS333
+        console.print('\n[red]Error: average delta greater than available[/red]')
         raise ThresholdReachedError
     # TODO: fix
     if config['fail_on_max'] > -1 and max_delta >= config['fail_on_max']:  # noqa: WPS333
-        rich_print('\n[red]Error: max delta greater than available[/red]')
+        if config['fail_fast']:
+            console.print('\n[yellow]Scan stopped on first delta greater than available[/yellow]')
+        console.print('\n[red]Error: max delta greater than available[/red]')
         raise ThresholdReachedError
 
 
 @app.command()
-def main(
+def main(  # noqa: PLR0913
     # disable lint because Typer API
     path_to_file: Path = typer.Argument(help='\n\n'.join([  # noqa: B008, WPS404
-        'Path to file which specified project dependencies.',
+        'Path to file which specified project dependencies',
+        'or directory to scan every lockfile of its tree.',
         'Examples:',
         ' - requirements.txt',
         ' - ./poetry.lock',
         ' - /home/user/code/deltaver/poetry.lock',
+        ' - .',
     ])),
     file_format: Formats = typer.Option(  # noqa: B008, WPS404
         Formats.default.value,
@@ -217,10 +295,31 @@ def main(
     fail_on_average: Annotated[int, typer.Option('--fail-on-avg')] = -1,
     fail_on_max: Annotated[int, typer.Option('--fail-on-max')] = -1,
     exclude_deps: Annotated[list[str], typer.Option('--exclude')] = [],  # noqa: B006, WPS404
+    *,
+    fail_fast: Annotated[bool, typer.Option(
+        '--fail-fast',
+        help='Stop on first delta reached --fail-on-max, cancel outstanding lookups',
+    )] = False,
+    lagging_first: Annotated[bool, typer.Option(
+        '--lagging-first',
+        help='Look up dependencies with largest delta of previous run first',
+    )] = False,
+    deadline: Annotated[float, typer.Option(
+        '--deadline',
+        help='Time budget of scan in seconds, unresolved dependencies reported separately',
+    )] = -1,
+    output: Annotated[OutputFormats, typer.Option(
+        '--output',
+        help='"table", "ndjson" with line per dependency as soon as resolved or "json" summary',
+    )] = OutputFormats.table,
 ) -> None:
     """Python project designed to calculate the lag or delay in dependencies in terms of days."""
+    cli_config = config_from_cli(path_to_file, file_format, fail_on_average, fail_on_max, exclude_deps)
+    cli_config['fail_fast'] = fail_fast
+    cli_config['lagging_first'] = lagging_first
+    cli_config['deadline'] = None if deadline == -1 else deadline
     try:
-        cli(path_to_file, file_format, fail_on_average, fail_on_max, exclude_deps)
+        cli(cli_config, output)
     except ThresholdReachedError as err:
         raise typer.Exit(1) from err
     # Application entrypoint
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Long running HTTP service of lag queries."""
+
+import datetime
+import logging
+import threading
+from contextlib import closing, suppress
+from functools import partial
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich import print as rich_print
+from rich.logging import RichHandler
+
+from deltaver._internal.config import ScanOptions
+from deltaver._internal.formats import Formats
+from deltaver._internal.host_rate_limit import HostRateLimit
+from deltaver._internal.lag_handler import LagHandler
+from deltaver._internal.lag_service import LagService
+from deltaver._internal.pooled_client import PooledClient
+from deltaver._internal.scan_context import ScanContext
+from deltaver._internal.sqlite_cache import SqliteCache
+from deltaver.api import scan
+from deltaver.entry import config_ctor, config_from_cli, pyproject_config
+
+app = typer.Typer()
+
+
+@app.command()
+def main(  # noqa: WPS210
+    host: Annotated[str, typer.Option('--host', help='Interface to listen')] = '127.0.0.1',
+    port: Annotated[int, typer.Option('--port', help='Port to listen')] = 8765,
+    refresh: Annotated[float, typer.Option(
+        '--refresh',
+        help='Seconds between background refreshes of recently queried lockfiles',
+    )] = 600,
+) -> None:
+    """Serve lag queries over HTTP with warm cache and connection pools.
+
+    `POST /scan` takes {"lockfile": ..., "format": ...},
+    `POST /batch` takes {"lockfiles": [...]}.
+    """
+    logging.basicConfig(format='%(message)s', handlers=[RichHandler(show_time=False, show_path=False)])
+    config = config_ctor(
+        config_from_cli(Path(), Formats.default, -1, -1, []),
+        pyproject_config(),
+    )
+    options = ScanOptions({
+        'concurrency': config['concurrency'],
+        'golang_resolution': config['golang_resolution'],
+        'cache_ttl': config['cache_ttl'],
+        'pypi_api': config['pypi_api'],
+        'index_url': config['index_url'],
+    })
+    ttl = datetime.timedelta(seconds=config['cache_ttl'])
+    cache = SqliteCache.ctor(Path('.deltaver_cache'), ttl)
+    with PooledClient(
+        config['timeout'],
+        rate_limit=HostRateLimit.ctor(Path('.deltaver_cache') / 'ratelimit.json'),
+    ).client() as client, closing(cache):
+        service = LagService.ctor(
+            lambda lockfile_content, file_format, memo, stale, revalidate: scan(
+                lockfile_content,
+                file_format,
+                excluded=config['excluded'],
+                options=ScanOptions(**options, revalidate=revalidate),
+                context=ScanContext(client=client, cache=cache, memo=memo, stale=stale),
+            ).packages(),
+        )
+        stopped = threading.Event()
+        refreshing = threading.Thread(target=_refreshing, args=(service, refresh, stopped), daemon=True)
+        refreshing.start()
+        with ThreadingHTTPServer((host, port), partial(LagHandler, service=service)) as server:
+            rich_print('Serving lag queries on http://{0}:{1}'.format(host, port))
+            with suppress(KeyboardInterrupt):
+                server.serve_forever()
+        stopped.set()
+
+
+def _refreshing(service: LagService, interval: float, stopped: threading.Event) -> None:
+    while not stopped.wait(interval):
+        service.refreshed()
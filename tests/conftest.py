@@ -0,0 +1,14 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Fixtures of all tests."""
+
+import pytest
+
+from deltaver._internal.versions_memo import VersionsMemo
+
+
+@pytest.fixture(autouse=True)
+def _isolated_memo(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Memo shared by scans of process not shared between tests."""
+    monkeypatch.setattr('deltaver._internal.versions_memo._SHARED', VersionsMemo.ctor(ttl=300))
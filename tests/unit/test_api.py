@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test Python API of lockfile scan."""
+
+import asyncio
+import datetime
+from contextlib import closing
+from pathlib import Path
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+import deltaver
+from deltaver._internal.sqlite_cache import SqliteCache
+
+
+@pytest.fixture
+def _mock_pypi(respx_mock: MockRouter) -> None:
+    for package_name in ('smmap', 'httpx'):
+        respx_mock.get('https://pypi.org/pypi/{0}/json'.format(package_name)).mock(return_value=httpx.Response(
+            200,
+            text=Path('tests/fixtures/{0}_pypi_response.json'.format(package_name)).read_text(),
+        ))
+
+
+@pytest.mark.usefixtures('_mock_pypi')
+def test_scan(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test lockfile content scanned without terminal output."""
+    got = deltaver.scan(
+        'smmap==5.0.0\nhttpx==0.25.2\nsetuptools==69.0.0\n',
+        deltaver.Formats.pip_freeze,
+        excluded=['setuptools'],
+        context=deltaver.ScanContext(cache_dir=tmp_path),
+    )
+
+    names = [name for name, _, _ in got.packages()]
+
+    assert sorted(names) == ['httpx', 'smmap']
+    assert got.maximum() == got.packages()[0][2]
+    assert not got.unresolved()
+    assert capsys.readouterr() == ('', '')
+
+
+@pytest.mark.usefixtures('_mock_pypi')
+def test_ascan_in_running_loop(tmp_path: Path) -> None:
+    """Test parsed requirements scanned in event loop of caller."""
+    async def scanned() -> deltaver.ScanResult:  # noqa: WPS430
+        with httpx.Client() as client:
+            context = deltaver.ScanContext(client=client, cache_dir=tmp_path)
+            return await deltaver.ascan([('smmap', '5.0.0')], context=context)
+
+    got = asyncio.run(scanned())
+
+    assert got.total() == got.packages()[0][2]
+    assert got.average() == got.total()
+
+
+@pytest.mark.usefixtures('_mock_pypi')
+def test_fail_fast(tmp_path: Path) -> None:
+    """Test scan stopped on first delta reached fail on max."""
+    got = deltaver.scan(
+        [('smmap', '5.0.0'), ('httpx', '0.25.2')],
+        options=deltaver.ScanOptions({'fail_fast': True, 'fail_on_max': 1, 'concurrency': {'pypi.org': 1}}),
+        context=deltaver.ScanContext(cache_dir=tmp_path),
+    )
+
+    assert [name for name, _, _ in got.packages()] == ['smmap']
+
+
+@pytest.mark.usefixtures('_mock_pypi')
+def test_lagging_first(tmp_path: Path) -> None:
+    """Test deltas of scan with lagging first option saved for next scan."""
+    with closing(SqliteCache.ctor(tmp_path, datetime.timedelta(days=1))) as cache:
+        got = deltaver.scan(
+            [('smmap', '5.0.0')],
+            options=deltaver.ScanOptions({'lagging_first': True}),
+            context=deltaver.ScanContext(cache=cache),
+        )
+        lags = cache.lags('pypi', 'https://pypi.org')
+
+    assert lags == {'smmap': got.maximum()}
+
+
+def test_invalid_version_logged(tmp_path: Path, caplog: pytest.LogCaptureFixture, respx_mock: MockRouter) -> None:
+    """Test warning of not parsed version goes to logger."""
+    respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(
+        200,
+        text=Path('tests/fixtures/smmap_pypi_response.json').read_text(),
+    ))
+
+    context = deltaver.ScanContext(cache_dir=tmp_path)
+    got = deltaver.scan([('smmap', 'not-a-version')], context=context)
+
+    assert got.packages() == [('smmap', 'not-a-version', 0)]
+    assert 'Version not-a-version can not been parsed' in caplog.text
+
+
+def test_shared_cache(tmp_path: Path, respx_mock: MockRouter) -> None:
+    """Test cache and memo of context shared by scans and not closed by them."""
+    route = respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(
+        200,
+        text=Path('tests/fixtures/smmap_pypi_response.json').read_text(),
+    ))
+    with closing(SqliteCache.ctor(tmp_path, datetime.timedelta(days=1))) as cache:
+        context = deltaver.ScanContext(cache=cache)
+        first = deltaver.scan([('smmap', '5.0.0')], context=context)
+        second = deltaver.scan([('smmap', '5.0.0')], context=context)
+
+    assert first.packages() == second.packages()
+    assert route.call_count == 1
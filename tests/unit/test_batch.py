@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test batch scan of many repositories."""
+
+import asyncio
+import io
+import json
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from deltaver._internal.batch_manifest import BatchManifest
+from deltaver._internal.batch_results import BatchResults
+from deltaver._internal.config import ScanOptions
+from deltaver._internal.directory_scan import DirectoryScan
+from deltaver._internal.failed_lockfiles import FailedLockfiles
+from deltaver._internal.formats import Formats
+from deltaver._internal.pending_lockfiles import PendingLockfiles
+from deltaver._internal.scan_context import ScanContext
+from deltaver._internal.stale_releases import StaleReleases
+
+
+def test_manifest() -> None:
+    """Test manifest entries."""
+    got = BatchManifest('\n'.join([
+        '{"repo": "repos/api", "lockfile": "poetry.lock", "format": "poetry-lock"}',
+        '',
+        '{"repo": "repos/cli", "lockfile": "requirements.txt"}',
+    ])).entries()
+
+    assert got == [
+        ('repos/api', Path('repos/api/poetry.lock'), Formats.poetry_lock),
+        ('repos/cli', Path('repos/cli/requirements.txt'), Formats.pip_freeze),
+    ]
+
+
+def test_pending_lockfiles() -> None:
+    """Test lockfile completed by last of its lookups."""
+    pending = PendingLockfiles.ctor([{'smmap', 'httpx'}, {'smmap'}, set()])
+
+    assert pending.empty() == [2]
+    assert pending.resolved('smmap') == [1]
+    assert pending.rest() == [0]
+    assert pending.resolved('httpx') == [0]
+
+
+def test_results_written() -> None:
+    """Test line written for every scanned lockfile."""
+    async def lockfiles() -> AsyncIterator[tuple[Path, list[tuple[str, str, int]]]]:  # noqa: WPS234, WPS430
+        rows = [('smmap', '5.0.0', 30), ('httpx', '0.25.2', 10)]
+        yield Path('api/requirements.txt'), rows
+        yield Path('cli/requirements.txt'), []
+
+    output = io.StringIO()
+    written = asyncio.run(BatchResults(
+        output,
+        [
+            ('api', Path('api/requirements.txt'), Formats.pip_freeze),
+            ('cli', Path('cli/requirements.txt'), Formats.pip_freeze),
+        ],
+        StaleReleases.ctor(),
+    ).written(lockfiles()))
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    assert written == 2
+    assert [line['repo'] for line in lines] == ['api', 'cli']
+    assert lines[0]['max_delta'] == 30
+    assert lines[0]['average_delta'] == 20
+    assert lines[0]['packages'][0]['stale'] is None
+
+
+def test_broken_lockfile(  # noqa: WPS210
+    tmp_path: Path,
+    respx_mock: MockRouter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test error of one lockfile written, other lockfiles scanned."""
+    respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(
+        200,
+        text=Path('tests/fixtures/smmap_pypi_response.json').read_text(),
+    ))
+    monkeypatch.chdir(tmp_path)
+    Path('api').mkdir()
+    Path('api/requirements.txt').write_text('smmap==5.0.0\n')
+    entries = BatchManifest('\n'.join([
+        '{"repo": "api", "lockfile": "requirements.txt"}',
+        '{"repo": "cli", "lockfile": "requirements.txt"}',
+    ])).entries()
+    stale = StaleReleases.ctor()
+    failed = FailedLockfiles.ctor()
+    output = io.StringIO()
+    with httpx.Client() as client:
+        scan = DirectoryScan(
+            [(path, file_format) for _, path, file_format in entries],
+            [],
+            ScanOptions(),
+            client,
+            context=ScanContext(stale=stale),
+            failed=failed,
+        )
+        batch_results = BatchResults(output, entries, stale, failed)
+        written = asyncio.run(batch_results.written(scan.stream()))
+    parsed = [json.loads(line) for line in output.getvalue().splitlines()]
+    lines = {line['repo']: line for line in parsed}
+
+    assert written == 2
+    assert lines['api']['packages'][0]['name'] == 'smmap'
+    assert lines['cli']['error'].startswith('FileNotFoundError')
+    assert 'packages' not in lines['cli']
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test cached successor list."""
+
+import datetime
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from deltaver._internal.cached_successor_list import CachedSuccessorList
+from deltaver._internal.days_delta import DaysDelta
+from deltaver._internal.fk_package import FkPackage
+from deltaver._internal.fk_version_list import FkVersionList
+from deltaver._internal.sqlite_cache import SqliteCache
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Generator[SqliteCache, None, None]:
+    """Sqlite cache."""
+    sqlite_cache = SqliteCache.ctor(tmp_path, datetime.timedelta(days=1))
+    yield sqlite_cache
+    sqlite_cache.close()
+
+
+@pytest.fixture
+def packages() -> FkVersionList:
+    """Fake packages."""
+    return FkVersionList([
+        FkPackage('httpx', '0.25.2', datetime.date(2023, 11, 24)),
+        FkPackage('httpx', '0.26.0', datetime.date(2023, 12, 20)),
+    ])
+
+
+def test_successor_cached(cache: SqliteCache, packages: FkVersionList) -> None:
+    """Test successor date reused without origin."""
+    CachedSuccessorList(packages, cache, 'pypi', 'https://pypi.org', 'httpx', '0.25.2').as_list()
+
+    assert DaysDelta(
+        '0.25.2',
+        CachedSuccessorList(FkVersionList([]), cache, 'pypi', 'https://pypi.org', 'httpx', '0.25.2'),
+        datetime.date(2024, 6, 28),
+    ).days() == 191
+
+
+def test_latest_not_cached(cache: SqliteCache, packages: FkVersionList) -> None:
+    """Test package pinned at latest version not cached."""
+    CachedSuccessorList(packages, cache, 'pypi', 'https://pypi.org', 'httpx', '0.26.0').as_list()
+
+    assert cache.successor('pypi', 'https://pypi.org', 'httpx', '0.26.0') is None
@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test circuit breaker and stale fallback of registry hosts."""
+
+import datetime
+from collections.abc import Generator
+from contextlib import closing
+from pathlib import Path
+
+import httpx
+import pytest
+from respx.router import MockRouter
+from time_machine import TimeMachineFixture
+
+from deltaver._internal.cached_sorted_versions import CachedSortedVersions
+from deltaver._internal.circuit_breaker import CircuitBreaker
+from deltaver._internal.exceptions import CircuitOpenError
+from deltaver._internal.formats import Formats
+from deltaver._internal.pooled_client import PooledClient
+from deltaver._internal.pypi_package_list import PypiPackageList
+from deltaver._internal.sqlite_cache import SqliteCache
+from deltaver._internal.stale_releases import StaleReleases
+from deltaver.entry import logic
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Generator[SqliteCache, None, None]:
+    """Sqlite cache."""
+    sqlite_cache = SqliteCache.ctor(tmp_path, datetime.timedelta(days=1))
+    yield sqlite_cache
+    sqlite_cache.close()
+
+
+def test_open_after_failures(respx_mock: MockRouter) -> None:
+    """Test requests to failed host not sent."""
+    route = respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(500))
+    respx_mock.get('https://hex.pm/api/packages/jason').mock(return_value=httpx.Response(200))
+    with PooledClient(5, breaker=CircuitBreaker.ctor(3)).client() as client:
+        for _ in range(3):
+            client.get('https://pypi.org/pypi/smmap/json')
+        with pytest.raises(CircuitOpenError):
+            client.get('https://pypi.org/pypi/smmap/json')
+        response = client.get('https://hex.pm/api/packages/jason')
+
+    assert route.call_count == 3
+    assert response.status_code == 200
+
+
+def test_half_open() -> None:
+    """Test host closed by success after cooldown."""
+    breaker = CircuitBreaker.ctor(2, 0)
+    breaker.failed('pypi.org')
+    breaker.failed('pypi.org')
+    breaker.check('pypi.org')
+    breaker.succeeded('pypi.org')
+    breaker.failed('pypi.org')
+
+    assert not breaker.opened('pypi.org')
+
+
+def test_stale_fallback(
+    cache: SqliteCache,
+    respx_mock: MockRouter,
+    time_machine: TimeMachineFixture,
+) -> None:
+    """Test expired releases used when registry unavailable."""
+    time_machine.move_to(datetime.datetime(2024, 2, 5, tzinfo=datetime.timezone.utc))
+    respx_mock.get('https://pypi.org/pypi/smmap/json').mock(side_effect=[
+        httpx.Response(200, text=Path('tests/fixtures/smmap_pypi_response.json').read_text()),
+        httpx.ConnectError('unreachable'),
+    ])
+    stale = StaleReleases.ctor()
+    with PooledClient(5).client() as client:
+        versions = CachedSortedVersions(
+            PypiPackageList('smmap', client),
+            cache,
+            'pypi',
+            'https://pypi.org',
+            'smmap',
+            stale,
+        )
+        fetched = [package.release_date() for package in versions.as_list()]
+        time_machine.move_to(datetime.datetime(2024, 3, 5, tzinfo=datetime.timezone.utc))
+        got = [package.release_date() for package in versions.as_list()]
+
+    assert got == fetched
+    assert stale.fetched('smmap') == datetime.date(2024, 2, 5)
+
+
+def test_fetched_with_other_ttl(tmp_path: Path, time_machine: TimeMachineFixture) -> None:
+    """Test date of fetch kept when cache reopened with other ttl."""
+    time_machine.move_to(datetime.datetime(2024, 2, 5, tzinfo=datetime.timezone.utc))
+    with closing(SqliteCache.ctor(tmp_path, datetime.timedelta(days=1))) as daily_cache:
+        releases = [('5.0.0', datetime.date(2021, 10, 15))]
+        daily_cache.save('pypi', 'https://pypi.org', 'smmap', releases)
+    time_machine.move_to(datetime.datetime(2024, 2, 10, tzinfo=datetime.timezone.utc))
+    with closing(SqliteCache.ctor(tmp_path, datetime.timedelta(days=30))) as monthly_cache:
+        got = monthly_cache.fetched('pypi', 'https://pypi.org', 'smmap')
+
+    assert got == datetime.date(2024, 2, 5)
+
+
+def test_failed_without_cache(
+    tmp_path: Path,
+    respx_mock: MockRouter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:  # noqa: WPS210
+    """Test package of failed registry without cached releases unresolved."""
+    respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(
+        200,
+        text=Path('tests/fixtures/smmap_pypi_response.json').read_text(),
+    ))
+    respx_mock.get('https://pypi.org/pypi/httpx/json').mock(return_value=httpx.Response(500))
+    monkeypatch.chdir(tmp_path)
+
+    packages, _, _ = logic('smmap==5.0.0\nhttpx==0.25.0\n', [], Formats.pip_freeze)
+    deltas = {name: delta for name, _, delta in packages}
+
+    assert deltas['httpx'] == -1
+    assert deltas['smmap'] > -1
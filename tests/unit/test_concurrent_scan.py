@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test concurrent scan."""
+
+import asyncio
+import datetime
+
+from deltaver._internal.concurrent_scan import ConcurrentScan
+from deltaver._internal.days_delta import DaysDelta
+from deltaver._internal.fk_package import FkPackage
+from deltaver._internal.fk_version_list import FkVersionList
+from deltaver._internal.host_limits import HostLimits
+
+
+def test() -> None:
+    """Test all dependencies scanned."""
+    got = asyncio.run(ConcurrentScan(
+        [('httpx', '0.25.2'), ('httpx', '0.26.0'), ('httpx', '0.27.0')],
+        lambda name, version: DaysDelta(
+            version,
+            FkVersionList([
+                FkPackage(name, '0.25.2', datetime.date(2023, 11, 24)),
+                FkPackage(name, '0.26.0', datetime.date(2023, 12, 20)),
+                FkPackage(name, '0.27.0', datetime.date(2024, 2, 21)),
+            ]),
+            datetime.date(2024, 6, 28),
+        ),
+        'pypi.org',
+        HostLimits.ctor({'pypi.org': 2}),
+    ).rows())
+
+    assert sorted(got) == [
+        ('httpx', '0.25.2', 191),
+        ('httpx', '0.26.0', 128),
+        ('httpx', '0.27.0', 0),
+    ]
+
+
+def test_fail_fast() -> None:
+    """Test scan stopped on first delta reached threshold."""
+    started = []
+
+    def delta(name: str, version: str) -> DaysDelta:  # noqa: WPS430
+        started.append(version)
+        return DaysDelta(
+            version,
+            FkVersionList([
+                FkPackage(name, '0.25.2', datetime.date(2023, 11, 24)),
+                FkPackage(name, '0.26.0', datetime.date(2023, 12, 20)),
+            ]),
+            datetime.date(2024, 6, 28),
+        )
+
+    got = asyncio.run(ConcurrentScan(
+        [('httpx', '0.25.2'), *[('httpx', '0.26.0') for _ in range(20)]],
+        delta,
+        'pypi.org',
+        HostLimits.ctor({'pypi.org': 1}),
+        100,
+    ).rows())
+
+    assert got == [('httpx', '0.25.2', 191)]
+    assert len(started) <= 2
+
+
+def test_empty() -> None:
+    """Test scan without dependencies."""
+    got = asyncio.run(ConcurrentScan(
+        [],
+        lambda _, version: DaysDelta(
+            version,
+            FkVersionList([]),
+            datetime.date(2024, 6, 28),
+        ),
+        'pypi.org',
+        HostLimits.ctor(),
+    ).rows())
+
+    assert got == []
+
+
+def test_host_limit() -> None:
+    """Test host limits."""
+    limits = HostLimits.ctor({'hex.pm': 2, 'pypi.org': 0})
+
+    assert limits.limit('hex.pm') == 2
+    assert limits.limit('pypi.org') == 1
+    assert limits.limit('registry.npmjs.org') == 8
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test conditional requests."""
+
+import datetime
+from collections.abc import Generator
+from pathlib import Path
+
+import httpx
+import pytest
+from respx.router import MockRouter
+from time_machine import TimeMachineFixture
+
+from deltaver._internal.cached_sorted_versions import CachedSortedVersions
+from deltaver._internal.conditional_transport import cache_validators
+from deltaver._internal.exceptions import NotModifiedError
+from deltaver._internal.pooled_client import PooledClient
+from deltaver._internal.pypi_package_list import PypiPackageList
+from deltaver._internal.sqlite_cache import SqliteCache
+
+
+@pytest.fixture
+def client() -> Generator[httpx.Client, None, None]:
+    """Pooled http client."""
+    with PooledClient(5).client() as pooled_client:
+        yield pooled_client
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Generator[SqliteCache, None, None]:
+    """Sqlite cache."""
+    sqlite_cache = SqliteCache.ctor(tmp_path, datetime.timedelta(days=1))
+    yield sqlite_cache
+    sqlite_cache.close()
+
+
+def test_without_validators(client: httpx.Client, respx_mock: MockRouter) -> None:
+    """Test request without cached document not conditional."""
+    route = respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(200, json={}))
+    client.get('https://pypi.org/pypi/smmap/json')
+
+    assert 'If-None-Match' not in route.calls.last.request.headers
+
+
+def test_not_modified(client: httpx.Client, respx_mock: MockRouter) -> None:
+    """Test not modified response."""
+    route = respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(304))
+    token = cache_validators.set({'etag': '"abc"', 'last-modified': 'Mon, 05 Feb 2024 00:00:00 GMT'})
+    with pytest.raises(NotModifiedError):
+        client.get('https://pypi.org/pypi/smmap/json')
+    cache_validators.reset(token)
+
+    headers = route.calls.last.request.headers
+    assert headers['If-None-Match'] == '"abc"'
+    assert headers['If-Modified-Since'] == 'Mon, 05 Feb 2024 00:00:00 GMT'
+
+
+def test_same_serial(client: httpx.Client, respx_mock: MockRouter) -> None:
+    """Test pypi response with same serial treated as not modified."""
+    respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(
+        200,
+        json={},
+        headers={'X-PyPI-Last-Serial': '42'},
+    ))
+    token = cache_validators.set({'x-pypi-last-serial': '42'})
+    with pytest.raises(NotModifiedError):
+        client.get('https://pypi.org/pypi/smmap/json')
+    cache_validators.reset(token)
+
+
+def test_revalidate_expired(
+    client: httpx.Client,
+    cache: SqliteCache,
+    respx_mock: MockRouter,
+    time_machine: TimeMachineFixture,
+) -> None:
+    """Test expired cache entry revalidated."""
+    time_machine.move_to(datetime.datetime(2024, 2, 5, tzinfo=datetime.timezone.utc))
+    route = respx_mock.get('https://pypi.org/pypi/smmap/json').mock(side_effect=[
+        httpx.Response(200, text=Path('tests/fixtures/smmap_pypi_response.json').read_text(), headers={'ETag': '"v1"'}),
+        httpx.Response(304),
+    ])
+    versions = CachedSortedVersions(PypiPackageList('smmap', client), cache, 'pypi', 'https://pypi.org', 'smmap')
+    fetched = [package.release_date() for package in versions.as_list()]
+    time_machine.move_to(datetime.datetime(2024, 2, 7, tzinfo=datetime.timezone.utc))
+    got = [package.release_date() for package in versions.as_list()]
+    versions.as_list()
+
+    assert got == fetched
+    assert route.call_count == 2
+    assert route.calls.last.request.headers.get('If-None-Match') == '"v1"'
@@ -22,6 +22,15 @@ def test_cli_only() -> None:
             'fail_on_max': None,
             'file_format': None,
             'path_to_file': None,
+            'concurrency': {},
+            'timeout': None,
+            'golang_resolution': None,
+            'cache_ttl': None,
+            'pypi_api': None,
+            'index_url': None,
+            'fail_fast': None,
+            'lagging_first': None,
+            'deadline': None,
         }),
     )
 
@@ -31,6 +40,15 @@ def test_cli_only() -> None:
         'fail_on_max': -1,
         'file_format': Formats.pip_freeze,
         'path_to_file': Path(),
+        'concurrency': {},
+        'timeout': 10,
+        'golang_resolution': 'successor',
+        'cache_ttl': 86400,
+        'pypi_api': 'json',
+        'index_url': 'https://pypi.org/simple',
+        'fail_fast': False,
+        'lagging_first': False,
+        'deadline': -1,
     }
 
 
@@ -46,6 +64,15 @@ def test_with_pyproject() -> None:
             'excluded': [],
             'file_format': None,
             'path_to_file': None,
+            'concurrency': {},
+            'timeout': None,
+            'golang_resolution': None,
+            'cache_ttl': None,
+            'pypi_api': None,
+            'index_url': None,
+            'fail_fast': None,
+            'lagging_first': None,
+            'deadline': None,
         }),
     )
 
@@ -55,6 +82,15 @@ def test_with_pyproject() -> None:
         'fail_on_max': 20,
         'file_format': Formats.pip_freeze,
         'path_to_file': Path(),
+        'concurrency': {},
+        'timeout': 10,
+        'golang_resolution': 'successor',
+        'cache_ttl': 86400,
+        'pypi_api': 'json',
+        'index_url': 'https://pypi.org/simple',
+        'fail_fast': False,
+        'lagging_first': False,
+        'deadline': -1,
     }
 
 
@@ -70,6 +106,15 @@ def test_fail_not_filled() -> None:
             'excluded': [],
             'file_format': None,
             'path_to_file': None,
+            'concurrency': {},
+            'timeout': None,
+            'golang_resolution': None,
+            'cache_ttl': None,
+            'pypi_api': None,
+            'index_url': None,
+            'fail_fast': None,
+            'lagging_first': None,
+            'deadline': None,
         }),
     )
 
@@ -79,4 +124,13 @@ def test_fail_not_filled() -> None:
         'fail_on_max': -1,
         'file_format': Formats.pip_freeze,
         'path_to_file': Path(),
+        'concurrency': {},
+        'timeout': 10,
+        'golang_resolution': 'successor',
+        'cache_ttl': 86400,
+        'pypi_api': 'json',
+        'index_url': 'https://pypi.org/simple',
+        'fail_fast': False,
+        'lagging_first': False,
+        'deadline': -1,
     }
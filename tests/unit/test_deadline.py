@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test deadline-bounded scan."""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from typing import final
+
+import attrs
+import httpx
+import pytest
+from typing_extensions import override
+
+from deltaver._internal.concurrent_scan import ConcurrentScan
+from deltaver._internal.deadline import Deadline
+from deltaver._internal.deadline_transport import DeadlineTransport
+from deltaver._internal.delta import Delta
+from deltaver._internal.exceptions import DeadlineExceededError
+from deltaver._internal.host_limits import HostLimits
+
+
+@final
+@attrs.define(frozen=True)
+class _BlockedDelta(Delta):
+
+    _release: threading.Event
+    _days: int
+
+    @override
+    def days(self) -> int:
+        self._release.wait(timeout=5)
+        return self._days
+
+
+def test_request_timeout() -> None:
+    """Test timeouts of request bounded by remaining budget."""
+    timeouts = []
+
+    def registry(request: httpx.Request) -> httpx.Response:  # noqa: WPS430
+        timeouts.append(request.extensions['timeout'])
+        return httpx.Response(200)
+
+    with httpx.Client(
+        transport=DeadlineTransport(httpx.MockTransport(registry), Deadline.ctor(2)),
+        timeout=httpx.Timeout(10, pool=1),
+    ) as client:
+        client.get('https://pypi.org/pypi/httpx/json')
+
+    assert 0 < timeouts[0]['read'] <= 2
+    assert timeouts[0]['pool'] == 1
+
+
+def test_request_after_deadline() -> None:
+    """Test request not sent after deadline."""
+    transport = DeadlineTransport(
+        httpx.MockTransport(lambda _: httpx.Response(200)),
+        Deadline.ctor(0),
+    )
+
+    with httpx.Client(transport=transport) as client, pytest.raises(DeadlineExceededError):
+        client.get('https://pypi.org/pypi/httpx/json')
+
+
+def test_cancel() -> None:
+    """Test cancelled budget exhausted."""
+    deadline = Deadline.ctor()
+    deadline.cancel()
+
+    assert deadline.remaining() == 0
+
+
+def test_body_after_cancel() -> None:
+    """Test reading of response body aborted after cancel."""
+    deadline = Deadline.ctor()
+
+    def chunks() -> Iterator[bytes]:  # noqa: WPS430
+        yield b'{"releases": '
+        deadline.cancel()
+        yield b'{}}'
+
+    transport = DeadlineTransport(
+        httpx.MockTransport(lambda _: httpx.Response(200, content=chunks())),
+        deadline,
+    )
+
+    with httpx.Client(transport=transport) as client, pytest.raises(DeadlineExceededError):
+        client.get('https://pypi.org/pypi/httpx/json')
+
+
+def test_unresolved() -> None:
+    """Test dependencies not resolved before deadline marked."""
+    released = threading.Event()
+    blocked = threading.Event()
+    released.set()
+    got = asyncio.run(ConcurrentScan(
+        [('httpx', '0.25.2'), ('smmap', '5.0.0')],
+        lambda name, _: _BlockedDelta(released if name == 'httpx' else blocked, 64),
+        'pypi.org',
+        HostLimits.ctor(),
+        -1,
+        Deadline.ctor(0.2),
+    ).rows())
+    blocked.set()
+
+    assert got == [('httpx', '0.25.2', 64), ('smmap', '5.0.0', -1)]
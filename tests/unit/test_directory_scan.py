@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test scan of lockfiles in directory tree."""
+
+import datetime
+from contextlib import closing
+from pathlib import Path
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from deltaver._internal.config import ScanOptions
+from deltaver._internal.directory_scan import DirectoryScan
+from deltaver._internal.discovered_lockfiles import DiscoveredLockfiles
+from deltaver._internal.formats import Formats
+from deltaver._internal.sqlite_cache import SqliteCache
+
+
+def test_discovered(tmp_path: Path) -> None:
+    """Test lockfiles detected by name."""
+    for lockfile in (
+        'requirements.txt',
+        'api/poetry.lock',
+        'api/requirements-dev.txt',
+        'web/package-lock.json',
+        'web/node_modules/vue/package-lock.json',
+        'svc/go.sum',
+        'svc/go.mod',
+        'elixir/mix.lock',
+        '.git/mix.lock',
+    ):
+        (tmp_path / lockfile).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / lockfile).write_text('')
+
+    got = DiscoveredLockfiles(tmp_path).files()
+
+    assert got == [
+        (tmp_path / 'api/poetry.lock', Formats.poetry_lock),
+        (tmp_path / 'api/requirements-dev.txt', Formats.pip_freeze),
+        (tmp_path / 'elixir/mix.lock', Formats.mix_lock),
+        (tmp_path / 'requirements.txt', Formats.pip_freeze),
+        (tmp_path / 'svc/go.sum', Formats.golang),
+        (tmp_path / 'web/package-lock.json', Formats.npm_lock),
+    ]
+
+
+def test_shared_lookups(  # noqa: WPS210
+    tmp_path: Path,
+    respx_mock: MockRouter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test package of many lockfiles looked up once."""
+    smmap_route = respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(
+        200,
+        text=Path('tests/fixtures/smmap_pypi_response.json').read_text(),
+    ))
+    respx_mock.get('https://pypi.org/pypi/httpx/json').mock(return_value=httpx.Response(
+        200,
+        text=Path('tests/fixtures/httpx_pypi_response.json').read_text(),
+    ))
+    monkeypatch.chdir(tmp_path)
+    Path('api').mkdir()
+    Path('api/requirements.txt').write_text('smmap==5.0.0\nhttpx==0.25.2\n')
+    Path('requirements-dev.txt').write_text('SMMAP==5.0.0\n')
+    with httpx.Client() as client:
+        got = dict(DirectoryScan(
+            DiscoveredLockfiles(Path()).files(),
+            [],
+            ScanOptions(),
+            client,
+        ).files())
+
+    api_deltas = {name: delta for name, _, delta in got[Path('api/requirements.txt')]}
+    assert smmap_route.call_count == 1
+    assert sorted(api_deltas) == ['httpx', 'smmap']
+    assert got[Path('requirements-dev.txt')] == [('SMMAP', '5.0.0', api_deltas['smmap'])]
+
+
+def test_lagging_first(  # noqa: WPS210
+    tmp_path: Path,
+    respx_mock: MockRouter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test lookups ordered by lags of previous run and lags of run saved."""
+    for package_name in ('smmap', 'httpx'):
+        respx_mock.get('https://pypi.org/pypi/{0}/json'.format(package_name)).mock(return_value=httpx.Response(
+            200,
+            text=Path('tests/fixtures/{0}_pypi_response.json'.format(package_name)).read_text(),
+        ))
+    monkeypatch.chdir(tmp_path)
+    ttl = datetime.timedelta(days=1)
+    with closing(SqliteCache.ctor(Path('.deltaver_cache'), ttl)) as previous_run:
+        previous_run.save_lags('pypi', 'https://pypi.org', {'smmap': 10, 'httpx': 300})
+    Path('api').mkdir()
+    Path('api/requirements.txt').write_text('smmap==5.0.0\n')
+    Path('requirements.txt').write_text('httpx==0.25.2\n')
+    with httpx.Client() as client:
+        got = dict(DirectoryScan(
+            DiscoveredLockfiles(Path()).files(),
+            [],
+            ScanOptions({'lagging_first': True, 'concurrency': {'pypi.org': 1}}),
+            client,
+        ).files())
+    with closing(SqliteCache.ctor(Path('.deltaver_cache'), ttl)) as cache:
+        lags = cache.lags('pypi', 'https://pypi.org')
+
+    assert [call.request.url.path for call in respx_mock.calls] == ['/pypi/httpx/json', '/pypi/smmap/json']
+    deltas = {name: delta for rows in got.values() for name, _, delta in rows}
+    assert lags == deltas
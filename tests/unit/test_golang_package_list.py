@@ -7,11 +7,19 @@ import datetime
 import json
 
 import pytest
-from httpx import Response
+from httpx import Client, Response
 from respx.router import MockRouter
 
-from deltaver._internal.fk_package import FkPackage
+from deltaver._internal.dated_package import DatedPackage
+from deltaver._internal.days_delta import DaysDelta
+from deltaver._internal.filtered_package_list import FilteredPackageList
+from deltaver._internal.golang_package import GolangPackage
 from deltaver._internal.golang_package_list import GolangPackageList
+from deltaver._internal.golang_tag_list import GolangTagList
+from deltaver._internal.package_record import PackageRecord
+from deltaver._internal.pinned_package_list import PinnedPackageList
+from deltaver._internal.sorted_package_list import SortedPackageList
+from deltaver._internal.successor_package_list import SuccessorPackageList
 
 
 @pytest.fixture
@@ -55,14 +63,95 @@ def _mock_golang_proxy(respx_mock: MockRouter) -> None:
 def test() -> None:
     """Test golang package list."""
     package = 'github.com/cpuguy83/go-md2man/v2'
-    got = GolangPackageList(package).as_list()
+    got = GolangPackageList.ctor(package, Client()).as_list()
 
     assert got == [
-        FkPackage(package, 'v2.0.0', datetime.date(2019, 3, 14)),
-        FkPackage(package, 'v2.0.1', datetime.date(2021, 7, 16)),
-        FkPackage(package, 'v2.0.2', datetime.date(2022, 4, 22)),
-        FkPackage(package, 'v2.0.3', datetime.date(2023, 10, 10)),
-        FkPackage(package, 'v2.0.4', datetime.date(2024, 3, 18)),
-        FkPackage(package, 'v2.0.5', datetime.date(2024, 9, 16)),
-        FkPackage(package, 'v2.0.6', datetime.date(2024, 12, 16)),
+        PackageRecord.ctor(package, 'v2.0.0', datetime.date(2019, 3, 14), 'golang'),
+        PackageRecord.ctor(package, 'v2.0.1', datetime.date(2021, 7, 16), 'golang'),
+        PackageRecord.ctor(package, 'v2.0.2', datetime.date(2022, 4, 22), 'golang'),
+        PackageRecord.ctor(package, 'v2.0.3', datetime.date(2023, 10, 10), 'golang'),
+        PackageRecord.ctor(package, 'v2.0.4', datetime.date(2024, 3, 18), 'golang'),
+        PackageRecord.ctor(package, 'v2.0.5', datetime.date(2024, 9, 16), 'golang'),
+        PackageRecord.ctor(package, 'v2.0.6', datetime.date(2024, 12, 16), 'golang'),
     ]
+
+
+@pytest.mark.usefixtures('_mock_golang_proxy')
+def test_successor(respx_mock: MockRouter) -> None:
+    """Test only successor release date fetched."""
+    package = 'github.com/cpuguy83/go-md2man/v2'
+    client = Client()
+    got = SuccessorPackageList(
+        SortedPackageList(FilteredPackageList(GolangTagList(package, client))),
+        'v2.0.3',
+        'golang',
+    ).as_list()
+
+    assert got == [
+        GolangPackage(package, 'v2.0.3', client),
+        DatedPackage(GolangPackage(package, 'v2.0.4', client), datetime.date(2024, 3, 18)),
+    ]
+    assert respx_mock.calls.call_count == 2
+
+
+@pytest.mark.usefixtures('_mock_golang_proxy')
+def test_successor_not_found(respx_mock: MockRouter) -> None:
+    """Test successor without info skipped."""
+    package = 'github.com/cpuguy83/go-md2man/v2'
+    respx_mock.get('https://proxy.golang.org/{0}/@v/v2.0.4.info'.format(package)).mock(
+        return_value=Response(404),
+    )
+    got = DaysDelta(
+        'v2.0.3',
+        SuccessorPackageList(
+            SortedPackageList(FilteredPackageList(GolangTagList(package, Client()))),
+            'v2.0.3',
+            'golang',
+        ),
+        datetime.date(2024, 10, 16),
+        'golang',
+    ).days()
+
+    assert got == 30
+    assert respx_mock.calls.call_count == 3
+
+
+@pytest.mark.usefixtures('_mock_golang_proxy')
+def test_successor_latest(respx_mock: MockRouter) -> None:
+    """Test latest version without info requests."""
+    package = 'github.com/cpuguy83/go-md2man/v2'
+    got = SuccessorPackageList(
+        SortedPackageList(FilteredPackageList(GolangTagList(package, Client()))),
+        'v2.0.6',
+        'golang',
+    ).as_list()
+
+    assert len(got) == 1
+    assert respx_mock.calls.call_count == 1
+
+
+@pytest.mark.usefixtures('_mock_golang_proxy')
+def test_pseudo_version(respx_mock: MockRouter) -> None:
+    """Test pseudo-version date decoded without request."""
+    package = 'github.com/cpuguy83/go-md2man/v2'
+    version = 'v2.0.4-0.20231201120000-abcdef123456'
+    client = Client()
+    got = DaysDelta(
+        version,
+        SuccessorPackageList(
+            PinnedPackageList(
+                SortedPackageList(
+                    FilteredPackageList(GolangTagList(package, client)),
+                ),
+                GolangPackage(package, version, client),
+            ),
+            version,
+            'golang',
+        ),
+        datetime.date(2024, 10, 16),
+        'golang',
+    ).days()
+
+    assert got == 212
+    assert GolangPackage(package, version, client).release_date() == datetime.date(2023, 12, 1)
+    assert respx_mock.calls.call_count == 2
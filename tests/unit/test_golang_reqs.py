@@ -26,3 +26,13 @@ def test_last_version() -> None:
     ])).reqs()
 
     assert got == [('github.com/aws/aws-sdk-go-v2', 'v1.38.1')]
+
+
+def test_pseudo_version_after_tag() -> None:
+    """Test pseudo-version newer than tagged version."""
+    got = GolangReqs('\n'.join([
+        'golang.org/x/sys v0.1.0 h1:kunALQeHf1/185U1i0GOB/fy1IPRDDpuoOOqRReG57U=',
+        'golang.org/x/sys v0.1.1-0.20221102194838-fc697a31fa06 h1:xBb8c0ZoJ2XvxZWOVfb4wh4uyVdfq8lq4hVvmBQyoJk=',
+    ])).reqs()
+
+    assert got == [('golang.org/x/sys', 'v0.1.1-0.20221102194838-fc697a31fa06')]
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test merged scans."""
+
+import asyncio
+import threading
+from typing import final
+
+import attrs
+from typing_extensions import override
+
+from deltaver._internal.concurrent_scan import ConcurrentScan
+from deltaver._internal.deadline import Deadline
+from deltaver._internal.delta import Delta
+from deltaver._internal.host_limits import HostLimits
+from deltaver._internal.merged_scans import MergedScans
+
+
+@final
+@attrs.define(frozen=True)
+class _ReleasedDelta(Delta):
+
+    _release: threading.Event
+    _finished: list[str]
+    _days: int
+
+    @override
+    def days(self) -> int:
+        self._release.wait(timeout=5)
+        self._finished.append('done')
+        return self._days
+
+
+def test_fail_fast_stops_scans() -> None:
+    """Test fail fast of one scan stops scans sharing deadline."""
+    released = threading.Event()
+    blocked = threading.Event()
+    released.set()
+    finished: list[str] = []
+    deadline = Deadline.ctor()
+    got = asyncio.run(_rows(MergedScans([
+        ConcurrentScan(
+            [('httpx', '0.25.2')],
+            lambda *_: _ReleasedDelta(released, [], 191),
+            'pypi.org',
+            HostLimits.ctor(),
+            100,
+            deadline,
+        ),
+        ConcurrentScan(
+            [('left-pad', '1.3.0')],
+            lambda *_: _ReleasedDelta(blocked, finished, 0),
+            'registry.npmjs.org',
+            HostLimits.ctor(),
+            100,
+            deadline,
+        ),
+    ])))
+    assert got == [(0, ('httpx', '0.25.2', 191))]
+    assert not finished
+    assert deadline.cancelled()
+    blocked.set()
+
+
+async def _rows(scans: MergedScans) -> list[tuple[int, tuple[str, str, int]]]:  # noqa: WPS234
+    return [row async for row in scans.stream()]
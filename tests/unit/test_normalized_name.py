@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test package names normalized by ecosystem rules."""
+
+from pathlib import Path
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from deltaver._internal.normalized_name import NormalizedName
+from deltaver._internal.npmjs_package_list import NpmjsPackageList
+
+
+@pytest.mark.parametrize(('ecosystem', 'name', 'expected'), [
+    ('pypi', 'Django', 'django'),
+    ('pypi', 'zope.interface', 'zope-interface'),
+    ('pypi', 'typing__extensions', 'typing-extensions'),
+    ('golang', 'github.com/BurntSushi/toml', 'github.com/!burnt!sushi/toml'),
+    ('golang', 'golang.org/x/sys', 'golang.org/x/sys'),
+    ('npm', 'JSONStream', 'JSONStream'),
+    ('npm', 'node_modules/@types/node', '@types/node'),
+    ('npm', '@types%2Fnode', '@types/node'),
+    ('hex', 'Jason', 'jason'),
+])
+def test_normalized(ecosystem: str, name: str, expected: str) -> None:
+    """Test normalized name."""
+    assert str(NormalizedName(ecosystem, name)) == expected
+
+
+def test_npm_case_kept_in_url(respx_mock: MockRouter) -> None:
+    """Test npm package with upper-case letters requested by its own name."""
+    route = respx_mock.get('https://registry.npmjs.org/JSONStream').mock(return_value=httpx.Response(
+        200,
+        text=Path('tests/fixtures/vue_npmjs_response.json').read_text(),
+    ))
+    with httpx.Client() as client:
+        NpmjsPackageList('JSONStream', client).as_list()
+
+    assert route.called
@@ -83,7 +83,7 @@ def test_sorted_package_list() -> None:
 @pytest.mark.usefixtures('_pypi_mock')
 def test_skip_removed() -> None:
     """Test skip yanked versions."""
-    got = PypiPackageList('smmap').as_list()
+    got = PypiPackageList('smmap', httpx.Client()).as_list()
 
     assert len(got) == 15
     assert '6.0.0' not in {elem.version() for elem in got}
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test package with version parsed once."""
+
+import datetime
+
+import pytest
+
+from deltaver._internal.exceptions import InvalidVersionError
+from deltaver._internal.fk_package import FkPackage
+from deltaver._internal.fk_version_list import FkVersionList
+from deltaver._internal.package_record import PackageRecord
+from deltaver._internal.sorted_package_list import SortedPackageList
+
+
+def test_same_as_fk_package() -> None:
+    """Test record behaves like fake package."""
+    record = PackageRecord.ctor('httpx', 'v0.25.2', datetime.date(2023, 11, 24))
+    package = FkPackage('httpx', 'v0.25.2', datetime.date(2023, 11, 24))
+
+    assert (record.name(), record.version(), record.release_date()) == (
+        package.name(),
+        package.version(),
+        package.release_date(),
+    )
+    assert record.release_ordinal() == datetime.date(2023, 11, 24).toordinal()
+
+
+def test_interned_version() -> None:
+    """Test equal version strings share parsed version."""
+    first = PackageRecord.ctor('httpx', '0.25.2', datetime.date(2023, 11, 24))
+    second = PackageRecord.ctor('httpx', '0.25.2', datetime.date(2023, 11, 24))
+
+    assert first.version() is second.version()
+
+
+def test_sorted() -> None:
+    """Test records sorted by version."""
+    got = SortedPackageList(FkVersionList([
+        PackageRecord.ctor('httpx', '0.26.0', datetime.date(2023, 12, 20)),
+        PackageRecord.ctor('httpx', '0.9.0', datetime.date(2019, 12, 20)),
+    ])).as_list()
+
+    assert [str(package.version()) for package in got] == ['0.9.0', '0.26.0']
+
+
+def test_invalid_version() -> None:
+    """Test invalid version."""
+    with pytest.raises(InvalidVersionError):
+        PackageRecord.ctor('httpx', 'not-a-version', datetime.date(2023, 11, 24))
@@ -3,14 +3,18 @@
 
 """Test parse pip requirements."""
 
+import datetime
 from pathlib import Path
 
 import pytest
 
+from deltaver._internal.excluded_reqs import ExcludedReqs
 from deltaver._internal.freezed_reqs import FreezedReqs
 from deltaver._internal.golang_reqs import GolangReqs
+from deltaver._internal.lagging_first_reqs import LaggingFirstReqs
 from deltaver._internal.package_lock_reqs import PackageLockReqs
 from deltaver._internal.poetry_lock_reqs import PoetryLockReqs
+from deltaver._internal.sqlite_cache import SqliteCache
 
 
 @pytest.mark.parametrize(
@@ -131,8 +135,42 @@ def test_golang_reqs() -> None:
             'github.com/urfave/cli/v2',
             'v2.27.5',
         ),
+        (
+            'github.com/xrash/smetrics',
+            'v0.0.0-20240521201337-686a1a2994c1',
+        ),
+        (
+            'gopkg.in/check.v1',
+            'v0.0.0-20161208181325-20d25e280405',
+        ),
         (
             'gopkg.in/yaml.v3',
             'v3.0.1',
         ),
     ]
+
+
+def test_lagging_first(tmp_path: Path) -> None:
+    """Test requirements ordered by delta of previous run."""
+    cache = SqliteCache.ctor(tmp_path, datetime.timedelta(days=1))
+    cache.save_lags('pypi', 'https://pypi.org', {'Django': 40, 'smmap': 132, 'httpx': 0})
+    lags = cache.lags('pypi', 'https://pypi.org')
+    cache.close()
+    got = LaggingFirstReqs(
+        [('httpx', '0.25.2'), ('attrs', '23.1.0'), ('django', '4.2'), ('smmap', '5.0.0')],
+        lags,
+        'pypi',
+    ).reqs()
+
+    assert [name for name, _ in got] == ['smmap', 'django', 'httpx', 'attrs']
+
+
+def test_excluded_normalized() -> None:
+    """Test excluded requirements matched by normalized names."""
+    got = ExcludedReqs(
+        FreezedReqs('Django_Filter==23.5\nsmmap==5.0.0\nzope.interface==6.1'),
+        ['django-filter', 'Zope-Interface'],
+        'pypi',
+    ).reqs()
+
+    assert got == [('smmap', '5.0.0')]
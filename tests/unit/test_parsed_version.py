@@ -3,8 +3,11 @@
 
 """Unit tests for parsed version module."""
 
+import datetime
+
 import pytest
 
+from deltaver._internal.golang_pseudo_version import GolangPseudoVersion
 from deltaver._internal.parsed_version import ParsedVersion
 
 
@@ -52,3 +55,21 @@ def test_zero_before_int() -> None:
 def test_four_char() -> None:
     """Test four char."""
     assert str(ParsedVersion('3.0.0.0').parse()) == '3.0.0.0'
+
+
+@pytest.mark.parametrize(('version', 'expected'), [
+    ('v0.0.0-20240521201337-686a1a2994c1', '0.0.0.dev20240521201337'),
+    ('v1.2.4-0.20210927160543-abcdef123456', '1.2.4.dev20210927160543'),
+    ('v1.2.3-rc.1.0.20210927160543-abcdef123456', '1.2.3rc1.post0.dev20210927160543'),
+    ('v2.0.0-20161208181325-20d25e280405+incompatible', '2.0.0.dev20161208181325'),
+])
+def test_golang_pseudo_version(version: str, expected: str) -> None:
+    """Test golang pseudo-version parsing."""
+    assert str(ParsedVersion(version).parse()) == expected
+
+
+def test_golang_pseudo_version_date() -> None:
+    """Test golang pseudo-version commit date."""
+    assert GolangPseudoVersion(
+        'v1.2.4-0.20210927160543-abcdef123456',
+    ).release_date() == datetime.date(2021, 9, 27)
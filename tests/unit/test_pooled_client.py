@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test pooled http client."""
+
+from pathlib import Path
+
+from httpx import Response
+from respx.router import MockRouter
+
+from deltaver._internal.npmjs_package_list import NpmjsPackageList
+from deltaver._internal.pooled_client import PooledClient
+from deltaver._internal.pypi_package_list import PypiPackageList
+
+
+def test_shared_between_backends(respx_mock: MockRouter) -> None:
+    """Test one client serve all registry backends."""
+    pypi_route = respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=Response(
+        200,
+        text=Path('tests/fixtures/smmap_pypi_response.json').read_text(),
+    ))
+    npm_route = respx_mock.get('https://registry.npmjs.org/vue').mock(return_value=Response(
+        200,
+        text=Path('tests/fixtures/vue_npmjs_response.json').read_text(),
+    ))
+    with PooledClient(5).client() as client:
+        pypi_packages = PypiPackageList('smmap', client).as_list()
+        npm_packages = NpmjsPackageList('vue', client).as_list()
+
+    assert len(pypi_packages) == 15
+    assert len(npm_packages) > 0
+    assert pypi_route.call_count == 1
+    assert npm_route.call_count == 1
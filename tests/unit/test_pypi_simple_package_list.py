@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test pypi package list from simple repository API."""
+
+import datetime
+from pathlib import Path
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from deltaver._internal.pypi_package_list import PypiPackageList
+from deltaver._internal.pypi_simple_package_list import PypiSimplePackageList
+
+
+def test_same_as_json_api(respx_mock: MockRouter) -> None:
+    """Test simple API gives same releases as JSON API."""
+    respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(
+        200,
+        text=Path('tests/fixtures/smmap_pypi_response.json').read_text(),
+    ))
+    simple_route = respx_mock.get('https://pypi.org/simple/smmap/').mock(return_value=httpx.Response(
+        200,
+        text=Path('tests/fixtures/smmap_simple_response.json').read_text(),
+        headers={'Content-Type': 'application/vnd.pypi.simple.v1+json'},
+    ))
+    client = httpx.Client()
+
+    got = PypiSimplePackageList('smmap', client, 'https://pypi.org/simple').as_list()
+
+    assert sorted((package.version(), package.release_date()) for package in got) == sorted(
+        (package.version(), package.release_date()) for package in PypiPackageList('smmap', client).as_list()
+    )
+    assert simple_route.calls.last.request.headers['Accept'] == 'application/vnd.pypi.simple.v1+json'
+
+
+def test_private_index(respx_mock: MockRouter, caplog: pytest.LogCaptureFixture) -> None:
+    """Test private index with normalized name, yanked and unknown files."""
+    respx_mock.get('https://pypi.example.com/simple/my-package/').mock(return_value=httpx.Response(200, json={
+        'meta': {'api-version': '1.1'},
+        'name': 'my-package',
+        'files': [
+            {'filename': 'my_package-1.0.0-py3-none-any.whl', 'upload-time': '2024-01-02T10:00:00Z', 'yanked': False},
+            {'filename': 'my_package-1.0.0.tar.gz', 'upload-time': '2024-01-01T23:00:00.123456Z', 'yanked': False},
+            {'filename': 'my_package-1.1.0.tar.gz', 'upload-time': '2024-02-01T00:00:00Z', 'yanked': 'broken'},
+            {'filename': 'my_package-1.2.0.tar.gz', 'yanked': False},
+            {'filename': 'my_package-1.3.0.txt', 'upload-time': '2024-03-01T00:00:00Z', 'yanked': False},
+        ],
+    }))
+
+    got = PypiSimplePackageList('My_Package', httpx.Client(), 'https://pypi.example.com/simple/').as_list()
+
+    assert [(str(package.version()), package.release_date()) for package in got] == [
+        ('1.0.0', datetime.date(2024, 1, 1)),
+    ]
+    assert 'upload time of My_Package 1.2.0, these releases are skipped' in caplog.text
+
+
+def test_legacy_formats(respx_mock: MockRouter) -> None:
+    """Test versions of sdist and bdist files of legacy formats."""
+    respx_mock.get('https://pypi.example.com/simple/zope-interface/').mock(return_value=httpx.Response(200, json={
+        'meta': {'api-version': '1.1'},
+        'name': 'zope-interface',
+        'files': [
+            {'filename': 'zope.interface-3.5.0.tar.bz2', 'upload-time': '2009-01-01T00:00:00Z'},
+            {'filename': 'zope.interface-3.6.0-py2.6-win32.egg', 'upload-time': '2010-01-01T00:00:00Z'},
+            {'filename': 'zope.interface-3.7.0.win32-py2.7.exe', 'upload-time': '2011-01-01T00:00:00Z'},
+            {'filename': 'zope.interface-3.8.0.tgz', 'upload-time': '2012-01-01T00:00:00Z'},
+        ],
+    }))
+
+    got = PypiSimplePackageList('zope.interface', httpx.Client(), 'https://pypi.example.com/simple').as_list()
+
+    assert [str(package.version()) for package in got] == ['3.5.0', '3.6.0', '3.7.0', '3.8.0']
+
+
+def test_html_index(respx_mock: MockRouter) -> None:
+    """Test index without JSON form of simple API."""
+    respx_mock.get('https://pypi.example.com/simple/smmap/').mock(return_value=httpx.Response(
+        200,
+        html='<!DOCTYPE html><html></html>',
+    ))
+
+    with pytest.raises(ValueError, match='does not serve JSON'):
+        PypiSimplePackageList('smmap', httpx.Client(), 'https://pypi.example.com/simple').as_list()
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test adaptive rate limit of registry hosts."""
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from deltaver._internal.host_rate_limit import HostRateLimit
+from deltaver._internal.pooled_client import PooledClient
+from deltaver._internal.token_bucket import TokenBucket
+
+
+def test_retry_after(respx_mock: MockRouter) -> None:
+    """Test throttled request retried."""
+    route = respx_mock.get('https://hex.pm/api/packages/jason').mock(side_effect=[
+        httpx.Response(429, headers={'Retry-After': '0'}),
+        httpx.Response(503, headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}),
+        httpx.Response(200, json={'releases': []}),
+    ])
+    with PooledClient(5).client() as client:
+        response = client.get('https://hex.pm/api/packages/jason')
+
+    assert response.status_code == 200
+    assert route.call_count == 3
+
+
+def test_retries_exhausted(respx_mock: MockRouter) -> None:
+    """Test response of registry returned after retries."""
+    route = respx_mock.get('https://hex.pm/api/packages/jason').mock(
+        return_value=httpx.Response(429, headers={'Retry-After': '0'}),
+    )
+    with PooledClient(5).client() as client, pytest.raises(httpx.HTTPStatusError):
+        client.get('https://hex.pm/api/packages/jason').raise_for_status()
+
+    assert route.call_count == 4
+
+
+def test_shared_between_processes(tmp_path: Path) -> None:
+    """Test throttling seen through state file."""
+    HostRateLimit.ctor(tmp_path / 'ratelimit.json').throttled('hex.pm', 30)
+
+    assert 29 < HostRateLimit.ctor(tmp_path / 'ratelimit.json').wait('hex.pm') <= 30
+    assert not HostRateLimit.ctor(tmp_path / 'ratelimit.json').wait('pypi.org')
+
+
+def test_synced_on_interval_and_throttling(tmp_path: Path) -> None:
+    """Test state kept in process between syncs, directory created on first sync."""
+    path = tmp_path / 'cache/ratelimit.json'
+    rate_limit = HostRateLimit.ctor(path, interval=60)
+
+    assert not path.parent.exists()
+    rate_limit.wait('pypi.org')
+    path.write_text('{}')
+    rate_limit.wait('pypi.org')
+    assert path.read_text() == '{}'
+    rate_limit.throttled('pypi.org', 30)
+    assert 'pypi.org' in json.loads(path.read_text())
+
+
+def test_aimd() -> None:
+    """Test rate halved on throttling and restored additively."""
+    bucket = TokenBucket.ctor(0).decreased(0)
+    for _ in range(10):
+        bucket = bucket.increased()
+
+    assert bucket.state()[0] == pytest.approx(50.2, abs=0.01)
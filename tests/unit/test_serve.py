@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test HTTP service of lag queries."""
+
+import threading
+from collections.abc import Iterator
+from functools import partial
+from http.server import ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from deltaver._internal.formats import Formats
+from deltaver._internal.lag_handler import LagHandler
+from deltaver._internal.lag_service import LagService
+from deltaver._internal.stale_releases import StaleReleases
+from deltaver._internal.versions_memo import VersionsMemo
+
+_Rows = list[tuple[str, str, int]]
+
+
+def _scan(  # noqa: PLR0917
+    scans: list[tuple[VersionsMemo, bool]],
+    lockfile_content: str,
+    file_format: Formats,
+    memo: VersionsMemo,
+    stale: StaleReleases,
+    revalidate: bool,  # noqa: FBT001
+) -> _Rows:  # noqa: WPS210
+    scans.append((memo, revalidate))
+    if lockfile_content.startswith('broken') and revalidate:
+        raise httpx.ConnectError(lockfile_content)
+    rows = []
+    for line in lockfile_content.splitlines():
+        name, version = line.split('==')
+        major = version.split('.')[0]
+        rows.append((name, version, int(major)))
+    return rows
+
+
+@pytest.fixture
+def url() -> Iterator[str]:
+    """Url of running service."""
+    service = LagService.ctor(partial(_scan, []))
+    with ThreadingHTTPServer(('127.0.0.1', 0), partial(LagHandler, service=service)) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        yield 'http://127.0.0.1:{0}'.format(server.server_address[1])
+        server.shutdown()
+        thread.join()
+
+
+def test_scanned() -> None:
+    """Test result of lockfile."""
+    got = LagService.ctor(partial(_scan, [])).scanned('smmap==30.0.0\nhttpx==10.0.0', Formats.pip_freeze)
+
+    assert got == {
+        'packages': [
+            {'name': 'smmap', 'version': '30.0.0', 'delta': 30, 'stale': None},
+            {'name': 'httpx', 'version': '10.0.0', 'delta': 10, 'stale': None},
+        ],
+        'sum_delta': 40,
+        'max_delta': 30,
+        'average_delta': 20,
+    }
+
+
+def test_refreshed() -> None:
+    """Test hot lockfiles revalidated with fresh memo swapped after refresh."""
+    scans: list[tuple[VersionsMemo, bool]] = []
+    service = LagService.ctor(partial(_scan, scans), max_hot=1)
+    service.scanned('smmap==30.0.0', Formats.pip_freeze)
+    service.scanned('httpx==10.0.0', Formats.pip_freeze)
+
+    assert service.refreshed() == 1
+
+    service.scanned('httpx==10.0.0', Formats.pip_freeze)
+    memos = [memo for memo, _ in scans]
+
+    assert [revalidate for _, revalidate in scans] == [False, False, True, False]
+    assert memos[0] is memos[1]
+    assert memos[2] is not memos[0]
+    assert memos[3] is memos[2]
+
+
+def test_refresh_failure(caplog: pytest.LogCaptureFixture) -> None:
+    """Test failed lockfile logged, others refreshed and memo swapped."""
+    scans: list[tuple[VersionsMemo, bool]] = []
+    service = LagService.ctor(partial(_scan, scans))
+    service.scanned('broken==30.0.0', Formats.pip_freeze)
+    service.scanned('httpx==10.0.0', Formats.pip_freeze)
+
+    assert service.refreshed() == 1
+    assert 'Refresh of pip-freeze lockfile failed' in caplog.text
+
+    service.scanned('httpx==10.0.0', Formats.pip_freeze)
+
+    assert scans[4][0] is scans[2][0]
+
+
+def test_batch(url: str) -> None:
+    """Test results of batch in order of lockfiles."""
+    response = httpx.post('{0}/batch'.format(url), json={'lockfiles': [
+        {'lockfile': 'smmap==30.0.0', 'format': 'pip-freeze'},
+        {'lockfile': 'httpx==10.0.0'},
+    ]})
+    answers = response.json()['results']
+
+    assert response.status_code == 200
+    assert [answer['max_delta'] for answer in answers] == [30, 10]
+
+
+def test_invalid_query(url: str) -> None:
+    """Test unknown format rejected."""
+    query = {'lockfile': '', 'format': 'gemfile'}
+    response = httpx.post('{0}/scan'.format(url), json=query)
+
+    assert response.status_code == 400
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test members of json object read from stream."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from deltaver._internal.streamed_json_members import StreamedJsonMembers
+
+
+@pytest.fixture
+def document() -> bytes:
+    """Json document."""
+    return json.dumps(
+        {
+            'name': 'pkg',
+            'versions': {'1.0.0': {'readme': r'braces {[ and "quotes" \ inside', 'size': -1.5e3}},
+            'time': {'created': '2020-01-01', '1.0.0': 'ünïcode'},
+            'flags': [True, False, None],
+        },
+        ensure_ascii=False,
+    ).encode()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 4096])
+def test_members(document: bytes, chunk_size: int) -> None:
+    """Test members of nested object."""
+    chunks = [document[idx:idx + chunk_size] for idx in range(0, len(document), chunk_size)]
+
+    assert list(StreamedJsonMembers(chunks, ('time',)).members()) == [
+        ('created', '2020-01-01'),
+        ('1.0.0', 'ünïcode'),
+    ]
+
+
+def test_root_members(document: bytes) -> None:
+    """Test members of root object."""
+    assert dict(StreamedJsonMembers([document], ()).members()) == json.loads(document)
+
+
+def test_deep_path(document: bytes) -> None:
+    """Test members of deep object."""
+    assert list(StreamedJsonMembers([document], ('versions', '1.0.0')).members()) == [
+        ('readme', r'braces {[ and "quotes" \ inside'),
+        ('size', -1500),
+    ]
+
+
+def test_absent_member(document: bytes) -> None:
+    """Test absent member."""
+    with pytest.raises(KeyError):
+        list(StreamedJsonMembers([document], ('dist-tags',)).members())
+
+
+def test_registry_document() -> None:
+    """Test real registry document."""
+    document = Path('tests/fixtures/vue_npmjs_response.json').read_bytes()
+    chunks = [document[idx:idx + 65536] for idx in range(0, len(document), 65536)]
+
+    assert dict(StreamedJsonMembers(chunks, ('time',)).members()) == json.loads(document)['time']
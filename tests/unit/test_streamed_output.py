@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test scan results streamed as JSON."""
+
+import asyncio
+import io
+import json
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+from respx.router import MockRouter
+
+from deltaver._internal.formats import Formats
+from deltaver._internal.running_deltas import RunningDeltas
+from deltaver._internal.scan_context import ScanContext
+from deltaver._internal.stale_releases import StaleReleases
+from deltaver._internal.streamed_output import StreamedOutput
+from deltaver.entry import logic
+
+_Row = tuple[str, str, int]
+_ROWS = (
+    ('smmap', '5.0.0', 30),
+    ('httpx', '0.25.2', -1),
+    ('typer', '0.9.0', 10),
+)
+
+
+async def _rows() -> AsyncIterator[_Row]:
+    for row in _ROWS:
+        yield row
+
+
+def test_ndjson() -> None:  # noqa: WPS210
+    """Test line per row followed by summary."""
+    output = io.StringIO()
+    running = RunningDeltas.ctor(lags=True)
+    streamed = StreamedOutput(output, StaleReleases.ctor(), running, per_row=True)
+    deltas = asyncio.run(streamed.written(_rows()))
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    types = [line['type'] for line in lines]
+
+    assert types == ['package', 'package', 'package', 'summary']
+    assert lines[0] == {
+        'type': 'package',
+        'name': 'smmap',
+        'version': '5.0.0',
+        'delta': 30,
+        'stale': None,
+    }
+    assert lines[-1] == {
+        'type': 'summary',
+        'packages': 3,
+        'unresolved': 1,
+        'sum_delta': 40,
+        'max_delta': 30,
+        'average_delta': 20,
+    }
+    assert deltas.lags() == {'smmap': 30, 'httpx': 0, 'typer': 10}
+
+
+def test_summary() -> None:
+    """Test only summary written, lags of package names not kept."""
+    output = io.StringIO()
+    streamed = StreamedOutput(output, StaleReleases.ctor())
+    deltas = asyncio.run(streamed.written(_rows()))
+
+    assert json.loads(output.getvalue())['max_delta'] == 30
+    assert deltas.lags() == {}
+
+
+def test_logic_streamed(
+    tmp_path: Path,
+    respx_mock: MockRouter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test rows of logic written to output instead of returned."""
+    respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(
+        200,
+        text=Path('tests/fixtures/smmap_pypi_response.json').read_text(),
+    ))
+    monkeypatch.chdir(tmp_path)
+    output = io.StringIO()
+    running = RunningDeltas.ctor()
+    packages, sum_delta, max_delta = logic(
+        'smmap==5.0.0',
+        [],
+        Formats.pip_freeze,
+        context=ScanContext(output=StreamedOutput(output, StaleReleases.ctor(), running, per_row=True)),
+    )
+
+    assert packages == []
+    assert (sum_delta, max_delta) == (running.total(), running.maximum())
+    assert len(output.getvalue().splitlines()) == 2
@@ -4,7 +4,9 @@
 """Unit test of entry."""
 
 import datetime
+import os
 import zipfile
+from collections.abc import Generator
 from pathlib import Path
 
 import httpx
@@ -12,7 +14,9 @@ import pytest
 import respx
 from time_machine import TimeMachineFixture
 
+from deltaver._internal.config import ScanOptions
 from deltaver._internal.formats import Formats
+from deltaver._internal.normalized_name import NormalizedName
 from deltaver._internal.package_lock_reqs import PackageLockReqs
 from deltaver.entry import logic
 
@@ -23,7 +27,7 @@ def _mock_pypi(respx_mock: respx.router.MockRouter, tmp_path: Path) -> None:
         zip_ref.extractall(tmp_path)
     for line in Path('tests/fixtures/requirements.txt').read_text().strip().splitlines():
         package_name = line.split('==')[0]
-        respx_mock.get('https://pypi.org/pypi/{0}/json'.format(package_name)).mock(
+        respx_mock.get('https://pypi.org/pypi/{0}/json'.format(NormalizedName('pypi', package_name))).mock(
             return_value=httpx.Response(
                 200,
                 text=Path(tmp_path / 'fixtures/{0}_pypi_response.json'.format(package_name)).read_text(),
@@ -243,3 +247,37 @@ def test_package_lock(time_machine: TimeMachineFixture) -> None:  # noqa: WPS210
     ]
     assert sum_delta == 151154
     assert max_delta == 3201
+
+
+@pytest.fixture
+def _mock_small_pypi(respx_mock: respx.router.MockRouter, tmp_path: Path) -> Generator[None, None, None]:
+    for package_name, fixture in (('httpx', 'httpx_pypi_response'), ('smmap', 'smmap_pypi_response')):
+        respx_mock.get('https://pypi.org/pypi/{0}/json'.format(package_name)).mock(return_value=httpx.Response(
+            200,
+            text=Path('tests/fixtures/{0}.json'.format(fixture)).read_text(),
+        ))
+    origin_dir = Path.cwd()
+    os.chdir(tmp_path)
+    yield
+    os.chdir(origin_dir)
+
+
+@pytest.mark.usefixtures('_mock_small_pypi')
+def test_concurrent(time_machine: TimeMachineFixture) -> None:
+    """Test result of concurrent scan keep order of sequential scan."""
+    time_machine.move_to(datetime.datetime(2024, 1, 27, tzinfo=datetime.timezone.utc))
+    packages, sum_delta, max_delta = logic(
+        '\n'.join(['smmap==5.0.1', 'httpx==0.25.1', 'smmap==5.0.0', 'httpx==0.25.2']),
+        [],
+        Formats.pip_freeze,
+        ScanOptions({'concurrency': {'pypi.org': 4}}),
+    )
+
+    assert packages == [
+        ('smmap', '5.0.0', 132),
+        ('httpx', '0.25.1', 64),
+        ('smmap', '5.0.1', 0),
+        ('httpx', '0.25.2', 0),
+    ]
+    assert sum_delta == 196
+    assert max_delta == 132
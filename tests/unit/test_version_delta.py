@@ -4,8 +4,9 @@
 """Test version delta."""
 
 import datetime
+import json
 import os
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 from pathlib import Path
 from shutil import copyfile
 
@@ -17,9 +18,17 @@ from time_machine import TimeMachineFixture
 
 from deltaver._internal.cached_sorted_versions import CachedSortedVersions
 from deltaver._internal.decr_delta import DecrDelta
+from deltaver._internal.filtered_package_list import FilteredPackageList
+from deltaver._internal.fk_package import FkPackage
+from deltaver._internal.fk_sorted_versions import FkSortedVersions
 from deltaver._internal.fk_version_delta import FkVersionDelta
+from deltaver._internal.fk_version_list import FkVersionList
 from deltaver._internal.npmjs_versions_sorted_by_semver import NpmjsVersionsSortedBySemver
+from deltaver._internal.package import Package
 from deltaver._internal.pypi_package_list import PypiPackageList
+from deltaver._internal.pypi_version_delta import PypiVersionDelta
+from deltaver._internal.sorted_package_list import SortedPackageList
+from deltaver._internal.sqlite_cache import SqliteCache
 
 
 @pytest.fixture
@@ -114,41 +123,173 @@ def exist_cache(tmp_path: Path, time_machine: TimeMachineFixture, _mock_pypi: No
     os.chdir(origin_dir)
 
 
+@pytest.fixture
+def legacy_cache(other_dir: Path, time_machine: TimeMachineFixture) -> Path:
+    """Create cache file in daily json format."""
+    time_machine.move_to(datetime.datetime(2024, 2, 5, tzinfo=datetime.timezone.utc))
+    httpx_cache_dir = other_dir / '.deltaver_cache/httpx'
+    httpx_cache_dir.mkdir(exist_ok=True, parents=True)
+    (httpx_cache_dir / '2024-02-05.json').write_text(json.dumps([
+        {'0.25.1': '2023-11-03T00:00:00'},
+        {'0.25.2': '2023-11-24T00:00:00'},
+    ]))
+    return other_dir
+
+
+def _releases(packages: Sequence[Package]) -> list[tuple[str, datetime.date]]:
+    return [(str(package.version()), package.release_date()) for package in packages]
+
+
+def _fail(request: httpx.Request) -> None:
+    raise AssertionError
+
+
+def _cached_httpx(cache: SqliteCache, name: str = 'httpx') -> CachedSortedVersions:
+    return CachedSortedVersions(PypiPackageList('httpx', httpx.Client()), cache, 'pypi', 'https://pypi.org', name)
+
+
 @pytest.mark.usefixtures('_mock_pypi')
 def test_cached_version_delta(other_dir: Path, time_machine: TimeMachineFixture, respx_mock: MockRouter) -> None:
     """Test cached version delta."""
     time_machine.move_to(datetime.datetime(2024, 2, 5, tzinfo=datetime.timezone.utc))
-    http_fetched_value = CachedSortedVersions(PypiPackageList('httpx'), 'httpx').as_list()
-    def se(request: httpx.Request) -> None:
-        raise AssertionError
-    respx_mock.get('https://pypi.org/pypi/httpx/json').mock(side_effect=se)
-    got = CachedSortedVersions(PypiPackageList('httpx'), 'httpx').as_list()
+    cache = SqliteCache.ctor(Path('.deltaver_cache'), datetime.timedelta(days=1))
+    http_fetched_value = _cached_httpx(cache).as_list()
+    respx_mock.get('https://pypi.org/pypi/httpx/json').mock(side_effect=_fail)
+    got = _cached_httpx(cache, 'HTTPX').as_list()
+    cache.close()
+
+    assert other_dir / '.deltaver_cache/deltaver.sqlite3' in other_dir.glob('**/*')
+    assert not list(other_dir.glob('**/*.json'))
+    assert _releases(got) == _releases(http_fetched_value)
 
-    assert len(list(other_dir.glob('**/*'))) == 3
-    assert other_dir / '.deltaver_cache/httpx/2024-02-05.json' in other_dir.glob('**/*')
-    assert got == http_fetched_value
+
+@pytest.mark.usefixtures('_mock_pypi')
+def test_same_as_decorators_chain(other_dir: Path) -> None:
+    """Test fused stage gives same list as sorted and filtered lists."""
+    cache = SqliteCache.ctor(Path('.deltaver_cache'), datetime.timedelta(days=1))
+    fetched = _cached_httpx(cache).as_list()
+    cached = _cached_httpx(cache).as_list()
+    cache.close()
+    expected = _releases(SortedPackageList(FilteredPackageList(PypiPackageList('httpx', httpx.Client()))).as_list())
+
+    assert _releases(fetched) == expected
+    assert _releases(cached) == expected
+
+
+@pytest.mark.usefixtures('_mock_pypi')
+def test_cache_ttl(other_dir: Path, time_machine: TimeMachineFixture, respx_mock: MockRouter) -> None:
+    """Test expired cache entry fetched again."""
+    time_machine.move_to(datetime.datetime(2024, 2, 5, tzinfo=datetime.timezone.utc))
+    cache = SqliteCache.ctor(Path('.deltaver_cache'), datetime.timedelta(hours=1))
+    _cached_httpx(cache).as_list()
+    time_machine.shift(datetime.timedelta(minutes=30))
+    _cached_httpx(cache).as_list()
+    time_machine.shift(datetime.timedelta(hours=1))
+    _cached_httpx(cache).as_list()
+    cache.close()
+
+    assert respx_mock.calls.call_count == 2
+
+
+def test_cached_registry_versions(tmp_path: Path) -> None:
+    """Test versions cached as published by registry, not normalized by PEP 440."""
+    cache = SqliteCache.ctor(tmp_path, datetime.timedelta(days=1))
+    CachedSortedVersions(
+        FkVersionList([
+            FkPackage('github.com/pkg/errors', 'v0.9.1', datetime.date(2020, 1, 14), 'golang'),
+            FkPackage('github.com/pkg/errors', 'v0.8.1', datetime.date(2019, 1, 3), 'golang'),
+        ]),
+        cache,
+        'golang',
+        'https://proxy.golang.org',
+        'github.com/pkg/errors',
+    ).as_list()
+    cached = cache.releases('golang', 'https://proxy.golang.org', 'github.com/pkg/errors')
+    cache.close()
+
+    assert cached == [
+        ('v0.8.1', datetime.date(2019, 1, 3)),
+        ('v0.9.1', datetime.date(2020, 1, 14)),
+    ]
+
+
+@pytest.mark.usefixtures('_mock_pypi')
+def test_revalidate(other_dir: Path, respx_mock: MockRouter) -> None:
+    """Test not expired cache entry requested again with revalidate flag."""
+    cache = SqliteCache.ctor(Path('.deltaver_cache'), datetime.timedelta(days=1))
+    _cached_httpx(cache).as_list()
+    CachedSortedVersions(
+        PypiPackageList('httpx', httpx.Client()),
+        cache,
+        'pypi',
+        'https://pypi.org',
+        'httpx',
+        revalidate=True,
+    ).as_list()
+    cache.close()
+
+    assert respx_mock.calls.call_count == 2
+
+
+def test_migrate_daily_json(legacy_cache: Path, respx_mock: MockRouter) -> None:
+    """Test cache file in daily json format migrated."""
+    respx_mock.get('https://pypi.org/pypi/httpx/json').mock(side_effect=_fail)
+    cache = SqliteCache.ctor(Path('.deltaver_cache'), datetime.timedelta(days=1))
+    got = _cached_httpx(cache).as_list()
+    cache.close()
+
+    assert _releases(got) == [
+        ('0.25.1', datetime.date(2023, 11, 3)),
+        ('0.25.2', datetime.date(2023, 11, 24)),
+    ]
+    assert not (legacy_cache / '.deltaver_cache/httpx').exists()
 
 
 def test_remove_old_cache(exist_cache: Path, time_machine: TimeMachineFixture, respx_mock: MockRouter) -> None:
     """Test remove old cache."""
     time_machine.move_to(datetime.datetime(2024, 2, 6, tzinfo=datetime.timezone.utc))
-    CachedSortedVersions(PypiPackageList('httpx'), 'httpx').as_list()
-    def se(request: httpx.Request) -> None:
-        raise AssertionError
-    respx_mock.get('https://pypi.org/pypi/httpx/json').mock(side_effect=se)
-    CachedSortedVersions(PypiPackageList('httpx'), 'httpx').as_list()
+    cache = SqliteCache.ctor(Path('.deltaver_cache'), datetime.timedelta(days=1))
+    _cached_httpx(cache).as_list()
+    respx_mock.get('https://pypi.org/pypi/httpx/json').mock(side_effect=_fail)
+    _cached_httpx(cache).as_list()
+    cache.close()
 
-    assert len(list(exist_cache.glob('**/*'))) == 3
-    assert exist_cache / '.deltaver_cache/httpx/2024-02-05.json' not in exist_cache.glob('**/*')
-    assert exist_cache / '.deltaver_cache/httpx/2024-02-06.json' in exist_cache.glob('**/*')
+    assert not list(exist_cache.glob('**/*.json'))
+    assert not (exist_cache / '.deltaver_cache/httpx').exists()
+
+
+def test_remove_old_scoped_cache(other_dir: Path, time_machine: TimeMachineFixture) -> None:
+    """Test old cache of scoped npm package removed, rate limit state kept."""
+    time_machine.move_to(datetime.datetime(2024, 2, 6, tzinfo=datetime.timezone.utc))
+    scoped_dir = other_dir / '.deltaver_cache/@vue/reactivity'
+    scoped_dir.mkdir(parents=True)
+    (scoped_dir / '2024-02-05.json').write_text('[]')
+    (other_dir / '.deltaver_cache/ratelimit.json').write_text('{}')
+    SqliteCache.ctor(Path('.deltaver_cache'), datetime.timedelta(days=1)).close()
+
+    assert not (other_dir / '.deltaver_cache/@vue').exists()
+    assert (other_dir / '.deltaver_cache/ratelimit.json').exists()
 
 
 @pytest.mark.usefixtures('_mock_vue')
 def test_npm_versions() -> None:
     """Test NpmjsVersionsSortedBySemver."""
-    got = NpmjsVersionsSortedBySemver('https://registry.npmjs.org', 'vue').fetch()
+    got = NpmjsVersionsSortedBySemver('https://registry.npmjs.org', 'vue', httpx.Client()).fetch()
 
     assert len(got) == 278
     assert got[0] == {'0.0.0': datetime.date(2013, 12, 7)}
     assert got[-1] == {'3.4.20': datetime.date(2024, 2, 26)}
     assert got[148] == {'2.6.3': datetime.date(2019, 2, 6)}
+
+
+def test_pypi_latest_with_other_spelling() -> None:
+    """Test version equal to latest by PEP 440 has no delta."""
+    got = PypiVersionDelta(
+        FkSortedVersions([
+            {'0.9': datetime.date(2023, 1, 1)},
+            {'1.0.0': datetime.date(2024, 1, 1)},
+        ]),
+        '1.0',
+    ).days()
+
+    assert got == 0
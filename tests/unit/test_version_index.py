@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test index of package releases."""
+
+import datetime
+
+import pytest
+from packaging.version import Version
+
+from deltaver._internal.package_record import PackageRecord
+from deltaver._internal.version_index import VersionIndex
+from deltaver._internal.version_key import VersionKey
+
+
+@pytest.fixture
+def index() -> VersionIndex:
+    """Index of releases."""
+    return VersionIndex.ctor([
+        PackageRecord.ctor('httpx', version, datetime.date(2023, 1, day))
+        for day, version in enumerate(['0.9.0', '0.10.0', '0.25.2', '0.26.0', '0.27.0'], start=1)
+    ])
+
+
+def test_successor(index: VersionIndex) -> None:
+    """Test successor of released version."""
+    successor = index.successor(VersionKey('pypi', '0.25.2').key())
+
+    assert successor is not None
+    assert successor.version() == Version('0.26.0')
+
+
+@pytest.mark.parametrize('version', ['0.27.0', '0.11.0'])
+def test_no_successor(index: VersionIndex, version: str) -> None:
+    """Test latest and not released versions."""
+    assert index.successor(VersionKey('pypi', version).key()) is None
+
+
+def test_index_reused(index: VersionIndex) -> None:
+    """Test index passed as releases not built again."""
+    assert VersionIndex.of(index) is index
+    assert list(VersionIndex.of(index)) == list(index)
+
+
+def test_origin_order() -> None:
+    """Test successor taken in origin order."""
+    index = VersionIndex.ctor([
+        PackageRecord.ctor('django', '2.0', datetime.date(2018, 1, 1)),
+        PackageRecord.ctor('django', '1.11.9', datetime.date(2018, 1, 2)),
+        PackageRecord.ctor('django', '2.0.1', datetime.date(2018, 1, 3)),
+    ])
+    successor = index.successor(VersionKey('pypi', '2.0').key())
+
+    assert successor is not None
+    assert successor.version() == Version('1.11.9')
+
+
+def test_semver_prerelease() -> None:
+    """Test pre-release ordered before release by semver precedence."""
+    index = VersionIndex.ctor([
+        PackageRecord.ctor('react', version, datetime.date(2024, 1, day), 'npm')
+        for day, version in enumerate(['19.0.0-beta.2', '19.0.0-beta.11', '19.0.0-rc.1', '19.0.0'], start=1)
+    ])
+    successor = index.successor(VersionKey('npm', '19.0.0-beta.2').key())
+
+    assert successor is not None
+    assert successor.release_date() == datetime.date(2024, 1, 2)
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test comparison key of version by ecosystem rules."""
+
+import random
+
+import pytest
+
+from deltaver._internal.exceptions import InvalidVersionError
+from deltaver._internal.stable_key import StableKey
+from deltaver._internal.version_key import VersionKey
+
+
+@pytest.mark.parametrize(('ecosystem', 'versions'), [
+    ('npm', [
+        '1.0.0-alpha',
+        '1.0.0-alpha.1',
+        '1.0.0-alpha.beta',
+        '1.0.0-beta',
+        '1.0.0-beta.2',
+        '1.0.0-beta.11',
+        '1.0.0-rc.1',
+        '1.0.0',
+        '1.0.1',
+        '1.10.0',
+    ]),
+    ('hex', ['0.9.0', '1.0.0-rc.0', '1.0.0', '1.2.0']),
+    ('golang', [
+        'v1.9.0',
+        'v2.0.0-pre.1',
+        'v2.0.0-pre.1.0.20231201120000-abcdef123456',
+        'v2.0.0-pre.2',
+        'v2.0.0',
+        'v2.0.1-0.20240101120000-abcdef123456',
+        'v2.0.1',
+    ]),
+    ('pypi', ['1.0.dev0', '1.0a1', '1.0', '1.0.post1', '1.1']),
+])
+def test_precedence(ecosystem: str, versions: list[str]) -> None:
+    """Test versions ordered by ecosystem rules."""
+    shuffled = random.sample(versions, len(versions))
+    got = sorted(shuffled, key=lambda version: VersionKey(ecosystem, version).key())
+
+    assert got == versions
+
+
+@pytest.mark.parametrize(('ecosystem', 'first', 'second'), [
+    ('npm', '1.0.0+build.1', '1.0.0+build.2'),
+    ('golang', 'v2.0.0+incompatible', 'v2.0.0'),
+    ('golang', 'v1.2.3', '1.2.3'),
+    ('pypi', 'v1.0', '1.0.0'),
+])
+def test_equal(ecosystem: str, first: str, second: str) -> None:
+    """Test build metadata and prefix ignored."""
+    assert VersionKey(ecosystem, first).key() == VersionKey(ecosystem, second).key()
+
+
+@pytest.mark.parametrize(('ecosystem', 'version', 'expected'), [
+    ('npm', '1.0.0-rc.1', False),
+    ('npm', '1.0.0+build.1', True),
+    ('golang', 'v2.0.0+incompatible', True),
+    ('golang', 'v2.0.1-0.20240101120000-abcdef123456', False),
+    ('pypi', '1.0', True),
+    ('pypi', '1.0.post1', False),
+])
+def test_stable(ecosystem: str, version: str, expected: bool) -> None:  # noqa: FBT001
+    """Test stable release key."""
+    assert StableKey(VersionKey(ecosystem, version).key()).stable() is expected
+
+
+@pytest.mark.parametrize(('ecosystem', 'version'), [
+    ('npm', '1.0'),
+    ('hex', '1.0.0-'),
+    ('golang', 'latest'),
+    ('pypi', 'not-a-version'),
+])
+def test_invalid(ecosystem: str, version: str) -> None:
+    """Test invalid version."""
+    assert not VersionKey(ecosystem, version).valid()
+    with pytest.raises(InvalidVersionError):
+        VersionKey(ecosystem, version).key()
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test in-process memo of version lists."""
+
+import datetime
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+from respx.router import MockRouter
+
+from deltaver._internal.cached_package_list import CachedPackageList
+from deltaver._internal.fk_package import FkPackage
+from deltaver._internal.package import Package
+from deltaver._internal.pypi_package_list import PypiPackageList
+from deltaver._internal.scan_context import ScanContext
+from deltaver._internal.versions_memo import VersionsMemo
+
+
+def test_shared_between_lists(respx_mock: MockRouter) -> None:
+    """Test lists of same package share memo."""
+    route = respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(
+        200,
+        text=Path('tests/fixtures/smmap_pypi_response.json').read_text(),
+    ))
+    memo = VersionsMemo.ctor()
+    client = httpx.Client()
+
+    first = CachedPackageList(PypiPackageList('smmap', client), memo, 'pypi', 'https://pypi.org', 'smmap').as_list()
+    second = CachedPackageList(PypiPackageList('smmap', client), memo, 'pypi', 'https://pypi.org', 'SMMAP').as_list()
+
+    assert first is second
+    assert route.call_count == 1
+    assert (memo.hits(), memo.misses()) == (1, 1)
+
+
+def test_evict_least_recently_used() -> None:
+    """Test least recently used entry evicted."""
+    memo = VersionsMemo.ctor(max_entries=2)
+    packages = [FkPackage('a', '1.0', datetime.date(2024, 1, 1))]
+    memo.save('npm', 'https://registry.npmjs.org', 'a', packages)
+    memo.save('npm', 'https://registry.npmjs.org', 'b', packages)
+    memo.packages('npm', 'https://registry.npmjs.org', 'a')
+    memo.save('npm', 'https://registry.npmjs.org', 'c', packages)
+
+    assert memo.packages('npm', 'https://registry.npmjs.org', 'a') == packages
+    assert memo.packages('npm', 'https://registry.npmjs.org', 'b') is None
+
+
+def test_evict_by_size() -> None:
+    """Test entries evicted when size limit exceeded."""
+    memo = VersionsMemo.ctor(max_bytes=1)
+    memo.save('hex', 'https://hex.pm', 'jason', [FkPackage('jason', '1.0.0', datetime.date(2024, 1, 1))])
+
+    assert memo.packages('hex', 'https://hex.pm', 'jason') is None
+
+
+def test_single_flight() -> None:  # noqa: WPS210
+    """Test concurrent lookups of one package loaded once."""
+    memo = VersionsMemo.ctor()
+    loads = []
+    started = threading.Event()
+
+    def load() -> Sequence[Package]:  # noqa: WPS430
+        loads.append(1)
+        started.wait(timeout=5)
+        return [FkPackage('django', '5.0', datetime.date(2024, 1, 1))]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(memo.loaded, 'pypi', 'https://pypi.org', name, load)
+            for name in ('Django', 'django', 'DJANGO', 'django')
+        ]
+        started.set()
+        got = {id(future.result()) for future in futures}
+
+    assert len(loads) == 1
+    assert len(got) == 1
+
+
+def test_expired_entry() -> None:
+    """Test entry older than ttl loaded again."""
+    memo = VersionsMemo.ctor(ttl=0)
+    packages = [FkPackage('jason', '1.0.0', datetime.date(2024, 1, 1))]
+    memo.save('hex', 'https://hex.pm', 'jason', packages)
+
+    assert memo.packages('hex', 'https://hex.pm', 'jason') is None
+
+
+def test_shared_by_contexts() -> None:
+    """Test scans of contexts without memo share one memo."""
+    assert ScanContext().memo() is ScanContext().memo()
@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+# SPDX-License-Identifier: MIT
+
+"""Test scan job shared by workers through queue database."""
+
+import datetime
+from contextlib import closing
+from pathlib import Path
+
+import httpx
+import pytest
+import typer
+from respx.router import MockRouter
+from time_machine import TimeMachineFixture
+
+from deltaver._internal.config import ScanOptions
+from deltaver._internal.formats import Formats
+from deltaver._internal.queue_worker import QueueWorker
+from deltaver._internal.work_queue import WorkQueue
+from deltaver.distributed import aggregate
+
+
+def test_published_once(tmp_path: Path) -> None:
+    """Test lookup of same package in many lockfiles published once."""
+    with closing(WorkQueue.ctor(tmp_path / 'queue.db')) as queue:
+        queue.publish([
+            ('api', Path('api/requirements.txt'), Formats.pip_freeze, [
+                ('smmap', '5.0.0'),
+                ('httpx', '0.25.2'),
+            ]),
+            ('cli', Path('cli/poetry.lock'), Formats.poetry_lock, [('SMMAP', '5.0.0')]),
+        ])
+
+        assert queue.pending() == 2
+
+
+_LOCKFILE = ('api', Path('requirements.txt'), Formats.pip_freeze, [('smmap', '5.0.0')])
+
+
+def test_lease_expired(tmp_path: Path, time_machine: TimeMachineFixture) -> None:
+    """Test lookups of crashed worker leased again after lease expiration."""
+    time_machine.move_to(datetime.datetime(2024, 1, 27, tzinfo=datetime.timezone.utc))
+    with closing(WorkQueue.ctor(tmp_path / 'queue.db')) as queue:
+        queue.publish([_LOCKFILE])
+        crashed = queue.lease('crashed', 10, 300)
+
+        assert queue.lease('other', 10, 300) == []
+
+        time_machine.shift(301)
+
+        leased = queue.lease('other', 10, 300)
+
+        assert leased == crashed
+
+
+def test_attempts_exhausted(tmp_path: Path) -> None:  # noqa: WPS210
+    """Test lookup failed on every attempt reported unresolved."""
+    with closing(WorkQueue.ctor(tmp_path / 'queue.db', max_attempts=2)) as queue:
+        queue.publish([_LOCKFILE])
+        for _ in range(2):
+            leased = queue.lease('worker', 10, 0)
+            queue.release([lookup[0] for lookup in leased])
+        repo, path, rows = queue.lockfiles()[0]
+
+        assert queue.pending() == 0
+        assert (repo, path) == _LOCKFILE[:2]
+        assert rows == [('smmap', '5.0.0', -1)]
+
+
+def test_worker(  # noqa: WPS210
+    tmp_path: Path,
+    respx_mock: MockRouter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test worker resolves lookups of all lockfiles."""
+    smmap_route = respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(
+        200,
+        text=Path('tests/fixtures/smmap_pypi_response.json').read_text(),
+    ))
+    monkeypatch.chdir(tmp_path)
+    with closing(WorkQueue.ctor(tmp_path / 'queue.db')) as queue, httpx.Client() as client:
+        queue.publish([
+            ('api', Path('api/requirements.txt'), Formats.pip_freeze, [('smmap', '5.0.0')]),
+            ('cli', Path('cli/requirements.txt'), Formats.pip_freeze, [('Smmap', '5.0.0')]),
+        ])
+        resolved = QueueWorker(queue, 'worker', client, ScanOptions()).run()
+        lockfiles = queue.lockfiles()
+
+    assert resolved == 1
+    assert smmap_route.call_count == 1
+    api_rows, cli_rows = (rows for _, _, rows in lockfiles)
+    assert api_rows[0][2] > -1
+    assert cli_rows == [('Smmap', '5.0.0', api_rows[0][2])]
+
+
+def test_worker_failed_lookup(  # noqa: WPS210
+    tmp_path: Path,
+    respx_mock: MockRouter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test failed lookup retried until attempts exhausted, other lookups saved."""
+    respx_mock.get('https://pypi.org/pypi/smmap/json').mock(return_value=httpx.Response(
+        200,
+        text=Path('tests/fixtures/smmap_pypi_response.json').read_text(),
+    ))
+    broken_route = respx_mock.get('https://pypi.org/pypi/httpx/json').mock(
+        return_value=httpx.Response(200, text='not json'),
+    )
+    monkeypatch.chdir(tmp_path)
+    with closing(WorkQueue.ctor(tmp_path / 'queue.db')) as queue, httpx.Client() as client:
+        queue.publish([
+            ('api', Path('requirements.txt'), Formats.pip_freeze, [('smmap', '5.0.0'), ('httpx', '0.25.2')]),
+        ])
+        resolved = QueueWorker(queue, 'worker', client, ScanOptions()).run()
+        rows = queue.lockfiles()[0][2]
+    deltas = {name: delta for name, _, delta in rows}
+
+    assert resolved == 1
+    assert broken_route.call_count == 3
+    assert deltas['httpx'] == -1
+    assert deltas['smmap'] > -1
+
+
+def test_aggregate_per_repo(  # noqa: WPS210
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test thresholds checked on distinct dependencies of every repository."""
+    monkeypatch.chdir(tmp_path)
+    Path('pyproject.toml').write_text('[tool.deltaver]\nfail_on_avg = 20\n')
+    with closing(WorkQueue.ctor(tmp_path / 'queue.db')) as queue:
+        queue.publish([
+            ('api', Path('api/requirements.txt'), Formats.pip_freeze, [('smmap', '5.0.0')]),
+            ('api', Path('api/dev.txt'), Formats.pip_freeze, [('httpx', '0.25.2')]),
+            ('cli', Path('cli/requirements.txt'), Formats.pip_freeze, [('typer', '0.9.0')]),
+        ])
+        leased = queue.lease('worker', 3, 60)
+        queue.complete([
+            (lookup_id, 30 if name == 'typer' else 0)
+            for lookup_id, _, name, _ in leased
+        ])
+
+    with pytest.raises(typer.Exit):
+        aggregate(tmp_path / 'queue.db')
+
+    assert 'average delta greater than available in cli\n' in capsys.readouterr().out